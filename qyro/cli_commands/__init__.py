@@ -16,6 +16,7 @@ from rich.console import Console
 from rich.prompt import Prompt, Confirm
 from rich.panel import Panel
 from rich.table import Table
+from qyro import path
 from qyro._store import QYRO_INTERNAL_STATE
 from .templates.component import COMPONENT_TEMPLATE
 from qyro.cli_engine import CLI
@@ -23,8 +24,12 @@ from qyro.utils import EngineMessage, EngineError, module_exists
 from qyro.utils.fs import QYRO_METADATA, replicate_and_filter, write_safely_from_template, check_existing_project
 from qyro.utils.parsers import to_camel_case
 from qyro.utils.project_reader import get_project_settings, _find_and_store_settings, _validate_project_structure
-from qyro.utils.helpers import valid_version
-from qyro.pipelines import get_freezer
+from qyro.utils.helpers import valid_version, format_size, parse_size
+from qyro.utils.cache import (
+    CACHE_DIRS, cache_entries, select_evictions, make_tombstone, stale_tombstones, delete_in_background, retire
+)
+from qyro.utils.delta import create_delta_package
+from qyro.pipelines import get_freezer, get_installer, get_freezer_backend
 from typing import NoReturn
 
 console = Console()
@@ -266,7 +271,7 @@ def build(profile: str | bool = None, bundle: bool = False):
             - If a boolean, True indicates a production build and False a development build.
 
     Raises:
-        EngineError: If PyInstaller is not installed.
+        EngineError: If the configured freezer (PyInstaller by default) is not installed.
         EngineError: If the project version does not follow the MAJOR.MINOR.PATCH format.
         EngineError: If the function cannot detect the appropriate build pipeline for the current OS.
 
@@ -274,7 +279,7 @@ def build(profile: str | bool = None, bundle: bool = False):
         1. Checks that the current directory is a valid project.
         2. Determines the build profile (production or development).
         3. Loads the project configuration.
-        4. Validates that PyInstaller is installed.
+        4. Validates that the configured freezer is installed.
         5. Validates that the project version string is correctly formatted.
         6. Detects the current platform and selects the correct build pipeline function.
         7. Prints an informative message about the platform and pipeline being used.
@@ -294,10 +299,7 @@ def build(profile: str | bool = None, bundle: bool = False):
 
     _app = QYRO_INTERNAL_STATE.get_config("settings")
 
-    if not module_exists('PyInstaller'):
-        raise EngineError(
-            "The 'PyInstaller' module is required for building the project."
-        )
+    get_freezer_backend().check()
 
     if not valid_version(_app['version']):
         raise EngineError(
@@ -327,33 +329,242 @@ def freeze(profile: str | bool = None, bundle: bool = False) -> NoReturn:
     """
     build(profile=profile, bundle=bundle)
 
+@CLI(help="Create an installer for the frozen app.")
+def installer():
+    """
+    Creates a platform-specific installer from the frozen app in target/.
+    """
+    check_existing_project()
+    os_key, module_name, func_name = get_installer()
+
+    EngineMessage.show(
+        f"Platform detected: [bold green]{to_camel_case(os_key)}[/bold green].\nRunning pipeline '{func_name}' from module '{module_name}'.",
+        level="info"
+    )
+
+    module = importlib.import_module(module_name)
+    getattr(module, func_name)()
+
 @CLI(help="Cleans the 'target' directory.")
-def clean():
+def clean(keep_cache: bool = False, max_cache_size: str = None):
     """
     Deletes the 'target' directory and 'build.log' file safely.
 
+    'target' is renamed to a tombstone directory and deleted by a background
+    process, so the command returns immediately.
+
     - Ignores missing files/directories.
-    - If 'target' cannot be removed, cleans its contents individually.
+    - If 'target' cannot be renamed, cleans its contents individually.
+
+    Args:
+        keep_cache (bool): Keeps the cached build artifacts (PyInstaller analysis
+                           data and target/.cache).
+        max_cache_size (str, optional): Keeps the cache but evicts the least recently
+                                        used entries until it fits, e.g. '500MB'.
+                                        Implies --keep-cache.
     """
     target = Path('target')
     log_file = Path('build.log')
+    project_dir = getcwd()
 
     try:
-        if target.exists():
-            rmtree(target)
-            print(f"Deleted directory: {target}")
-    except OSError:
-        for item in target.glob('*'):
-            try:
-                if item.is_dir():
-                    rmtree(item)
-                else:
-                    item.unlink()
-            except Exception as e:
-                print(f"Failed to delete {item}: {e}")
+        budget = parse_size(max_cache_size) if max_cache_size is not None else None
+    except ValueError as e:
+        raise EngineError(str(e))
+
+    trash = stale_tombstones(project_dir)
+    if target.exists():
+        try:
+            tombstone = make_tombstone(project_dir)
+            trash.append(tombstone)
+            retired = retire(str(target), tombstone)
+        except OSError:
+            _clean_in_place(target)
+        else:
+            if keep_cache or budget is not None:
+                print(f"Cleaned directory: {target} (build cache kept)")
+                _restore_cache(retired, str(target), tombstone, budget)
+            else:
+                print(f"Deleted directory: {target}")
+    delete_in_background(trash)
+
     try:
         if log_file.exists():
             log_file.unlink()
             print(f"Deleted file: {log_file}")
     except Exception as e:
-        print(f"Failed to delete {log_file}: {e}")
\ No newline at end of file
+        print(f"Failed to delete {log_file}: {e}")
+
+
+def _clean_in_place(target: Path):
+    for item in target.glob('*'):
+        try:
+            if item.is_dir():
+                rmtree(item)
+            else:
+                item.unlink()
+        except Exception as e:
+            print(f"Failed to delete {item}: {e}")
+
+
+def _restore_cache(retired: str, target: str, tombstone: str, budget: int = None):
+    """
+    Moves the cache directories of a retired target back into place and
+    evicts least recently used entries beyond the budget.
+    """
+    makedirs(target, exist_ok=True)
+    for cache_dir in CACHE_DIRS:
+        if exists(join(retired, cache_dir)):
+            os.rename(join(retired, cache_dir), join(target, cache_dir))
+
+    entries = cache_entries(target)
+    evicted = select_evictions(entries, budget) if budget is not None else []
+    for entry in evicted:
+        retire(entry.path, tombstone)
+
+    kept = sum(e.size for e in entries) - sum(e.size for e in evicted)
+    message = f"Kept {format_size(kept)} of build cache in {target}"
+    if evicted:
+        freed = sum(e.size for e in evicted)
+        message += f", evicted {len(evicted)} least recently used entries ({format_size(freed)})"
+    print(message + ".")
+
+
+@CLI(name='release-diff', help="Create a delta update package between two released builds.")
+def release_diff(old: str, new: str, output: str = None):
+    """
+    Creates a delta package that upgrades an install of OLD to NEW.
+
+    Args:
+        old (str): Directory of the previously released build (e.g. an old target/<app_name>).
+        new (str): Directory of the new build.
+        output (str, optional): Package file to write. Defaults to '<new>.qdelta'.
+    """
+    for directory in (old, new):
+        if not os.path.isdir(directory):
+            raise EngineError(f"Build directory not found: [bold]{directory}[/bold]")
+
+    if output is None:
+        output = os.path.normpath(new) + '.qdelta'
+
+    summary = create_delta_package(old, new, output)
+
+    table = Table(title="Delta Package", show_header=False, box=None)
+    table.add_row("Full files:", f"[cyan]{summary['full']}[/cyan]")
+    table.add_row("Patched files:", f"[cyan]{summary['patch']}[/cyan]")
+    table.add_row("Moved files:", f"[cyan]{summary['copy']}[/cyan]")
+    table.add_row("Unchanged files:", f"[cyan]{summary['unchanged']}[/cyan]")
+    table.add_row("Removed files:", f"[cyan]{summary['removed']}[/cyan]")
+    table.add_row("Package size:", f"[cyan]{format_size(os.path.getsize(output))}[/cyan]")
+    table.add_row("Merkle root:", f"[cyan]{summary['root']}[/cyan]")
+    console.print(table)
+    EngineMessage.show(f"Delta package written to [cyan]{output}[/cyan]", level="success")
+
+
+@CLI(help="Build with each freezer and compare startup time and size.")
+def bench(freezers: str = 'pyinstaller,nuitka', runs: int = 5):
+    """
+    Builds the app with each freezer backend and compares build time, size
+    and startup time. The builds are kept in target/bench/<freezer>.
+
+    Args:
+        freezers (str): Comma-separated freezer backends to compare.
+        runs (int): Launches per build; the first one is reported as the cold start.
+    """
+    from qyro.pipelines.bench import benchmark_freezers
+
+    check_existing_project()
+    if runs < 1:
+        raise EngineError("--runs must be at least 1.")
+
+    results = benchmark_freezers([name.strip() for name in freezers.split(',') if name.strip()], runs)
+    if not results:
+        raise EngineError("No freezer could be benchmarked. Install PyInstaller or Nuitka.")
+
+    table = Table(title="Freezer Benchmark")
+    for column in ("Freezer", "Build time", "Size", "Cold start", "Warm start"):
+        table.add_column(column)
+    for result in results:
+        table.add_row(
+            f"[bold]{result['freezer']}[/bold]",
+            f"{result['build_time']:.1f} s",
+            format_size(result['size']),
+            f"{result['cold_start'] * 1000:.0f} ms",
+            f"{result['warm_start'] * 1000:.0f} ms",
+        )
+    console.print(table)
+
+
+@CLI(name='verify-build', help="Build twice in reproducible mode and compare the outputs.")
+def verify_build(profile: str | bool = None):
+    """
+    Builds the app twice with the 'reproducible' setting enabled and checks
+    that both builds are byte-identical. The builds are kept in
+    target/verify/first and target/verify/second for inspection.
+
+    Args:
+        profile (str | bool, optional): Build profile, as for 'qyro build'.
+    """
+    from qyro_engine.updater.manifest import build_manifest
+    from qyro.utils.reproducible import diff_manifests
+
+    check_existing_project()
+    settings = QYRO_INTERNAL_STATE.get_config('settings')
+    reproducible = settings.get('reproducible', False)
+    settings['reproducible'] = True
+
+    manifests = []
+    try:
+        for run in ('first', 'second'):
+            build(profile=profile)
+            run_dir = path(f'target/verify/{run}')
+            rmtree(run_dir, ignore_errors=True)
+            makedirs(os.path.dirname(run_dir), exist_ok=True)
+            os.rename(path('${freeze_dir}'), run_dir)
+            manifests.append(build_manifest(run_dir))
+    finally:
+        settings['reproducible'] = reproducible
+
+    differences = diff_manifests(*manifests)
+    if differences:
+        for line in differences[:50]:
+            console.print(f"  [red]✗[/red] {line}")
+        if len(differences) > 50:
+            console.print(f"  ... and {len(differences) - 50} more")
+        raise EngineError(f"The builds differ in {len(differences)} files. They are kept in target/verify.")
+
+    EngineMessage.show(
+        f"Both builds are identical ({len(manifests[0]['files'])} files, root {manifests[0]['root'][:16]}).",
+        level="success"
+    )
+
+
+@CLI(help="Build every project of the workspace (qyro-workspace.json) concurrently.")
+def workspace(jobs: int = 0, profile: str = None):
+    """
+    Builds all projects listed in the nearest qyro-workspace.json.
+
+    Args:
+        jobs (int): Concurrent builds. 0 uses the workspace 'jobs' setting,
+                    or half the available cores.
+        profile (str, optional): Build profile passed to each 'qyro build'.
+    """
+    from qyro.pipelines.workspace import find_workspace, build_workspace, WORKSPACE_FILE
+
+    root = find_workspace()
+    if root is None:
+        raise EngineError(f"No [bold]{WORKSPACE_FILE}[/bold] found in this directory or its parents.")
+
+    results = build_workspace(root, jobs=jobs or None, profile=profile)
+
+    table = Table(title="Workspace Build")
+    for column in ("Project", "Status", "Time"):
+        table.add_column(column)
+    for result in sorted(results, key=lambda r: r['name']):
+        status = "[green]ok[/green]" if result['returncode'] == 0 else "[red]failed[/red]"
+        table.add_row(result['name'], status, f"{result['duration']:.1f} s")
+    console.print(table)
+
+    failed = [r['name'] for r in results if r['returncode'] != 0]
+    if failed:
+        raise EngineError(f"{len(failed)} of {len(results)} projects failed to build: {', '.join(failed)}")
@@ -12,7 +12,7 @@ class DynamicCommand:
 
     def __init__(self, func, **kwargs):
         self.func = func
-        self.name = func.__name__
+        self.name = kwargs.get('name', func.__name__)
         self.help = kwargs.get(
             'help', func.__doc__ or f'Executes the {self.name} command')
         self.params = {}
@@ -22,6 +22,7 @@ def CLI(**kwargs) -> Callable[[Callable], Callable]:
     """
     Decorator to register a CLI command dynamically.
     Usage: @CLI(help='Description of the command')
+    Pass name='...' to register the command under a different name than the function.
     """
     def decorator(func: Callable) -> Callable[[argparse.ArgumentParser], None]:
         cmd = DynamicCommand(func, **kwargs)
@@ -66,15 +67,26 @@ def _create_arg_parser() -> argparse.ArgumentParser:
         sig = inspect.signature(cmd.func)
         for param_name, param in sig.parameters.items():
             kwargs = {}
-            if param.default is not inspect.Parameter.empty:
-                kwargs['default'] = param.default
-                kwargs['nargs'] = '?'
-                if isinstance(param.default, bool):
-                    kwargs['action'] = 'store_true' if not param.default else 'store_false'
-                    del kwargs['default']
-                    del kwargs['nargs']
-
-            subparser.add_argument(f'--{param_name}', **kwargs)
+            if param.default is inspect.Parameter.empty:
+                # Parameters without a default are positional arguments
+                subparser.add_argument(param_name)
+                cmd.params[param_name] = param
+                continue
+
+            kwargs['default'] = param.default
+            kwargs['nargs'] = '?'
+            if isinstance(param.default, bool):
+                kwargs['action'] = 'store_true' if not param.default else 'store_false'
+                del kwargs['default']
+                del kwargs['nargs']
+            elif isinstance(param.default, (int, float)):
+                kwargs['type'] = type(param.default)
+
+            # '--keep_cache' is also accepted as '--keep-cache'
+            flags = [f'--{param_name}']
+            if '_' in param_name:
+                flags.append(f"--{param_name.replace('_', '-')}")
+            subparser.add_argument(*flags, dest=param_name, **kwargs)
             cmd.params[param_name] = param
 
     return parser
@@ -1,14 +1,23 @@
 import os
+import sys
+import shutil
+import tempfile
+import compileall
+import importlib
 from pathlib import Path
-import subprocess
 from os.path import join, dirname
 from os import rename, makedirs
 from functools import lru_cache
 from qyro.utils.platform import mac_based, windows_based, linux_based, _get_linux_distribution
-from qyro._exceptions import EngineError
+from qyro._exceptions import EngineError, EngineMessage
 from qyro._store import QYRO_INTERNAL_STATE
 from qyro import path
 from qyro_engine._qyro import extract_public_settings
+from qyro_engine._source import default_path
+from qyro_engine.utils.resource_pack import write_resource_pack, PACK_SUFFIX
+from qyro.utils.fs import plan_copy_and_filter, run_copy_tasks
+from qyro.utils.process import run_streamed, PYINSTALLER_PHASES
+from qyro.utils.reproducible import reproducible_env, sorted_repr
 
 
 FREEZER_MAP = {
@@ -22,6 +31,23 @@ FREEZER_MAP = {
     "linux": ("qyro.pipelines.linux", "build_for_linux"),
 }
 
+INSTALLER_MAP = {
+    "ubuntu": ("qyro.pipelines.ubuntu", "create_installer_ubuntu"),
+    "linuxmint": ("qyro.pipelines.ubuntu", "create_installer_ubuntu"),
+    "Pop!_os": ("qyro.pipelines.ubuntu", "create_installer_ubuntu"),
+    "arch": ("qyro.pipelines.arch", "create_installer_arch"),
+    "fedora": ("qyro.pipelines.fedora", "create_installer_fedora"),
+    "linux": ("qyro.pipelines.linux", "create_installer_linux"),
+}
+
+FREEZER_BACKENDS = {
+    "pyinstaller": ("qyro.pipelines.freezers", "PyInstallerBackend"),
+    "nuitka": ("qyro.pipelines.freezers", "NuitkaBackend"),
+}
+
+# Set by workspace builds to share staged resources between projects
+CONTENT_STORE_ENV = 'QYRO_CONTENT_STORE'
+
 
 @lru_cache(maxsize=1)
 def get_freezer():
@@ -42,8 +68,74 @@ def get_freezer():
         return "linux", *FREEZER_MAP["linux"]
 
     raise EngineError("Unsupported OS")
+
+
+def get_installer():
+    """
+    Returns a tuple (os_key, module_name, func_name) with the installer
+    pipeline for the current platform/distro.
+    """
+    os_key = get_freezer()[0]
+    if os_key not in INSTALLER_MAP:
+        raise EngineError(f"Installers are not supported on {os_key} yet.")
+    return os_key, *INSTALLER_MAP[os_key]
+
+
+def get_freezer_backend(name: str = None):
+    """
+    Returns the freezer backend selected by the 'freezer' setting
+    ('pyinstaller' or 'nuitka'), or by name.
+    """
+    name = name or QYRO_INTERNAL_STATE.get_config('settings').get('freezer', 'pyinstaller')
+    if name not in FREEZER_BACKENDS:
+        raise EngineError(f"Unknown freezer '{name}'. Use one of: {', '.join(FREEZER_BACKENDS)}.")
+    module_name, class_name = FREEZER_BACKENDS[name]
+    return getattr(importlib.import_module(module_name), class_name)()
 from pathlib import PurePath
 
+
+def check_sources_compile(optimize: int = 0, workers: int = 0) -> None:
+    """
+    Checks that every module in src/main/python compiles, so syntax errors are
+    reported before the freezer starts its much slower analysis. The modules
+    are byte-compiled in parallel into a temporary directory that is removed
+    afterwards; the freezers compile the modules they collect themselves.
+
+    Args:
+        optimize (int): 0, 1 (strip asserts) or 2 (also strip docstrings).
+        workers (int): Worker processes; 0 uses every available core.
+
+    Raises:
+        EngineError: If a module fails to compile.
+    """
+    if optimize not in (0, 1, 2):
+        raise EngineError(f"Invalid 'optimize' setting {optimize}. Expected 0, 1 or 2.")
+
+    source_dir = path('src/main/python')
+    # Worker processes read the prefix from the environment when they are spawned
+    previous = sys.pycache_prefix, os.environ.get('PYTHONPYCACHEPREFIX')
+    with tempfile.TemporaryDirectory(prefix='qyro-check-') as pycache_prefix:
+        sys.pycache_prefix = os.environ['PYTHONPYCACHEPREFIX'] = pycache_prefix
+        try:
+            compiled = compileall.compile_dir(source_dir, quiet=1, workers=workers, optimize=optimize)
+        finally:
+            sys.pycache_prefix = previous[0]
+            if previous[1] is None:
+                del os.environ['PYTHONPYCACHEPREFIX']
+            else:
+                os.environ['PYTHONPYCACHEPREFIX'] = previous[1]
+    if not compiled:
+        raise EngineError(f"Some modules in [cyan]{source_dir}[/cyan] failed to compile. See the errors above.")
+
+
+def _optimize_arguments(optimize: int) -> list:
+    """
+    Returns the PyInstaller arguments that set the bytecode optimization level
+    of the collected modules and of the frozen interpreter.
+    """
+    return ['--optimize', str(optimize)] if optimize else []
+
+
 def compile_with_pyinstaller(arguments: list, debug: bool):
     """
     Compiles the application using PyInstaller with the given arguments.
@@ -55,6 +147,10 @@ def compile_with_pyinstaller(arguments: list, debug: bool):
         None
     """
     settings = QYRO_INTERNAL_STATE.get_config('settings')
+    # Debug builds keep their asserts and docstrings
+    optimize = 0 if debug else int(settings.get('optimize', 0))
+    check_sources_compile(optimize, workers=int(settings.get('compile_workers', 0)))
+
     arguments += [
         '--name', settings['app_name'],
         '--noupx',
@@ -65,24 +161,14 @@ def compile_with_pyinstaller(arguments: list, debug: bool):
         '--additional-hooks-dir', join(dirname(__file__), 'hooks'),
         *settings.get('extra_pyinstaller_args', []),
         *(item for hi in settings['hidden_imports'] for item in ['--hidden-import', hi]),
-        '--runtime-hook', create_pyinstaller_runtime_hook()
+        '--runtime-hook', create_pyinstaller_runtime_hook(),
+        *_optimize_arguments(optimize)
     ]
     arguments.append(path(settings['main_module']))
-    log_file_path = Path("build.log")
-    if debug:
-        # Ejecuta y muestra la salida en tiempo real mientras la guarda
-        with log_file_path.open("w", encoding="utf-8") as log_file:
-            process = subprocess.Popen(arguments, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
-            for line in process.stdout:
-                print(line, end="")
-                log_file.write(line)
-            process.wait()
-            if process.returncode != 0:
-                raise subprocess.CalledProcessError(process.returncode, arguments)
-    else:
-
-        result = subprocess.run(arguments, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, check=True)
-        log_file_path.write_text(result.stdout, encoding="utf-8")
+    run_streamed(
+        arguments, Path("build.log"), echo=debug,
+        phases=PYINSTALLER_PHASES, description='Starting PyInstaller', env=reproducible_env()
+    )
 
     output_dir = path(f'target/{settings["app_name"]}' + ('.app' if mac_based() else ''))
     freeze_dir = path('${freeze_dir}')
@@ -115,7 +201,8 @@ def create_pyinstaller_runtime_hook():
 
     # Obtener settings
     settings = QYRO_INTERNAL_STATE.get_config('settings')
-    build_settings_repr = repr(extract_public_settings(settings))
+    # Sorted so the hook is byte-identical for the same settings
+    build_settings_repr = sorted_repr(extract_public_settings(settings))
 
     # Contenido del hook
     hook_content = f"""
@@ -137,8 +224,69 @@ except ImportError as e:
 module.BUILD_SETTINGS = {build_settings_repr}
 """
 
-    # Escribir el hook
-    with open(hook_file_path, 'w', encoding='utf-8') as f:
+    # Escribir el hook, sin tocarlo si no cambió
+    if os.path.exists(hook_file_path):
+        with open(hook_file_path, 'r', encoding='utf-8') as f:
+            if f.read() == hook_content:
+                return hook_file_path
+    with open(hook_file_path, 'w', encoding='utf-8', newline='\n') as f:
         f.write(hook_content)
 
     return hook_file_path
+
+
+def _copy_workers(settings: dict) -> int:
+    workers = int(settings.get('copy_threads', 0))
+    # Same default as ThreadPoolExecutor: copying is I/O bound
+    return workers if workers > 0 else min(32, (os.cpu_count() or 1) + 4)
+
+
+def _generate_resources():
+    """
+    Copy the data files from src/main/resources to freeze_dir.
+    Works both in development and frozen builds.
+    Automatically filters files mentioned in the settings files_to_filter.
+    """
+    # Determinar freeze_dir dinámicamente
+    freeze_dir = Path(sys._MEIPASS) if getattr(sys, 'frozen', False) else path('${freeze_dir}')
+
+    # En macOS, los recursos van a Contents/Resources
+    resources_dest_dir = freeze_dir / 'Contents' / 'Resources' if mac_based() else freeze_dir
+
+    settings = QYRO_INTERNAL_STATE.get_config('settings')
+    pack_resources = settings.get('pack_resources', False)
+    staging_dir = Path(path('target/PyInstaller/resources'))
+    if pack_resources:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+    # Plan every copy first; when sources overlap, later ones win, in the
+    # same order the serial copies used to overwrite each other: the
+    # defaults before the project, and each in profile order.
+    tasks = {}
+    for path_fn in (default_path, path):
+        for profile in QYRO_INTERNAL_STATE._loaded_profiles:
+            for task in (
+                *plan_copy_and_filter(
+                    path_fn,
+                    f'src/main/resources/{profile}',
+                    staging_dir / profile if pack_resources else resources_dest_dir
+                ),
+                *plan_copy_and_filter(path_fn, f'src/compilers/{profile}', freeze_dir),
+            ):
+                tasks[task.destination] = task
+
+    content_store = os.environ.get(CONTENT_STORE_ENV) or settings.get('content_store')
+    if content_store and not os.path.isabs(content_store):
+        content_store = path(content_store)
+    run_copy_tasks(list(tasks.values()), settings, max_workers=_copy_workers(settings), content_store=content_store)
+
+    if pack_resources:
+        # One archive per profile, prefixed with its precedence
+        for order, profile in enumerate(QYRO_INTERNAL_STATE._loaded_profiles):
+            staged_profile = staging_dir / profile
+            if staged_profile.is_dir():
+                write_resource_pack(
+                    staged_profile,
+                    Path(resources_dest_dir) / f'{order:02d}-{profile}{PACK_SUFFIX}',
+                    compress=settings.get('pack_compression', False)
+                )
@@ -0,0 +1,60 @@
+import os
+import re
+import tarfile
+from qyro import path
+from qyro._store import QYRO_INTERNAL_STATE
+from qyro._exceptions import EngineMessage
+from qyro.utils.helpers import format_size
+from qyro.utils.reproducible import build_timestamp
+from qyro.pipelines.linux import (
+    build_for_linux, compressed_stream, write_app_tree, installed_size,
+    machine_architecture, _compression_for, _add_bytes, _check_frozen_app
+)
+
+
+def build_for_arch(debug=False, bundle=False):
+    """
+    Builds the application for Arch Linux.
+    """
+    build_for_linux(debug=debug, bundle=bundle)
+
+
+def _pkginfo(settings: dict, size: int) -> bytes:
+    lines = [
+        f"pkgname = {re.sub(r'[^a-z0-9@._+-]', '-', settings['app_name'].lower())}",
+        f"pkgver = {settings['version']}-1",
+        f"pkgdesc = {settings.get('description') or settings['app_name']}",
+        f"url = {settings.get('url', '')}",
+        f"builddate = {build_timestamp()}",
+        f"packager = {settings.get('author', 'Unknown Packager')}",
+        f"size = {size}",
+        f"arch = {machine_architecture()}",
+        *(f"depend = {dependency}" for dependency in settings.get('depends', [])),
+        *(f"optdepend = {dependency}" for dependency in settings.get('depends_opt', [])),
+    ]
+    return ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+def create_installer_arch():
+    """
+    Creates a pacman package (target/${installer}, .pkg.tar.xz or
+    .pkg.tar.zst), streamed from the frozen app into the compressor.
+    """
+    settings = QYRO_INTERNAL_STATE.get_config('settings')
+    freeze_dir = _check_frozen_app()
+    installer = path(f"target/{settings['installer']}")
+
+    with compressed_stream(
+        installer, _compression_for(installer, settings.get('installer_compression', 'xz')),
+        level=int(settings.get('installer_compression_level', 6)),
+        threads=int(settings.get('installer_threads', 0))
+    ) as stream:
+        with tarfile.open(fileobj=stream, mode='w|', format=tarfile.GNU_FORMAT) as tar:
+            _add_bytes(tar, '.PKGINFO', _pkginfo(settings, installed_size(freeze_dir)))
+            write_app_tree(tar)
+
+    EngineMessage.show(
+        f"Installer created at [cyan]{installer}[/cyan] ({format_size(os.path.getsize(installer))}).",
+        level="success"
+    )
+    return installer
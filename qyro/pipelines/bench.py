@@ -0,0 +1,112 @@
+import os
+import time
+import shutil
+import importlib
+import statistics
+import subprocess
+from os.path import join, exists
+from typing import Any, Dict, List
+from qyro import path
+from qyro._store import QYRO_INTERNAL_STATE
+from qyro._exceptions import EngineError, EngineMessage
+from qyro.utils import module_exists
+from qyro.utils.hashing import iter_tree_files
+from qyro.utils.platform import mac_based, windows_based, linux_based
+from qyro.pipelines import get_freezer, get_freezer_backend
+from qyro_engine.core import BENCH_EXIT_ENV
+
+# Startup runs that do not finish in time are reported as failures
+_STARTUP_TIMEOUT = 120
+
+
+def _tree_size(root: str) -> int:
+    return sum(os.path.getsize(join(root, *rel.split('/'))) for rel in iter_tree_files(root))
+
+
+def _executable(app_dir: str, app_name: str) -> str:
+    if mac_based():
+        return join(app_dir, 'Contents', 'MacOS', app_name)
+    return join(app_dir, app_name + ('.exe' if windows_based() else ''))
+
+
+def measure_startup(executable: str, runs: int = 5) -> List[float]:
+    """
+    Starts the app several times and measures how long it takes until its
+    event loop is running. The app quits by itself at that point.
+
+    Args:
+        executable (str): The frozen executable.
+        runs (int): Number of launches.
+
+    Returns:
+        list[float]: Seconds per launch, the first being the cold start.
+    """
+    env = dict(os.environ, **{BENCH_EXIT_ENV: '1'})
+    if linux_based() and not (env.get('DISPLAY') or env.get('WAYLAND_DISPLAY')):
+        env['QT_QPA_PLATFORM'] = 'offscreen'
+
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [executable], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            timeout=_STARTUP_TIMEOUT
+        )
+        timings.append(time.perf_counter() - start)
+        if result.returncode != 0:
+            raise EngineError(f"{executable} exited with code {result.returncode} while benchmarking.")
+    return timings
+
+
+def benchmark_freezers(names: List[str], runs: int = 5) -> List[Dict[str, Any]]:
+    """
+    Builds the app with each freezer backend and measures build time, size
+    and startup time. Each build is kept in target/bench/<freezer>.
+
+    Args:
+        names (list[str]): Freezer backends, e.g. ['pyinstaller', 'nuitka'].
+        runs (int): Launches per build for the startup measurement.
+
+    Returns:
+        list[dict]: One result per freezer that could be built.
+    """
+    settings = QYRO_INTERNAL_STATE.get_config('settings')
+    app_name = settings['app_name']
+    _, module_name, func_name = get_freezer()
+    pipeline = getattr(importlib.import_module(module_name), func_name)
+
+    results = []
+    for name in names:
+        backend = get_freezer_backend(name)
+        if not module_exists(backend.module):
+            EngineMessage.show(f"Skipping {name}: the '{backend.module}' module is not installed.", level="warning")
+            continue
+
+        EngineMessage.show(f"Building with [bold]{name}[/bold]...", level="info")
+        # Each build sees its own copy, so the project settings stay untouched
+        QYRO_INTERNAL_STATE.set_config('settings', dict(settings, freezer=name))
+        try:
+            start = time.perf_counter()
+            pipeline(debug=False, bundle=False)
+            build_time = time.perf_counter() - start
+        finally:
+            QYRO_INTERNAL_STATE.set_config('settings', settings)
+
+        bench_dir = path(f'target/bench/{name}')
+        shutil.rmtree(bench_dir, ignore_errors=True)
+        os.makedirs(os.path.dirname(bench_dir), exist_ok=True)
+        os.rename(path('${freeze_dir}'), bench_dir)
+
+        executable = _executable(bench_dir, app_name)
+        if not exists(executable):
+            raise EngineError(f"The {name} build did not produce {executable}.")
+        timings = measure_startup(executable, runs)
+        results.append({
+            'freezer': name,
+            'build_time': build_time,
+            'size': _tree_size(bench_dir),
+            'cold_start': timings[0],
+            'warm_start': statistics.median(timings[1:] or timings),
+            'path': bench_dir,
+        })
+    return results
@@ -0,0 +1,224 @@
+import os
+import shutil
+import zipfile
+from os import makedirs
+from os.path import join
+from string import Template
+from qyro import path
+from qyro._store import QYRO_INTERNAL_STATE
+from qyro._exceptions import EngineMessage
+from qyro.utils.hashing import tree_digest, iter_tree_files
+from qyro.utils.platform import windows_based
+from qyro.utils.process import run_streamed, PYINSTALLER_PHASES
+from qyro.utils.reproducible import reproducible_env
+
+# Cookie that the PyInstaller bootloader looks for when it searches its own
+# executable for the embedded archive. The appended payload must not contain it.
+_PYINSTALLER_COOKIE_MAGIC = b'MEI\014\013\012\013\016'
+
+LAUNCHER_TEMPLATE = """
+import os
+import sys
+import time
+import shutil
+import zipfile
+import subprocess
+
+APP_NAME = $app_name
+BUILD_ID = $build_id
+EXECUTABLE = $executable
+EXECUTABLE_SIZE = $executable_size
+KEEP_VERSIONS = $keep_versions
+MARKER = '.qyro-bundle'
+
+
+def _cache_root():
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~\\\\AppData\\\\Local')
+    elif sys.platform == 'darwin':
+        base = os.path.expanduser('~/Library/Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base, APP_NAME, 'bundle')
+
+
+def _is_valid(target):
+    try:
+        with open(os.path.join(target, MARKER), encoding='utf-8') as f:
+            if f.read().strip() != BUILD_ID:
+                return False
+        return os.path.getsize(os.path.join(target, EXECUTABLE)) == EXECUTABLE_SIZE
+    except OSError:
+        return False
+
+
+def _extract(target):
+    staging = '%s.%d.tmp' % (target, os.getpid())
+    shutil.rmtree(staging, ignore_errors=True)
+    with zipfile.ZipFile(sys.executable) as archive:
+        for info in archive.infolist():
+            extracted = archive.extract(info, staging)
+            mode = info.external_attr >> 16
+            if mode and os.name != 'nt':
+                os.chmod(extracted, mode)
+    with open(os.path.join(staging, MARKER), 'w', encoding='utf-8') as f:
+        f.write(BUILD_ID)
+    try:
+        os.rename(staging, target)
+    except OSError:
+        # Either another launcher finished first or a broken copy is in the way.
+        if not _is_valid(target):
+            shutil.rmtree(target, ignore_errors=True)
+            os.rename(staging, target)
+        else:
+            shutil.rmtree(staging, ignore_errors=True)
+
+
+def _collect_garbage(root):
+    versions = []
+    for name in os.listdir(root):
+        full_path = os.path.join(root, name)
+        if name == BUILD_ID:
+            continue
+        if name.endswith('.tmp'):
+            # Leftovers of an interrupted extraction
+            if time.time() - os.path.getmtime(full_path) > 3600:
+                shutil.rmtree(full_path, ignore_errors=True)
+            continue
+        try:
+            versions.append((os.path.getmtime(os.path.join(full_path, MARKER)), full_path))
+        except OSError:
+            shutil.rmtree(full_path, ignore_errors=True)
+    versions.sort(reverse=True)
+    for _, stale in versions[max(KEEP_VERSIONS - 1, 0):]:
+        shutil.rmtree(stale, ignore_errors=True)
+
+
+def main():
+    root = _cache_root()
+    target = os.path.join(root, BUILD_ID)
+    os.makedirs(root, exist_ok=True)
+    if _is_valid(target):
+        os.utime(os.path.join(target, MARKER))
+    else:
+        _extract(target)
+    _collect_garbage(root)
+
+    executable = os.path.join(target, EXECUTABLE)
+    if os.name == 'nt':
+        sys.exit(subprocess.call([executable, *sys.argv[1:]]))
+    os.execv(executable, [executable, *sys.argv[1:]])
+
+
+if __name__ == '__main__':
+    main()
+"""
+
+
+def render_launcher(app_name: str, build_id: str, executable: str, executable_size: int,
+                    keep_versions: int = 2) -> str:
+    """
+    Returns the source of the launcher script for a build.
+    """
+    return Template(LAUNCHER_TEMPLATE).substitute(
+        app_name=repr(app_name),
+        build_id=repr(build_id),
+        executable=repr(executable),
+        executable_size=executable_size,
+        keep_versions=keep_versions
+    )
+
+
+def build_persistent_bundle(freeze_dir: str, console: bool = False, icon: str = None) -> str:
+    """
+    Produces a single-file executable that unpacks the frozen app once into a
+    per-user cache directory keyed by the build's content hash, and reuses it
+    on later launches.
+
+    The output is a small PyInstaller --onefile launcher with a zip of the
+    onedir build appended to it. Only the launcher itself is unpacked to a
+    temporary directory on each start.
+
+    Args:
+        freeze_dir (str): The onedir build to embed.
+        console (bool): Whether the launcher opens a console window.
+        icon (str): Optional icon for the launcher executable.
+
+    Returns:
+        str: The path of the generated single-file executable, or None if the
+             payload could not be embedded safely.
+    """
+    settings = QYRO_INTERNAL_STATE.get_config('settings')
+    app_name = settings['app_name']
+    executable = app_name + ('.exe' if windows_based() else '')
+    work_dir = path('target/PyInstaller/bundle')
+    makedirs(work_dir, exist_ok=True)
+
+    payload_path = join(work_dir, 'payload.zip')
+    _write_payload(freeze_dir, payload_path)
+    if _contains_cookie_magic(payload_path):
+        EngineMessage.show(
+            "The bundle payload contains the PyInstaller archive marker and cannot be appended "
+            "to the launcher. Rebuild with 'bundle_extraction' set to 'temp'.",
+            level="warning"
+        )
+        return None
+
+    launcher_path = join(work_dir, 'launcher.py')
+    launcher = render_launcher(
+        app_name, tree_digest(freeze_dir)[:16], executable,
+        os.path.getsize(join(freeze_dir, executable)), int(settings.get('bundle_keep_versions', 2))
+    )
+    with open(launcher_path, 'w', encoding='utf-8') as f:
+        f.write(launcher)
+
+    dist_dir = join(work_dir, 'dist')
+    arguments = [
+        'pyinstaller', '--onefile', '--noupx', '--noconfirm',
+        '--console' if console else '--noconsole',
+        '--name', app_name,
+        '--distpath', dist_dir,
+        '--workpath', join(work_dir, 'build'),
+        '--specpath', work_dir,
+        *(['--icon', icon] if icon else []),
+        launcher_path
+    ]
+    run_streamed(
+        arguments, join(work_dir, 'build.log'),
+        phases=PYINSTALLER_PHASES, description='Building the launcher', env=reproducible_env()
+    )
+
+    output_dir = path('target/bundle')
+    makedirs(output_dir, exist_ok=True)
+    output_path = join(output_dir, executable)
+    with open(output_path, 'wb') as out:
+        for part in (join(dist_dir, executable), payload_path):
+            with open(part, 'rb') as f:
+                shutil.copyfileobj(f, out)
+    os.chmod(output_path, 0o755)
+    return output_path
+
+
+def _write_payload(freeze_dir: str, payload_path: str):
+    """
+    Zips the onedir build, keeping POSIX permissions so the launcher can
+    restore executable bits when it unpacks the payload.
+    """
+    with zipfile.ZipFile(payload_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=9) as archive:
+        for rel_path in iter_tree_files(freeze_dir):
+            archive.write(join(freeze_dir, *rel_path.split('/')), rel_path)
+
+
+def _contains_cookie_magic(file_path: str) -> bool:
+    """
+    Scans a file for the PyInstaller cookie, handling matches that straddle
+    two read chunks.
+    """
+    overlap = len(_PYINSTALLER_COOKIE_MAGIC) - 1
+    tail = b''
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            if _PYINSTALLER_COOKIE_MAGIC in tail + chunk:
+                return True
+            tail = chunk[-overlap:]
+    return False
@@ -0,0 +1,16 @@
+from qyro.pipelines.linux import build_for_linux, create_installer_linux
+
+
+def build_for_fedora(debug=False, bundle=False):
+    """
+    Builds the application for Fedora.
+    """
+    build_for_linux(debug=debug, bundle=bundle)
+
+
+def create_installer_fedora():
+    """
+    Creates the installer for Fedora. RPM packaging is not available yet,
+    so this produces the generic Linux tarball.
+    """
+    return create_installer_linux()
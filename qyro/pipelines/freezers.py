@@ -0,0 +1,186 @@
+import os
+import sys
+import json
+import shutil
+from abc import ABC, abstractmethod
+from pathlib import Path, PurePath
+from os import makedirs, rename
+from os.path import join, exists
+from qyro import path
+from qyro._store import QYRO_INTERNAL_STATE
+from qyro._exceptions import EngineError
+from qyro.utils import module_exists
+from qyro.utils.platform import mac_based, windows_based, linux_based
+from qyro.utils.process import run_streamed, NUITKA_PHASES
+from qyro.utils.reproducible import reproducible_env
+from qyro.pipelines import compile_with_pyinstaller, check_sources_compile
+from qyro_engine._qyro import extract_public_settings
+from qyro_engine._frozen import BUILD_SETTINGS_FILE
+
+# Nuitka plugin that bundles each Qt binding
+_NUITKA_QT_PLUGINS = {
+    'PyQt5': 'pyqt5',
+    'PyQt6': 'pyqt6',
+    'PySide2': 'pyside2',
+    'PySide6': 'pyside6',
+}
+
+
+class FreezerBackend(ABC):
+    """
+    Turns the project's main module into a frozen app in ${freeze_dir}.
+
+    Backends share the settings schema: 'main_module', 'hidden_imports',
+    'optimize' and 'extra_<name>_args'. Resources are copied by the platform
+    pipelines afterwards, the same way for every backend.
+    """
+    name = ''
+    # The module that must be importable to use the backend
+    module = ''
+
+    def check(self) -> None:
+        """
+        Raises:
+            EngineError: If the backend is not installed.
+        """
+        if not module_exists(self.module):
+            raise EngineError(
+                f"The '{self.module}' module is required for building the project with the '{self.name}' freezer."
+            )
+
+    @abstractmethod
+    def freeze(self, debug: bool = False, onefile: bool = False, windowed: bool = None,
+               icon: str = None, version_file: str = None) -> str:
+        """
+        Freezes the app.
+
+        Args:
+            debug (bool): Builds with debug output.
+            onefile (bool): Builds a single executable instead of a directory.
+            windowed (bool, optional): Hides (True) or shows (False) the console
+                                       on Windows and macOS. None keeps the default.
+            icon (str, optional): The application icon.
+            version_file (str, optional): PyInstaller version resource (Windows).
+
+        Returns:
+            str: The frozen app, ${freeze_dir}.
+        """
+
+    def data_dir(self, freeze_path: str) -> str:
+        """
+        Returns the directory of the frozen app that holds bundled packages.
+        """
+        return freeze_path
+
+
+class PyInstallerBackend(FreezerBackend):
+    name = 'pyinstaller'
+    module = 'PyInstaller'
+
+    def freeze(self, debug=False, onefile=False, windowed=None, icon=None, version_file=None):
+        arguments = ['pyinstaller']
+        if windowed is not None:
+            arguments.append('--noconsole' if windowed else '--console')
+        if debug:
+            arguments += ['--log-level=DEBUG', '--debug', 'all']
+        if onefile:
+            arguments.append('--onefile')
+        if icon:
+            arguments += ['--icon', icon]
+        if version_file:
+            arguments += ['--version-file', version_file]
+        return compile_with_pyinstaller(arguments, debug)
+
+    def data_dir(self, freeze_path):
+        return join(freeze_path, '_internal')
+
+
+class NuitkaBackend(FreezerBackend):
+    """
+    Compiles the app to C with Nuitka. Build settings are shipped as a JSON
+    file next to the executable instead of PyInstaller's runtime hook.
+    """
+    name = 'nuitka'
+    module = 'nuitka'
+
+    def freeze(self, debug=False, onefile=False, windowed=None, icon=None, version_file=None):
+        if onefile:
+            # The pipelines copy resources into ${freeze_dir} afterwards,
+            # which a single executable does not have
+            raise EngineError(
+                "The nuitka freezer cannot build a single executable yet. Set 'bundle_extraction' to "
+                "'persistent' or use the pyinstaller freezer."
+            )
+        settings = QYRO_INTERNAL_STATE.get_config('settings')
+        app_name = settings['app_name']
+        optimize = 0 if debug else int(settings.get('optimize', 0))
+        check_sources_compile(optimize, workers=int(settings.get('compile_workers', 0)))
+
+        output_dir = path('target/Nuitka')
+        makedirs(output_dir, exist_ok=True)
+        settings_file = join(output_dir, BUILD_SETTINGS_FILE)
+        with open(settings_file, 'w', encoding='utf-8') as f:
+            json.dump(extract_public_settings(settings), f, sort_keys=True)
+
+        main_module = path(settings['main_module'])
+        arguments = [
+            sys.executable, '-m', 'nuitka',
+            '--standalone',
+            '--assume-yes-for-downloads',
+            f'--output-dir={output_dir}',
+            f'--output-filename={app_name}',
+            f'--include-data-files={settings_file}={BUILD_SETTINGS_FILE}',
+            *(f'--include-module={module}' for module in settings['hidden_imports']),
+            *self._qt_arguments(settings),
+            *self._optimize_arguments(optimize),
+            *self._platform_arguments(settings, windowed, icon),
+            *settings.get('extra_nuitka_args', []),
+            main_module
+        ]
+        run_streamed(
+            arguments, Path('build.log'), echo=debug,
+            phases=NUITKA_PHASES, description='Starting Nuitka', env=reproducible_env()
+        )
+
+        freeze_dir = path('${freeze_dir}')
+        stem = Path(main_module).stem
+        output = join(output_dir, f'{stem}.app' if mac_based() else f'{stem}.dist')
+        if PurePath(output) != PurePath(freeze_dir):
+            if exists(freeze_dir):
+                shutil.rmtree(freeze_dir) if os.path.isdir(freeze_dir) else os.remove(freeze_dir)
+            rename(output, freeze_dir)
+        return freeze_dir
+
+    @staticmethod
+    def _qt_arguments(settings: dict) -> list:
+        plugin = _NUITKA_QT_PLUGINS.get(settings.get('binding'))
+        return [f'--enable-plugin={plugin}'] if plugin else []
+
+    @staticmethod
+    def _optimize_arguments(optimize: int) -> list:
+        flags = ['no_asserts'] if optimize >= 1 else []
+        if optimize >= 2:
+            flags.append('no_docstrings')
+        return [f'--python-flag={flag}' for flag in flags]
+
+    @staticmethod
+    def _platform_arguments(settings: dict, windowed: bool, icon: str) -> list:
+        arguments = []
+        if windows_based():
+            if windowed is not None:
+                arguments.append(f"--windows-console-mode={'disable' if windowed else 'force'}")
+            if icon:
+                arguments.append(f'--windows-icon-from-ico={icon}')
+            arguments += [
+                f"--company-name={settings.get('author', settings['app_name'])}",
+                f"--product-name={settings['app_name']}",
+                f"--file-version={settings['version']}",
+                f"--product-version={settings['version']}",
+            ]
+        elif mac_based():
+            arguments += ['--macos-create-app-bundle', f"--macos-app-name={settings['app_name']}"]
+            if icon:
+                arguments.append(f'--macos-app-icon={icon}')
+        elif linux_based() and icon:
+            arguments.append(f'--linux-icon={icon}')
+        return arguments
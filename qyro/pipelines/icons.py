@@ -0,0 +1,145 @@
+import os
+import shutil
+import hashlib
+from os.path import join, exists
+from concurrent.futures import ThreadPoolExecutor
+from qyro import path
+from qyro._store import QYRO_INTERNAL_STATE
+from qyro._exceptions import EngineError, EngineMessage
+from qyro.utils.cache import touch
+from qyro.utils.hashing import file_digest
+
+# Same layout as the hand-made icon sets of the project templates
+ICON_SIZES = {
+    'base': (16, 24, 32, 48, 64),
+    'linux': (128, 256, 512, 1024),
+    'mac': (128, 256, 512, 1024),
+}
+ICO_SIZES = (16, 24, 32, 48, 64, 128, 256)
+# Every size of an Apple icon set, including the @2x variants
+ICNS_SIZES = (16, 32, 64, 128, 256, 512, 1024)
+# Bumped whenever the generated output changes, to invalidate old caches
+_GENERATOR_VERSION = 3
+_COMPLETE_MARKER = '.complete'
+# Names the generated set in use, so the app finds it when run from source
+CURRENT_ICONS_FILE = 'CURRENT'
+
+
+def _load_master(source: str):
+    from PIL import Image
+
+    with Image.open(source) as image:
+        master = image.convert('RGBA')
+    if master.width != master.height:
+        # Center non-square artwork on a transparent square canvas
+        side = max(master.size)
+        canvas = Image.new('RGBA', (side, side))
+        canvas.paste(master, ((side - master.width) // 2, (side - master.height) // 2))
+        master = canvas
+    if master.width < max(max(sizes) for sizes in ICON_SIZES.values()):
+        EngineMessage.show(
+            f"The icon source is only {master.width}px wide, larger icons will be upscaled.",
+            level="warning"
+        )
+    return master
+
+
+def _write_png(master, size: int, output: str):
+    from PIL import Image
+
+    master.resize((size, size), Image.LANCZOS).save(output, optimize=True)
+
+
+def _write_ico(master, output: str):
+    master.save(output, sizes=[(size, size) for size in ICO_SIZES])
+
+
+def _write_icns(master, output: str):
+    from PIL import Image
+
+    # Pillow writes .icns itself, so this does not need macOS' iconutil.
+    # Each size is resampled from the master rather than by the encoder.
+    largest = master.resize((ICNS_SIZES[-1], ICNS_SIZES[-1]), Image.LANCZOS)
+    others = [master.resize((size, size), Image.LANCZOS) for size in ICNS_SIZES[:-1]]
+    largest.save(output, format='ICNS', append_images=others)
+
+
+def icons_cache_key(source: str) -> str:
+    sizes = repr((sorted(ICON_SIZES.items()), ICO_SIZES, _GENERATOR_VERSION))
+    return hashlib.sha256(f"{file_digest(source)}{sizes}".encode('utf-8')).hexdigest()[:32]
+
+
+def generate_icons(source: str, cache_root: str = None) -> str:
+    """
+    Generates the full icon set from one master image: a PNG for every size
+    of src/main/icons/{base,linux,mac}, plus Icon.ico and Icon.icns.
+
+    The images are resized in parallel and the result is cached under
+    target/.cache/icons by the hash of the source, so unchanged rebuilds
+    reuse it without opening the image.
+
+    Args:
+        source (str): The master image, ideally a square PNG of 1024px or more.
+        cache_root (str, optional): Where generated sets are cached.
+
+    Returns:
+        str: The directory with the generated icons.
+    """
+    if not exists(source):
+        raise EngineError(f"The icon source '{source}' was not found.")
+
+    cache_root = cache_root or path('target/.cache/icons')
+    output_dir = join(cache_root, icons_cache_key(source))
+    if exists(join(output_dir, _COMPLETE_MARKER)):
+        touch(output_dir)
+        return output_dir
+
+    master = _load_master(source)
+    staging_dir = f'{output_dir}.tmp'
+    shutil.rmtree(staging_dir, ignore_errors=True)
+
+    for platform_dir in ICON_SIZES:
+        os.makedirs(join(staging_dir, platform_dir))
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        tasks = [pool.submit(_write_ico, master, join(staging_dir, 'Icon.ico')),
+                 pool.submit(_write_icns, master, join(staging_dir, 'Icon.icns'))]
+        for platform_dir, sizes in ICON_SIZES.items():
+            for size in sizes:
+                tasks.append(pool.submit(_write_png, master, size, join(staging_dir, platform_dir, f'{size}.png')))
+        for task in tasks:
+            task.result()
+
+    open(join(staging_dir, _COMPLETE_MARKER), 'w').close()
+    shutil.rmtree(output_dir, ignore_errors=True)
+    os.replace(staging_dir, output_dir)
+    EngineMessage.show(f"Generated icons from [cyan]{source}[/cyan].", level="info")
+    return output_dir
+
+
+def icons_dir() -> str:
+    """
+    Returns the directory with the project's icons: the set generated from
+    the 'icon_source' setting if there is one, otherwise src/main/icons.
+
+    The choice is recorded in target/.cache/icons/CURRENT, which the
+    resource locator reads when the app runs from source.
+    """
+    source = QYRO_INTERNAL_STATE.get_config('settings').get('icon_source')
+    current_file = path(f'target/.cache/icons/{CURRENT_ICONS_FILE}')
+    if not source:
+        if exists(current_file):
+            os.remove(current_file)
+        return path('src/main/icons')
+
+    output_dir = generate_icons(path(source))
+    with open(current_file, 'w', encoding='utf-8') as f:
+        f.write(os.path.basename(output_dir))
+    return output_dir
+
+
+def icon_path(name: str = 'Icon.ico') -> str:
+    """
+    Returns the path of an icon file, e.g. 'Icon.ico' or 'linux/256.png'.
+    """
+    return join(icons_dir(), *name.split('/'))
@@ -0,0 +1,284 @@
+import io
+import os
+import re
+import lzma
+import shutil
+import tarfile
+import platform
+import subprocess
+from contextlib import contextmanager
+from os.path import join, exists
+from qyro import path
+from qyro._store import QYRO_INTERNAL_STATE
+from qyro._exceptions import EngineError, EngineMessage
+from qyro.utils.fs import _copy_and_filter
+from qyro.utils.dedup import deduplicate_tree
+from qyro.utils.helpers import format_size
+from qyro.utils.reproducible import reproducible_enabled, normalize_tree, source_date_epoch, build_timestamp
+from qyro.pipelines import get_freezer_backend, _generate_resources
+from qyro.pipelines.bundle import build_persistent_bundle
+from qyro.pipelines.icons import icon_path, icons_dir
+
+COMPRESSORS = ('xz', 'zstd')
+# Sizes of the hicolor icon theme that desktop launchers look up
+HICOLOR_SIZES = (16, 24, 32, 48, 64, 128, 256, 512)
+
+
+def build_for_linux(debug=False, bundle=False):
+    """
+    Builds the application for Linux with the configured freezer (PyInstaller by default).
+
+    Args:
+        debug (bool or str): Enables debug mode. Can be a boolean
+                             or a string ('dev', 'development', 'true', '1').
+        bundle (bool): Bundles the executable into a single file.
+    """
+    settings = QYRO_INTERNAL_STATE.get_config('settings')
+    is_debug = (
+        debug.lower() in ('dev', 'development', 'true', '1')
+        if isinstance(debug, str)
+        else bool(debug)
+    )
+
+    persistent_bundle = bundle and settings.get('bundle_extraction') == 'persistent'
+    freeze_path = get_freezer_backend().freeze(debug=is_debug, onefile=bundle and not persistent_bundle)
+    _generate_resources()
+    icon = icon_path('Icon.ico')
+    if exists(icon):
+        # Loaded as QApplication's window icon
+        shutil.copy(icon, freeze_path)
+
+    if settings.get('deduplicate_output', False):
+        saved = deduplicate_tree(freeze_path)
+        EngineMessage.show(f"Deduplicated the frozen output, saving {format_size(saved)}.", level="info")
+
+    if reproducible_enabled():
+        normalize_tree(freeze_path, source_date_epoch())
+
+    if persistent_bundle:
+        build_persistent_bundle(freeze_path, console=is_debug)
+
+
+def _compression_for(file_name: str, default: str) -> str:
+    """
+    Picks the compressor from an installer name such as 'App.pkg.tar.zst'.
+    """
+    if file_name.endswith(('.zst', '.zstd')):
+        return 'zstd'
+    if file_name.endswith('.xz'):
+        return 'xz'
+    return default
+
+
+@contextmanager
+def compressed_stream(output_path: str, compression: str = 'xz', level: int = 6, threads: int = 0):
+    """
+    Opens a writable stream whose contents are compressed into output_path.
+
+    The data is piped into the multithreaded 'xz' or 'zstd' command line
+    tools, so archives can be streamed straight from the frozen tree without
+    staging an uncompressed copy. If the 'xz' tool is missing, Python's
+    single-threaded lzma module is used instead.
+
+    Args:
+        output_path (str): The compressed file to write.
+        compression (str): 'xz' or 'zstd'.
+        level (int): Compression level passed to the compressor.
+        threads (int): Worker threads; 0 uses every available core.
+
+    Yields:
+        BinaryIO: The stream to write uncompressed data to.
+    """
+    if compression not in COMPRESSORS:
+        raise EngineError(f"Unsupported installer compression '{compression}'. Use one of: {', '.join(COMPRESSORS)}.")
+
+    tool = shutil.which(compression)
+    with open(output_path, 'wb') as out:
+        if tool is None:
+            if compression == 'zstd':
+                raise EngineError("The 'zstd' command was not found. Install zstd or use xz compression.")
+            EngineMessage.show("The 'xz' command was not found, compressing single-threaded.", level="warning")
+            with lzma.open(out, 'wb', preset=level) as stream:
+                yield stream
+            return
+
+        if compression == 'xz':
+            command = [tool, '-z', '-c', f'-{level}', f'-T{threads}']
+        else:
+            command = [tool, '-q', '-c', f'-{level}', f'-T{threads}', *(['--ultra'] if level > 19 else [])]
+
+        process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=out)
+        try:
+            yield process.stdin
+        finally:
+            process.stdin.close()
+            returncode = process.wait()
+        if returncode != 0:
+            raise EngineError(f"'{compression}' failed with exit code {returncode}.")
+
+
+def _normalize_owner(tarinfo: tarfile.TarInfo) -> tarfile.TarInfo:
+    tarinfo.uid = tarinfo.gid = 0
+    tarinfo.uname = tarinfo.gname = 'root'
+    return tarinfo
+
+
+def _add_bytes(tar: tarfile.TarFile, name: str, data: bytes, mode: int = 0o644):
+    tarinfo = _normalize_owner(tarfile.TarInfo(name))
+    tarinfo.size = len(data)
+    tarinfo.mode = mode
+    tarinfo.mtime = build_timestamp()
+    tar.addfile(tarinfo, io.BytesIO(data))
+
+
+def _add_directory(tar: tarfile.TarFile, name: str):
+    tarinfo = _normalize_owner(tarfile.TarInfo(name))
+    tarinfo.type = tarfile.DIRTYPE
+    tarinfo.mode = 0o755
+    tarinfo.mtime = build_timestamp()
+    tar.addfile(tarinfo)
+
+
+def icon_name(settings: dict) -> str:
+    """
+    The name the app's icon is installed under in the hicolor theme.
+    """
+    return re.sub(r'[^a-z0-9.-]+', '-', settings['app_name'].lower()).strip('-') or 'app'
+
+
+def hicolor_icons() -> dict:
+    """
+    Returns {size: png path} for the hicolor sizes available in the icons
+    directory. Icons of the linux profile win over the base ones.
+    """
+    directory = icons_dir()
+    icons = {}
+    for profile in ('base', 'linux'):
+        for size in HICOLOR_SIZES:
+            png = join(directory, profile, f'{size}.png')
+            if exists(png):
+                icons[size] = png
+    return icons
+
+
+def _desktop_entry(settings: dict) -> bytes:
+    app_name = settings['app_name']
+    return (
+        "[Desktop Entry]\n"
+        "Type=Application\n"
+        f"Name={app_name}\n"
+        f"Comment={settings.get('description', '')}\n"
+        f"Exec=/opt/{app_name}/{app_name}\n"
+        f"Icon={icon_name(settings)}\n"
+        f"Categories={settings.get('categories', 'Utility;')}\n"
+    ).encode('utf-8')
+
+
+def write_app_tree(tar: tarfile.TarFile, prefix: str = ''):
+    """
+    Writes the installed layout of the app into a tar stream:
+    /opt/<app_name>, a launcher symlink in /usr/bin, a desktop entry, the
+    PNG icons in the hicolor theme and the files of src/installer/linux
+    (with placeholders filtered). Every directory is written once.
+
+    Args:
+        tar (TarFile): The archive to write to.
+        prefix (str): Prefix for every member name, e.g. './' for .deb files.
+    """
+    settings = QYRO_INTERNAL_STATE.get_config('settings')
+    app_name = settings['app_name']
+
+    skeleton_dir = path('target/installer/linux')
+    shutil.rmtree(skeleton_dir, ignore_errors=True)
+    _copy_and_filter(path, 'src/installer/linux', skeleton_dir)
+    if reproducible_enabled() and exists(skeleton_dir):
+        normalize_tree(skeleton_dir, source_date_epoch())
+
+    written = set()
+
+    def add_directories(name):
+        parts = name.split('/')
+        for depth in range(1, len(parts) + 1):
+            directory = '/'.join(parts[:depth])
+            if directory not in written:
+                written.add(directory)
+                _add_directory(tar, prefix + directory)
+
+    add_directories('opt')
+    tar.add(path('${freeze_dir}'), arcname=f'{prefix}opt/{app_name}', filter=_normalize_owner)
+
+    add_directories('usr/bin')
+    symlink = _normalize_owner(tarfile.TarInfo(f'{prefix}usr/bin/{app_name}'))
+    symlink.type = tarfile.SYMTYPE
+    symlink.linkname = f'/opt/{app_name}/{app_name}'
+    symlink.mode = 0o777
+    symlink.mtime = build_timestamp()
+    tar.addfile(symlink)
+
+    # The skeleton may provide its own icons and desktop entry, which win
+    skeleton_files = set()
+    if exists(skeleton_dir):
+        for dirpath, dirnames, filenames in os.walk(skeleton_dir):
+            dirnames.sort()
+            rel_dir = os.path.relpath(dirpath, skeleton_dir).replace(os.sep, '/')
+            if rel_dir != '.':
+                add_directories(rel_dir)
+            for filename in sorted(filenames):
+                rel_path = filename if rel_dir == '.' else f'{rel_dir}/{filename}'
+                skeleton_files.add(rel_path)
+                tar.add(join(dirpath, filename), arcname=prefix + rel_path, filter=_normalize_owner)
+
+    for size, png in sorted(hicolor_icons().items()):
+        icon_file = f'usr/share/icons/hicolor/{size}x{size}/apps/{icon_name(settings)}.png'
+        if icon_file not in skeleton_files:
+            add_directories(icon_file.rsplit('/', 1)[0])
+            tar.add(png, arcname=prefix + icon_file, filter=_normalize_owner)
+
+    desktop_file = f'usr/share/applications/{app_name}.desktop'
+    if desktop_file not in skeleton_files:
+        add_directories('usr/share/applications')
+        _add_bytes(tar, prefix + desktop_file, _desktop_entry(settings))
+
+
+def installed_size(directory: str) -> int:
+    total = 0
+    for dirpath, _, filenames in os.walk(directory):
+        for filename in filenames:
+            total += os.lstat(join(dirpath, filename)).st_size
+    return total
+
+
+def machine_architecture() -> str:
+    return platform.machine().lower() or 'x86_64'
+
+
+def _check_frozen_app():
+    freeze_dir = path('${freeze_dir}')
+    if not os.path.isdir(freeze_dir):
+        raise EngineError("The frozen app was not found. Run [bold green]'qyro freeze'[/bold green] first.")
+    return freeze_dir
+
+
+def create_installer_linux():
+    """
+    Creates a compressed tarball of the installed app layout
+    (target/${installer}, e.g. target/MyApp.tar.xz).
+    """
+    settings = QYRO_INTERNAL_STATE.get_config('settings')
+    _check_frozen_app()
+    installer = path(f"target/{settings['installer']}")
+    compression = _compression_for(installer, settings.get('installer_compression', 'xz'))
+
+    with compressed_stream(
+        installer, compression,
+        level=int(settings.get('installer_compression_level', 6)),
+        threads=int(settings.get('installer_threads', 0))
+    ) as stream:
+        with tarfile.open(fileobj=stream, mode='w|', format=tarfile.PAX_FORMAT) as tar:
+            write_app_tree(tar)
+
+    EngineMessage.show(
+        f"Installer created at [cyan]{installer}[/cyan] ({format_size(os.path.getsize(installer))}).",
+        level="success"
+    )
+    return installer
@@ -0,0 +1,107 @@
+import os
+import re
+import tarfile
+from os import makedirs
+from os.path import join
+from qyro import path
+from qyro._store import QYRO_INTERNAL_STATE
+from qyro._exceptions import EngineMessage
+from qyro.utils.helpers import format_size
+from qyro.utils.reproducible import build_timestamp
+from qyro.pipelines.linux import (
+    build_for_linux, compressed_stream, write_app_tree, installed_size,
+    machine_architecture, _add_bytes, _add_directory, _check_frozen_app
+)
+
+_DEB_ARCHITECTURES = {
+    'x86_64': 'amd64', 'amd64': 'amd64', 'aarch64': 'arm64', 'arm64': 'arm64',
+    'armv7l': 'armhf', 'i386': 'i386', 'i686': 'i386',
+}
+_MEMBER_SUFFIX = {'xz': 'xz', 'zstd': 'zst'}
+
+
+def build_for_ubuntu(debug=False, bundle=False):
+    """
+    Builds the application for Ubuntu and derivatives.
+    """
+    build_for_linux(debug=debug, bundle=bundle)
+
+
+def _control_file(settings: dict, size: int) -> bytes:
+    author = settings.get('author', '')
+    maintainer = f"{author} <{settings['author_email']}>" if settings.get('author_email') else author
+    fields = {
+        'Package': re.sub(r'[^a-z0-9+.-]', '-', settings['app_name'].lower()),
+        'Version': settings['version'],
+        'Architecture': _DEB_ARCHITECTURES.get(machine_architecture(), machine_architecture()),
+        'Maintainer': maintainer,
+        'Installed-Size': str(size // 1024 + 1),
+        'Depends': ', '.join(settings.get('depends', [])),
+        'Homepage': settings.get('url', ''),
+        'Description': settings.get('description') or settings['app_name'],
+    }
+    return ''.join(f"{key}: {value}\n" for key, value in fields.items() if value).encode('utf-8')
+
+
+def _write_ar(output_path: str, members: list):
+    """
+    Writes a System V ar archive, the container format of .deb packages.
+
+    Args:
+        output_path (str): The archive to write.
+        members (list): (name, file path) pairs, in order.
+    """
+    mtime = build_timestamp()
+    with open(output_path, 'wb') as out:
+        out.write(b'!<arch>\n')
+        for name, member_path in members:
+            size = os.path.getsize(member_path)
+            header = f"{name:<16}{mtime:<12}{0:<6}{0:<6}{'100644':<8}{size:<10}`\n"
+            out.write(header.encode('ascii'))
+            with open(member_path, 'rb') as f:
+                while chunk := f.read(1024 * 1024):
+                    out.write(chunk)
+            if size % 2:
+                out.write(b'\n')
+
+
+def create_installer_ubuntu():
+    """
+    Creates a .deb package (target/${installer}). The data member is
+    streamed from the frozen app into the compressor.
+    """
+    settings = QYRO_INTERNAL_STATE.get_config('settings')
+    freeze_dir = _check_frozen_app()
+    installer = path(f"target/{settings['installer']}")
+    compression = settings.get('installer_compression', 'xz')
+    level = int(settings.get('installer_compression_level', 6))
+    threads = int(settings.get('installer_threads', 0))
+
+    work_dir = path('target/installer/deb')
+    makedirs(work_dir, exist_ok=True)
+    with open(join(work_dir, 'debian-binary'), 'wb') as f:
+        f.write(b'2.0\n')
+
+    data_name = f'data.tar.{_MEMBER_SUFFIX.get(compression, compression)}'
+    with compressed_stream(join(work_dir, data_name), compression, level, threads) as stream:
+        with tarfile.open(fileobj=stream, mode='w|', format=tarfile.GNU_FORMAT) as tar:
+            _add_directory(tar, './')
+            write_app_tree(tar, prefix='./')
+
+    control_name = f'control.tar.{_MEMBER_SUFFIX.get(compression, compression)}'
+    with compressed_stream(join(work_dir, control_name), compression, level, threads) as stream:
+        with tarfile.open(fileobj=stream, mode='w|', format=tarfile.GNU_FORMAT) as tar:
+            _add_directory(tar, './')
+            _add_bytes(tar, './control', _control_file(settings, installed_size(freeze_dir)))
+
+    _write_ar(installer, [
+        ('debian-binary', join(work_dir, 'debian-binary')),
+        (control_name, join(work_dir, control_name)),
+        (data_name, join(work_dir, data_name)),
+    ])
+
+    EngineMessage.show(
+        f"Installer created at [cyan]{installer}[/cyan] ({format_size(os.path.getsize(installer))}).",
+        level="success"
+    )
+    return installer
@@ -1,8 +1,8 @@
-import sys
 import os
 import struct
 import shutil
 from shutil import copy
+from functools import lru_cache
 from pathlib import Path
 from os.path import join, exists
 from importlib import resources
@@ -10,14 +10,20 @@ from qyro import path
 from qyro._store import QYRO_INTERNAL_STATE
 from qyro_engine._source import default_path
 from qyro.utils.fs import _copy_and_filter
-from qyro.pipelines import compile_with_pyinstaller
-from qyro._exceptions import EngineError
+from qyro.pipelines import get_freezer_backend, _generate_resources
+from qyro.pipelines.bundle import build_persistent_bundle
+from qyro.pipelines.icons import icon_path
+from qyro._exceptions import EngineError, EngineMessage
+from qyro.utils.dedup import deduplicate_tree
+from qyro.utils.dll_index import DllIndex, default_search_paths, verify_copy
+from qyro.utils.helpers import format_size
+from qyro.utils.reproducible import reproducible_enabled, normalize_tree, source_date_epoch
 from qyro.utils.platform import mac_based
 
 
 def build_for_windows(debug=False, bundle=False):
     """
-    Builds the application for Windows using PyInstaller.
+    Builds the application for Windows with the configured freezer (PyInstaller by default).
 
     Args:
         debug (bool or str): Enables debug mode. Can be a boolean
@@ -27,18 +33,16 @@ def build_for_windows(debug=False, bundle=False):
     Returns:
         list: A list of command-line arguments for PyInstaller.
     """
-    arguments = ['pyinstaller']
+    settings = QYRO_INTERNAL_STATE.get_config('settings')
+    backend = get_freezer_backend()
     is_debug = (
         debug.lower() in ('dev', 'development', 'true', '1')
         if isinstance(debug, str)
         else bool(debug)
     )
 
-    arguments += ['--console',
-                  '--log-level=DEBUG'] if is_debug else ['--noconsole']
-
-    if bundle:
-        arguments.append('--onefile')
+    # A persistent bundle is built from the onedir output and wrapped afterwards
+    persistent_bundle = bundle and settings.get('bundle_extraction') == 'persistent'
 
     for path_callback in [path]:
         _copy_and_filter(
@@ -47,29 +51,45 @@ def build_for_windows(debug=False, bundle=False):
             path('target/PyInstaller')
         )
 
-    arguments += [
-        '--icon', path('src/main/icons/Icon.ico'),
-        '--version-file', path('target/PyInstaller/metadata.py'),
-        *(['--debug', 'all'] if is_debug else [])
-    ]
-
-    freeze_path = compile_with_pyinstaller(arguments, is_debug)
+    icon = icon_path('Icon.ico')
+    freeze_path = backend.freeze(
+        debug=is_debug,
+        onefile=bundle and not persistent_bundle,
+        windowed=not is_debug,
+        icon=icon,
+        version_file=path('target/PyInstaller/metadata.py')
+    )
     _generate_resources()
-    embed_qyro_cli_commands()
-    copy(path('src/main/icons/Icon.ico'), path('${freeze_dir}'))
+    embed_qyro_cli_commands(backend.data_dir(freeze_path))
+    copy(icon, path('${freeze_dir}'))
     restore_essential_dlls(freeze_path)
 
+    if settings.get('deduplicate_output', False):
+        saved = deduplicate_tree(freeze_path)
+        EngineMessage.show(f"Deduplicated the frozen output, saving {format_size(saved)}.", level="info")
+
+    if reproducible_enabled():
+        normalize_tree(freeze_path, source_date_epoch())
+
+    if persistent_bundle:
+        build_persistent_bundle(freeze_path, console=is_debug, icon=icon)
 
-def embed_qyro_cli_commands():
+
+def embed_qyro_cli_commands(data_dir: str = None):
     """
     Moves the QYRO CLI commands into the application bundle.
     Works both in development and in the compiled (PyInstaller) version.
+
+    Args:
+        data_dir (str, optional): The directory of the bundled packages.
+                                  Defaults to PyInstaller's '_internal'.
     """
     settings = QYRO_INTERNAL_STATE.get_config('settings')
 
     # Directorio destino dentro del bundle
-    output_dir = path(
-        f'target/{settings["app_name"]}/_internal/qyro/cli_commands/')
+    if data_dir is None:
+        data_dir = path(f'target/{settings["app_name"]}/_internal')
+    output_dir = join(data_dir, 'qyro', 'cli_commands')
     os.makedirs(output_dir, exist_ok=True)
 
     try:
@@ -87,22 +107,31 @@ def restore_essential_dlls(freeze_path: str):
     """
     Ensures that critical Visual C++ and UCRT DLLs are present
     in the frozen application's directory.
+
+    PATH is indexed once per build; the index is kept in
+    target/.cache/dll-index.json so later builds only list the directories
+    that changed.
     """
+    index = _dll_index()
+
     # DLLs from Visual C++ Redistributables
     vc_dlls = [
         'msvcr100.dll', 'msvcr110.dll', 'msvcp110.dll',
         'vcruntime140.dll', 'msvcp140.dll', 'concrt140.dll', 'vccorlib140.dll'
     ]
+    # UCRT DLLs (required on Windows 10+)
+    ucrt_dlls = ['api-ms-win-crt-multibyte-l1-1-0.dll']
+    located = index.find_many(vc_dlls + ucrt_dlls)
+
     for dll in vc_dlls:
         _copy_dll_to_freeze_dir(
             dll_name=dll,
             freeze_path=freeze_path,
             install_desc="Visual C++ Redistributable 2012",
-            install_url="https://www.microsoft.com/en-us/download/details.aspx?id=30679"
+            install_url="https://www.microsoft.com/en-us/download/details.aspx?id=30679",
+            src_path=located[dll]
         )
 
-    # UCRT DLLs (required on Windows 10+)
-    ucrt_dlls = ['api-ms-win-crt-multibyte-l1-1-0.dll']
     bitness = struct.calcsize("P") * 8  # 32-bit or 64-bit Python interpreter
     for dll in ucrt_dlls:
         _copy_dll_to_freeze_dir(
@@ -110,78 +139,52 @@ def restore_essential_dlls(freeze_path: str):
             freeze_path=freeze_path,
             install_desc="Windows 10 SDK or KB2999226",
             install_url="https://developer.microsoft.com/en-us/windows/downloads/windows-10-sdk",
-            bitness=bitness
+            bitness=bitness,
+            src_path=located[dll]
         )
 
 
-def _copy_dll_to_freeze_dir(dll_name: str, freeze_path: str, install_desc: str, install_url: str, bitness: int = None):
+def _copy_dll_to_freeze_dir(dll_name: str, freeze_path: str, install_desc: str, install_url: str,
+                            bitness: int = None, src_path: str = None):
     """
-    Copies a DLL to the freeze directory if found in PATH.
-    Raises EngineError if the DLL cannot be found.
+    Copies a DLL to the freeze directory if found in PATH and verifies the
+    copy against its source.
+    Raises EngineError if the DLL cannot be found or the copy is corrupt.
     """
     dst_path = join(freeze_path, dll_name)
     if exists(dst_path):
         return  # Already present
 
-    src_path = _locate_dll(dll_name)
+    src_path = src_path or _locate_dll(dll_name)
     if not src_path:
         msg = f"Could not find {dll_name}. Please install {install_desc}.\nURL: {install_url}"
         if bitness:
             msg += f"\nUse the {bitness}-bit version of the DLL that matches your Python interpreter."
         raise EngineError(msg)
 
-    shutil.copy(src_path, freeze_path)
+    shutil.copy(src_path, dst_path)
+    if not verify_copy(src_path, dst_path):
+        os.remove(dst_path)
+        raise EngineError(f"The copy of {dll_name} from {src_path} does not match its source.")
 
 
-def _locate_dll(dll_name: str) -> str | None:
+def _dll_index() -> DllIndex:
     """
-    Searches for a DLL in all PATH directories.
-    Returns the full path if found, or None if not found.
+    Returns the index of the DLLs in PATH, built once per process and PATH
+    and shared by every lookup.
     """
-    search_paths = os.environ.get("PATH", os.defpath).split(os.pathsep)
+    return _cached_dll_index(path('target/.cache/dll-index.json'), tuple(default_search_paths()))
 
-    # Ensure current directory is checked first on Windows
-    if sys.platform == "win32" and os.curdir not in search_paths:
-        search_paths.insert(0, os.curdir)
 
-    seen_dirs = set()
-    for directory in search_paths:
-        norm_dir = os.path.normcase(directory)
-        if norm_dir in seen_dirs:
-            continue
-        seen_dirs.add(norm_dir)
+@lru_cache(maxsize=4)
+def _cached_dll_index(cache_file: str, search_paths: tuple) -> DllIndex:
+    return DllIndex(search_paths, cache_file=cache_file)
 
-        candidate = join(directory, dll_name)
-        if exists(candidate):
-            return candidate
 
-    return None
-
-
-def _generate_resources():
+def _locate_dll(dll_name: str) -> str | None:
     """
-    Copy the data files from src/main/resources to freeze_dir.
-    Works both in development and frozen builds.
-    Automatically filters files mentioned in the settings files_to_filter.
+    Searches for a DLL in all PATH directories.
+    Returns the full path if found, or None if not found.
     """
-    # Determinar freeze_dir dinámicamente
-    freeze_dir = Path(sys._MEIPASS) if getattr(sys, 'frozen', False) else path('${freeze_dir}')
-
-    # En macOS, los recursos van a Contents/Resources
-    from qyro.utils.platform import mac_based
-    resources_dest_dir = freeze_dir / 'Contents' / 'Resources' if mac_based() else freeze_dir
-
-    # Copiar recursos de todos los perfiles cargados
-    for path_fn in (default_path, path):
-        for profile in QYRO_INTERNAL_STATE._loaded_profiles:
-            # Filtrado automático usando _copy_and_filter
-            _copy_and_filter(
-                path_fn,
-                f'src/main/resources/{profile}',
-                resources_dest_dir
-            )
-            _copy_and_filter(
-                path_fn,
-                f'src/compilers/{profile}',
-                freeze_dir
-            )
+    return _dll_index().find(dll_name)
+
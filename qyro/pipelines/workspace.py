@@ -0,0 +1,169 @@
+import os
+import sys
+import json
+import time
+import subprocess
+from os.path import join, exists, abspath, dirname
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional
+from qyro._exceptions import EngineError, EngineMessage
+from qyro.pipelines import CONTENT_STORE_ENV
+
+WORKSPACE_FILE = 'qyro-workspace.json'
+# Shared state of a workspace, next to its settings file
+WORKSPACE_DIR = '.qyro-workspace'
+# PyInstaller's cache of each project, kept by 'qyro clean --keep-cache'
+PYINSTALLER_CONFIG_DIR = join('target', '.cache', 'pyinstaller')
+# Weight of the latest build when updating a project's cost estimate
+_COST_SMOOTHING = 0.7
+
+
+def find_workspace(start: str = None) -> Optional[str]:
+    """
+    Returns the directory of the nearest qyro-workspace.json at or above start.
+    """
+    current = abspath(start or os.getcwd())
+    while True:
+        if exists(join(current, WORKSPACE_FILE)):
+            return current
+        parent = dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+
+def load_workspace(root: str) -> Dict[str, Any]:
+    """
+    Reads the workspace settings:
+
+        {"projects": ["apps/editor", "apps/viewer"], "jobs": 4}
+
+    Returns:
+        dict: The settings, with 'projects' resolved to absolute paths.
+
+    Raises:
+        EngineError: If the file is invalid or a project does not exist.
+    """
+    try:
+        with open(join(root, WORKSPACE_FILE), encoding='utf-8') as f:
+            workspace = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        raise EngineError(f"Could not read {WORKSPACE_FILE}: {e}")
+
+    projects = workspace.get('projects')
+    if not projects:
+        raise EngineError(f"{WORKSPACE_FILE} must list the projects to build in 'projects'.")
+
+    resolved = []
+    for project in projects:
+        project_dir = abspath(join(root, *project.split('/')))
+        if not exists(join(project_dir, 'src', 'build', 'settings', 'base.json')):
+            raise EngineError(f"Workspace project [bold]{project}[/bold] is not a Qyro project.")
+        resolved.append(project_dir)
+    workspace['projects'] = resolved
+    return workspace
+
+
+def _load_costs(state_dir: str) -> Dict[str, float]:
+    try:
+        with open(join(state_dir, 'costs.json'), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _save_costs(state_dir: str, costs: Dict[str, float]) -> None:
+    staging = join(state_dir, 'costs.json.tmp')
+    with open(staging, 'w', encoding='utf-8') as f:
+        json.dump(costs, f, indent=2, sort_keys=True)
+    os.replace(staging, join(state_dir, 'costs.json'))
+
+
+def schedule(projects: List[str], costs: Dict[str, float]) -> List[str]:
+    """
+    Orders projects longest first by their estimated build time, which keeps
+    a long build from starting last and stretching the whole run. Projects
+    without history are assumed to be as slow as the slowest known one.
+    """
+    unknown = max(costs.values(), default=0.0)
+    return sorted(projects, key=lambda project: costs.get(project, unknown), reverse=True)
+
+
+def _member_env(project_dir: str, env: Dict[str, str]) -> Dict[str, str]:
+    """
+    Returns the environment of a project's build. PyInstaller does not lock
+    its cache, so concurrent builds each get their own under their target.
+    """
+    member_env = dict(env)
+    member_env['PYINSTALLER_CONFIG_DIR'] = join(project_dir, PYINSTALLER_CONFIG_DIR)
+    return member_env
+
+
+def _build_project(project_dir: str, arguments: List[str], env: Dict[str, str], log_path: str) -> Dict[str, Any]:
+    start = time.perf_counter()
+    with open(log_path, 'wb') as log:
+        result = subprocess.run(arguments, cwd=project_dir, env=_member_env(project_dir, env), stdout=log, stderr=subprocess.STDOUT)
+    return {
+        'project': project_dir,
+        'returncode': result.returncode,
+        'duration': time.perf_counter() - start,
+        'log': log_path,
+    }
+
+
+def build_workspace(root: str, jobs: int = None, profile: str = None) -> List[Dict[str, Any]]:
+    """
+    Builds every project of a workspace concurrently.
+
+    Each project is built by its own 'qyro build' process, at most 'jobs' at
+    a time, longest first according to the durations of past builds. The
+    processes share a content-addressed store that staged resources are
+    hardlinked from. Each keeps PyInstaller's cache in its own target, since
+    concurrent writes to a shared one are not safe.
+
+    Args:
+        root (str): The workspace directory.
+        jobs (int, optional): Concurrent builds. Defaults to the 'jobs'
+                              setting, or half the available cores.
+        profile (str, optional): Passed to 'qyro build --profile'.
+
+    Returns:
+        list[dict]: One result per project, in completion order.
+    """
+    workspace = load_workspace(root)
+    jobs = jobs or workspace.get('jobs') or max(1, (os.cpu_count() or 2) // 2)
+
+    state_dir = join(root, WORKSPACE_DIR)
+    log_dir = join(state_dir, 'logs')
+    os.makedirs(log_dir, exist_ok=True)
+
+    env = dict(os.environ)
+    env[CONTENT_STORE_ENV] = join(state_dir, 'cas')
+    arguments = [sys.executable, '-m', 'qyro', 'build', *(['--profile', profile] if profile else [])]
+
+    costs = _load_costs(state_dir)
+    keys = {project: os.path.relpath(project, root).replace(os.sep, '/') for project in workspace['projects']}
+    ordered = schedule(workspace['projects'], {p: costs[k] for p, k in keys.items() if k in costs})
+
+    results = []
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [
+            pool.submit(_build_project, project, arguments, env, join(log_dir, keys[project].replace('/', '_') + '.log'))
+            for project in ordered
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            key = keys[result['project']]
+            result['name'] = key
+            if result['returncode'] == 0:
+                previous = costs.get(key)
+                costs[key] = result['duration'] if previous is None else (
+                    _COST_SMOOTHING * result['duration'] + (1 - _COST_SMOOTHING) * previous
+                )
+                EngineMessage.show(f"Built [bold]{key}[/bold] in {result['duration']:.1f} s.", level="success")
+            else:
+                EngineMessage.show(f"Building [bold]{key}[/bold] failed. See {result['log']}", level="error")
+            results.append(result)
+
+    _save_costs(state_dir, costs)
+    return results
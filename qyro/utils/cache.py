@@ -0,0 +1,183 @@
+import os
+import sys
+import time
+import uuid
+import shutil
+import subprocess
+from typing import Iterable, List, NamedTuple
+from qyro.utils.hashing import file_digest
+
+# Directories of 'target' that hold reusable build artifacts rather than output
+CACHE_DIRS = ('PyInstaller', '.cache')
+_TOMBSTONE_PREFIX = '.qyro-trash-'
+
+
+class CacheEntry(NamedTuple):
+    path: str
+    size: int
+    last_used: float
+
+
+def touch(entry_path: str) -> None:
+    """
+    Marks a cache entry as used, so LRU eviction keeps it longer.
+    """
+    try:
+        os.utime(entry_path)
+    except OSError:
+        pass
+
+
+def _measure(entry_path: str):
+    """
+    Returns (size in bytes, newest mtime) of a file or directory tree.
+    """
+    stat = os.lstat(entry_path)
+    is_dir = os.path.isdir(entry_path) and not os.path.islink(entry_path)
+    size, newest = (0 if is_dir else stat.st_size), stat.st_mtime
+    stack = [entry_path] if is_dir else []
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                stat = entry.stat(follow_symlinks=False)
+                newest = max(newest, stat.st_mtime)
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    size += stat.st_size
+    return size, newest
+
+
+def cache_entries(target_dir: str) -> List[CacheEntry]:
+    """
+    Lists the entries of the cache directories of target_dir, least recently
+    used first. Each immediate child of a cache directory is one entry.
+
+    Args:
+        target_dir (str): The project's 'target' directory.
+    """
+    entries = []
+    for cache_dir in CACHE_DIRS:
+        cache_path = os.path.join(target_dir, cache_dir)
+        if not os.path.isdir(cache_path):
+            continue
+        for name in os.listdir(cache_path):
+            entry_path = os.path.join(cache_path, name)
+            size, last_used = _measure(entry_path)
+            entries.append(CacheEntry(entry_path, size, last_used))
+    entries.sort(key=lambda e: e.last_used)
+    return entries
+
+
+def select_evictions(entries: List[CacheEntry], max_size: int) -> List[CacheEntry]:
+    """
+    Picks the least recently used entries to remove so the rest fit in max_size.
+
+    Args:
+        entries (list[CacheEntry]): Entries sorted least recently used first.
+        max_size (int): The size budget in bytes.
+    """
+    total = sum(e.size for e in entries)
+    evicted = []
+    for entry in entries:
+        if total <= max_size:
+            break
+        evicted.append(entry)
+        total -= entry.size
+    return evicted
+
+
+def make_tombstone(parent_dir: str) -> str:
+    """
+    Creates an empty directory in parent_dir that things can be renamed into
+    before they are deleted in the background.
+    """
+    tombstone = os.path.join(parent_dir, f'{_TOMBSTONE_PREFIX}{uuid.uuid4().hex[:12]}')
+    os.makedirs(tombstone)
+    return tombstone
+
+
+def stale_tombstones(parent_dir: str) -> List[str]:
+    """
+    Finds tombstones left behind by deletions that were interrupted.
+    """
+    if not os.path.isdir(parent_dir):
+        return []
+    return [
+        os.path.join(parent_dir, name) for name in os.listdir(parent_dir)
+        if name.startswith(_TOMBSTONE_PREFIX)
+    ]
+
+
+def delete_in_background(paths: Iterable[str]) -> None:
+    """
+    Deletes directories in a detached process that outlives the CLI, so the
+    caller returns immediately. Falls back to deleting in place if the
+    process cannot be started.
+
+    Args:
+        paths (Iterable[str]): The directories to delete.
+    """
+    paths = list(paths)
+    if not paths:
+        return
+
+    kwargs = {}
+    if sys.platform == 'win32':
+        kwargs['creationflags'] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs['start_new_session'] = True
+
+    script = 'import shutil, sys\nfor p in sys.argv[1:]:\n    shutil.rmtree(p, ignore_errors=True)'
+    try:
+        subprocess.Popen(
+            [sys.executable, '-c', script, *paths],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            close_fds=True, **kwargs
+        )
+    except OSError:
+        for p in paths:
+            shutil.rmtree(p, ignore_errors=True)
+
+
+def retire(path: str, tombstone: str) -> str:
+    """
+    Atomically moves path into the tombstone directory.
+
+    Returns:
+        str: The new location of path.
+    """
+    moved = os.path.join(tombstone, f'{time.time_ns()}-{os.path.basename(path)}')
+    os.rename(path, moved)
+    return moved
+
+
+def link_from_store(source: str, destination: str, store_dir: str) -> None:
+    """
+    Places a copy of source at destination through a content-addressed store.
+
+    The file is added to the store under its hash the first time it is seen
+    and then hardlinked to the destination, so identical files staged by
+    several projects are written to disk once. Falls back to copying where
+    hardlinks are not supported.
+
+    Args:
+        source (str): The file to copy.
+        destination (str): Where to place it.
+        store_dir (str): The root of the content-addressed store.
+    """
+    digest = file_digest(source)
+    stored = os.path.join(store_dir, digest[:2], digest)
+    if not os.path.exists(stored):
+        os.makedirs(os.path.dirname(stored), exist_ok=True)
+        # Other builds may add the same file concurrently; os.replace keeps it atomic
+        staging = f'{stored}.{uuid.uuid4().hex}.tmp'
+        shutil.copy2(source, staging)
+        os.replace(staging, stored)
+
+    if os.path.lexists(destination):
+        os.remove(destination)
+    try:
+        os.link(stored, destination)
+    except OSError:
+        shutil.copy2(stored, destination)
@@ -0,0 +1,115 @@
+import os
+import errno
+from collections import defaultdict
+from typing import Dict, List, Tuple
+from qyro._exceptions import EngineError, EngineMessage
+from qyro.utils.hashing import file_digest
+from qyro_engine.utils.resource_pack import find_resource_packs, merge_resource_packs
+
+# os.link fails with these when the file system cannot hardlink at all
+_HARDLINKS_UNSUPPORTED = {errno.EXDEV, errno.EPERM, errno.EACCES, errno.ENOTSUP, errno.EOPNOTSUPP}
+
+
+def _group_by_size(root: str) -> Dict[int, List[str]]:
+    """
+    Groups the regular files under root by size. Only sizes shared by more
+    than one file can hold duplicates, so the rest never get hashed.
+    """
+    by_size = defaultdict(list)
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            file_path = os.path.join(dirpath, filename)
+            if os.path.islink(file_path):
+                continue
+            size = os.path.getsize(file_path)
+            if size:
+                by_size[size].append(file_path)
+    return {size: files for size, files in by_size.items() if len(files) > 1}
+
+
+def find_duplicates(root: str) -> List[Tuple[int, List[str]]]:
+    """
+    Finds byte-identical files under a directory.
+
+    Args:
+        root (str): The directory to scan.
+
+    Returns:
+        list[tuple[int, list[str]]]: (size, paths) for every set of identical
+        files. The first path of each set is the one that is kept.
+    """
+    duplicates = []
+    for size, files in _group_by_size(root).items():
+        by_digest = defaultdict(list)
+        for file_path in files:
+            by_digest[file_digest(file_path)].append(file_path)
+        duplicates.extend((size, paths) for paths in by_digest.values() if len(paths) > 1)
+    return duplicates
+
+
+def deduplicate_packs(root: str) -> int:
+    """
+    Merges the resource packs of every directory under root into one pack
+    per directory, so entries shared between profiles are stored once.
+
+    Returns:
+        int: The number of bytes saved.
+    """
+    saved = 0
+    for dirpath, _, _ in os.walk(root):
+        packs = find_resource_packs(dirpath)
+        if len(packs) < 2:
+            continue
+        # The merged pack takes the name of the highest precedence one
+        saved += merge_resource_packs(packs, packs[0])
+        for pack in packs[1:]:
+            os.remove(pack)
+    return saved
+
+
+def deduplicate_tree(root: str) -> int:
+    """
+    Replaces byte-identical files under root with hardlinks to a single copy.
+
+    Resource packs are merged first, since hardlinks cannot share entries
+    between two different pack files. Files that are already hardlinked
+    together are left alone. If the file system does not support hardlinks,
+    the remaining duplicates are kept as copies and a warning is shown.
+
+    Args:
+        root (str): The directory to deduplicate, usually ${freeze_dir}.
+
+    Returns:
+        int: The number of bytes saved.
+
+    Raises:
+        EngineError: If linking fails for another reason.
+    """
+    saved = deduplicate_packs(root)
+    for size, paths in find_duplicates(root):
+        original = paths[0]
+        for duplicate in paths[1:]:
+            if os.path.samefile(original, duplicate):
+                continue
+            staging = f"{duplicate}.qyro-link"
+            # Left behind by an interrupted build
+            if os.path.lexists(staging):
+                os.remove(staging)
+            try:
+                os.link(original, staging)
+            except OSError as e:
+                if e.errno == errno.EMLINK:
+                    # The original reached the link limit; keep this copy
+                    continue
+                if e.errno in _HARDLINKS_UNSUPPORTED:
+                    EngineMessage.show(
+                        f"Hardlinks are not supported in {root} ({e.strerror}). "
+                        "Only the resource packs were deduplicated; identical files are kept as copies.",
+                        level="warning"
+                    )
+                    return saved
+                raise EngineError(f"Cannot link {duplicate} to {original}: {e}")
+            os.replace(staging, duplicate)
+            saved += size
+    return saved
@@ -0,0 +1,135 @@
+import os
+import json
+import shutil
+import hashlib
+import zipfile
+import tempfile
+from typing import BinaryIO, Dict, Any
+from qyro_engine.updater import DELTA_INDEX, DELTA_FORMAT
+from qyro_engine.updater.manifest import (
+    build_manifest, BLOCK_SIZE, PATCH_COPY, PATCH_LITERAL, COPY_RECORD, LITERAL_RECORD
+)
+
+# Files below this size are always shipped whole
+PATCH_THRESHOLD = 1024 * 1024
+# A patch is only used if it is noticeably smaller than the file itself
+_PATCH_MAX_RATIO = 0.75
+
+
+def _block_key(block: bytes):
+    return len(block), hashlib.blake2b(block, digest_size=16).digest()
+
+
+def write_block_diff(old_path: str, new_path: str, out: BinaryIO) -> int:
+    """
+    Writes a block-level patch that turns old_path into new_path.
+
+    The old file is indexed by fixed-size blocks; every block of the new file
+    that already exists somewhere in the old one becomes a copy record, and
+    runs of adjacent copies are merged. Everything else is stored literally.
+
+    Args:
+        old_path (str): The previous version of the file.
+        new_path (str): The new version of the file.
+        out (BinaryIO): Where the patch records are written.
+
+    Returns:
+        int: The number of literal bytes in the patch.
+    """
+    index = {}
+    with open(old_path, 'rb') as old:
+        offset = 0
+        for block in iter(lambda: old.read(BLOCK_SIZE), b''):
+            index.setdefault(_block_key(block), offset)
+            offset += len(block)
+
+    literal_bytes = 0
+    copy_start, copy_length = None, 0
+
+    def flush_copy():
+        if copy_length:
+            out.write(PATCH_COPY + COPY_RECORD.pack(copy_start, copy_length))
+
+    with open(new_path, 'rb') as new:
+        for block in iter(lambda: new.read(BLOCK_SIZE), b''):
+            old_offset = index.get(_block_key(block))
+            if old_offset is None:
+                flush_copy()
+                copy_start, copy_length = None, 0
+                out.write(PATCH_LITERAL + LITERAL_RECORD.pack(len(block)) + block)
+                literal_bytes += len(block)
+            elif copy_length and old_offset == copy_start + copy_length:
+                copy_length += len(block)
+            else:
+                flush_copy()
+                copy_start, copy_length = old_offset, len(block)
+        flush_copy()
+
+    return literal_bytes
+
+
+def create_delta_package(old_dir: str, new_dir: str, output_path: str) -> Dict[str, Any]:
+    """
+    Creates a delta package that upgrades an install of old_dir to new_dir.
+
+    Unchanged files are not shipped, moved files become copy operations,
+    large modified files are shipped as block-level patches and everything
+    else is stored whole. The package carries the full target manifest so
+    the updater can verify the result against its Merkle root.
+
+    Args:
+        old_dir (str): The previously released build.
+        new_dir (str): The new build.
+        output_path (str): The package to write.
+
+    Returns:
+        dict: Counts of each operation plus the target Merkle root.
+    """
+    old = build_manifest(old_dir)
+    new = build_manifest(new_dir)
+    old_by_hash = {info['sha256']: rel_path for rel_path, info in old['files'].items()}
+
+    ops = {}
+    with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as package:
+        for rel_path, info in new['files'].items():
+            previous = old['files'].get(rel_path)
+            if previous and previous['sha256'] == info['sha256'] and previous['mode'] == info['mode']:
+                continue
+
+            if info['sha256'] in old_by_hash:
+                ops[rel_path] = {'type': 'copy', 'from': old_by_hash[info['sha256']]}
+                continue
+
+            new_path = os.path.join(new_dir, *rel_path.split('/'))
+            if previous and info['size'] >= PATCH_THRESHOLD:
+                with tempfile.TemporaryFile() as patch:
+                    literal_bytes = write_block_diff(
+                        os.path.join(old_dir, *rel_path.split('/')), new_path, patch
+                    )
+                    if literal_bytes < info['size'] * _PATCH_MAX_RATIO:
+                        entry = f'patches/{rel_path}'
+                        patch.seek(0)
+                        with package.open(entry, 'w', force_zip64=True) as dest:
+                            shutil.copyfileobj(patch, dest)
+                        ops[rel_path] = {'type': 'patch', 'entry': entry, 'base_sha256': previous['sha256']}
+                        continue
+
+            entry = f'files/{rel_path}'
+            package.write(new_path, entry)
+            ops[rel_path] = {'type': 'full', 'entry': entry}
+
+        package.writestr(DELTA_INDEX, json.dumps({
+            'format': DELTA_FORMAT,
+            'base_root': old['root'],
+            'target': new,
+            'removed': sorted(set(old['files']) - set(new['files'])),
+            'ops': ops,
+        }))
+
+    summary = {kind: 0 for kind in ('full', 'patch', 'copy')}
+    for op in ops.values():
+        summary[op['type']] += 1
+    summary['unchanged'] = len(new['files']) - len(ops)
+    summary['removed'] = len(set(old['files']) - set(new['files']))
+    summary['root'] = new['root']
+    return summary
@@ -0,0 +1,133 @@
+import os
+import sys
+import json
+from typing import Dict, Iterable, List, Optional
+from qyro.utils.hashing import file_digest
+
+_INDEX_FORMAT = 1
+
+
+def default_search_paths() -> List[str]:
+    """
+    Returns the directories Windows searches for DLLs, in order: the current
+    directory (on Windows), then every PATH entry.
+    """
+    search_paths = os.environ.get("PATH", os.defpath).split(os.pathsep)
+    if sys.platform == "win32" and os.curdir not in search_paths:
+        search_paths.insert(0, os.curdir)
+    return search_paths
+
+
+class DllIndex:
+    """
+    An index of the DLLs found in a list of directories, built with one
+    directory listing per directory instead of one existence check per
+    directory and DLL.
+
+    The index can be persisted with the mtime of every directory. A later
+    build only lists the directories whose mtime changed, which is exactly
+    when files were added, removed or renamed in them. DLL names are
+    matched case-insensitively, as on Windows.
+    """
+
+    def __init__(self, search_paths: Iterable[str] = None, cache_file: str = None,
+                 extensions: Iterable[str] = ('.dll',)):
+        """
+        Args:
+            search_paths (Iterable[str], optional): Directories in search order.
+                                                    Defaults to default_search_paths().
+            cache_file (str, optional): Where the index is persisted between builds.
+            extensions (Iterable[str]): File extensions to index.
+        """
+        self.cache_file = cache_file
+        self.extensions = tuple(e.lower() for e in extensions)
+        self.search_paths = []
+        seen = set()
+        for directory in (default_search_paths() if search_paths is None else search_paths):
+            key = os.path.normcase(os.path.abspath(directory))
+            if key not in seen:
+                seen.add(key)
+                self.search_paths.append(directory)
+
+        # directory -> {'mtime': int, 'files': {lowercase name: name}}
+        self._dirs: Dict[str, Dict] = {}
+        self.rescanned = 0
+        self._build()
+
+    def _load_cache(self) -> Dict[str, Dict]:
+        if not self.cache_file:
+            return {}
+        try:
+            with open(self.cache_file, encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if cache.get('format') != _INDEX_FORMAT or cache.get('extensions') != list(self.extensions):
+            return {}
+        return cache.get('dirs', {})
+
+    def _scan(self, directory: str) -> Dict[str, str]:
+        files = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.lower().endswith(self.extensions) and entry.is_file():
+                        files.setdefault(entry.name.lower(), entry.name)
+        except OSError:
+            pass
+        return files
+
+    def _build(self) -> None:
+        cached = self._load_cache()
+        for directory in self.search_paths:
+            try:
+                mtime = os.stat(directory).st_mtime_ns
+            except OSError:
+                continue
+            key = os.path.normcase(os.path.abspath(directory))
+            entry = cached.get(key)
+            if entry is None or entry['mtime'] != mtime:
+                entry = {'mtime': mtime, 'files': self._scan(directory)}
+                self.rescanned += 1
+            self._dirs[key] = entry
+
+        if self.cache_file and self.rescanned:
+            self.save()
+
+    def save(self) -> None:
+        """
+        Persists the index to its cache file.
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(self.cache_file)), exist_ok=True)
+        staging = f'{self.cache_file}.tmp'
+        with open(staging, 'w', encoding='utf-8') as f:
+            json.dump({'format': _INDEX_FORMAT, 'extensions': list(self.extensions), 'dirs': self._dirs}, f)
+        os.replace(staging, self.cache_file)
+
+    def find(self, dll_name: str) -> Optional[str]:
+        """
+        Returns the full path of the first DLL with that name in search
+        order, or None if it is not found.
+        """
+        name = dll_name.lower()
+        for directory in self.search_paths:
+            entry = self._dirs.get(os.path.normcase(os.path.abspath(directory)))
+            if entry and name in entry['files']:
+                return os.path.join(directory, entry['files'][name])
+        return None
+
+    def find_many(self, dll_names: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        Looks up several DLLs at once.
+
+        Returns:
+            dict: {dll_name: full path or None}
+        """
+        return {dll_name: self.find(dll_name) for dll_name in dll_names}
+
+
+def verify_copy(source: str, destination: str) -> bool:
+    """
+    Checks that a copied file has the same content as its source.
+    """
+    return file_digest(source) == file_digest(destination)
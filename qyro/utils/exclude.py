@@ -0,0 +1,194 @@
+import os
+import re
+import fnmatch
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+_GLOB_CHARS = re.compile(r'[*?\[]')
+
+
+class _TrieNode:
+    __slots__ = ('literals', 'globs', 'globstar', 'rules', 'is_globstar')
+
+    def __init__(self, is_globstar: bool = False):
+        self.is_globstar = is_globstar
+        self.literals: Dict[str, '_TrieNode'] = {}
+        self.globs: List[Tuple[re.Pattern, '_TrieNode']] = []
+        self.globstar: Optional['_TrieNode'] = None
+        # (order, negated, dir_only) of every pattern ending at this node
+        self.rules: List[Tuple[int, bool, bool]] = []
+
+
+class ExcludeMatcher:
+    """
+    A compiled set of gitignore-style exclude patterns.
+
+    Patterns are split into path segments and stored in a trie, so a query
+    only follows the branches that can still match instead of testing every
+    pattern. Supported syntax:
+
+    - 'name' matches a file or directory with that name at any depth.
+    - 'name/' matches directories only.
+    - 'a/b' or '/a/b' is anchored to the root of the walk.
+    - '*', '?' and '[...]' match within a segment, '**' matches any number of segments.
+    - '!pattern' re-includes files excluded by an earlier pattern. As in git,
+      a file cannot be re-included if one of its parent directories is excluded.
+    """
+
+    def __init__(self, patterns: Iterable[str] = ()):
+        self._root = _TrieNode()
+        self._glob_cache: Dict[str, re.Pattern] = {}
+        self.patterns: List[str] = []
+        for pattern in patterns:
+            self.add(pattern)
+
+    def __bool__(self):
+        return bool(self.patterns)
+
+    def add(self, pattern: str) -> None:
+        """
+        Compiles a pattern into the trie. Blank lines and '#' comments are ignored.
+        """
+        pattern = pattern.strip()
+        if not pattern or pattern.startswith('#'):
+            return
+
+        negated = pattern.startswith('!')
+        if negated:
+            pattern = pattern[1:]
+        dir_only = pattern.endswith('/')
+        # A slash anywhere but at the end anchors the pattern to the root
+        anchored = '/' in pattern.rstrip('/')
+        pattern = pattern.strip('/')
+
+        segments = [s for s in pattern.split('/') if s]
+        if not anchored:
+            segments = ['**'] + segments
+
+        node = self._root
+        for segment in segments:
+            if segment == '**':
+                if node.globstar is None:
+                    node.globstar = _TrieNode(is_globstar=True)
+                node = node.globstar
+            elif _GLOB_CHARS.search(segment):
+                regex = self._compile_glob(segment)
+                for existing, child in node.globs:
+                    if existing is regex:
+                        node = child
+                        break
+                else:
+                    child = _TrieNode()
+                    node.globs.append((regex, child))
+                    node = child
+            else:
+                node = node.literals.setdefault(segment, _TrieNode())
+
+        node.rules.append((len(self.patterns), negated, dir_only))
+        self.patterns.append(('!' if negated else '') + pattern)
+
+    def _compile_glob(self, segment: str) -> re.Pattern:
+        if segment not in self._glob_cache:
+            self._glob_cache[segment] = re.compile(fnmatch.translate(segment))
+        return self._glob_cache[segment]
+
+    @staticmethod
+    def _closure(nodes: List[_TrieNode]) -> List[_TrieNode]:
+        # '**' may match zero segments
+        closed = {}
+        for node in nodes:
+            closed[id(node)] = node
+            if node.globstar is not None:
+                closed[id(node.globstar)] = node.globstar
+        return list(closed.values())
+
+    def match_parts(self, parts: List[str], is_dir: bool = False) -> bool:
+        """
+        Checks a path already split into segments, without checking its
+        parent directories. Walks that prune excluded directories use this
+        to avoid splitting and rechecking every prefix.
+
+        Args:
+            parts (list[str]): The path segments relative to the root of the walk.
+            is_dir (bool): Whether the path is a directory.
+        """
+        states = self._closure([self._root])
+        for part in parts:
+            next_states = []
+            for node in states:
+                child = node.literals.get(part)
+                if child is not None:
+                    next_states.append(child)
+                for regex, child in node.globs:
+                    if regex.match(part):
+                        next_states.append(child)
+                if node.is_globstar:
+                    next_states.append(node)
+            if not next_states:
+                return False
+            states = self._closure(next_states)
+
+        winner = None
+        for node in states:
+            for order, negated, dir_only in node.rules:
+                if dir_only and not is_dir:
+                    continue
+                if winner is None or order > winner[0]:
+                    winner = (order, negated)
+        return winner is not None and not winner[1]
+
+    def matches(self, rel_path: str, is_dir: bool = False) -> bool:
+        """
+        Checks a single path relative to the root of the walk. The path is
+        also excluded when any of its parent directories is.
+
+        Args:
+            rel_path (str): Relative path with '/' or os.sep separators.
+            is_dir (bool): Whether the path is a directory.
+        """
+        if not self.patterns:
+            return False
+        parts = [p for p in rel_path.replace(os.sep, '/').split('/') if p and p != '.']
+        for depth in range(1, len(parts)):
+            if self.match_parts(parts[:depth], True):
+                return True
+        return self.match_parts(parts, is_dir)
+
+
+def walk_files(root: str, matcher: Optional[ExcludeMatcher] = None,
+               skip: Iterable[str] = ()) -> Iterator[Tuple[str, str]]:
+    """
+    Walks a directory with os.scandir, in sorted order, without descending
+    into excluded directories. Symlinked directories are not followed;
+    symlinks to files are yielded like files.
+
+    Args:
+        root (str): The directory to walk.
+        matcher (ExcludeMatcher, optional): Patterns relative to root.
+        skip (Iterable[str]): Absolute paths of files or directories to leave out.
+
+    Yields:
+        tuple[str, str]: (absolute path, path relative to root with '/' separators)
+    """
+    skip = {os.path.normcase(os.path.abspath(p)) for p in skip}
+    stack = [(root, '')]
+    while stack:
+        directory, rel_dir = stack.pop()
+        with os.scandir(directory) as entries:
+            entries = sorted(entries, key=lambda e: e.name)
+
+        subdirectories = []
+        for entry in entries:
+            rel_path = f"{rel_dir}{entry.name}"
+            if skip and os.path.normcase(entry.path) in skip:
+                continue
+            # Symlinked directories are not followed, so links pointing back
+            # up the tree cannot make the walk loop
+            is_dir = entry.is_dir(follow_symlinks=False)
+            if matcher and matcher.match_parts(rel_path.split('/'), is_dir):
+                continue
+            if is_dir:
+                subdirectories.append((entry.path, rel_path + '/'))
+            elif entry.is_file():
+                yield entry.path, rel_path
+        # Reversed so directories are visited in sorted order
+        stack.extend(reversed(subdirectories))
@@ -8,10 +8,13 @@ import json
 from os.path import exists
 from pathlib import Path
 from typing import Dict
-from typing import Dict, List, Tuple, Union, Callable
+from typing import Dict, List, Tuple, Union, Callable, NamedTuple
+from concurrent.futures import ThreadPoolExecutor
 from rich.prompt import Confirm
 from rich.console import Console
 from qyro._store import QYRO_INTERNAL_STATE
+from qyro.utils.exclude import ExcludeMatcher, walk_files
+from qyro.utils.cache import link_from_store
 from ..utils import EngineMessage, EngineError
 from os import makedirs
 from os.path import dirname
@@ -44,6 +47,7 @@ class _PathCollection:
                     self.paths.append(resolved_path)
             except Exception as e:
                 EngineError(f" Could not resolve path '{path_str}': {e}")
+        self._lookup = set(self.paths)
 
     def __contains__(self, other_path):
         """
@@ -63,16 +67,10 @@ class _PathCollection:
         except Exception:
             return False
 
-        for registered_path in self.paths:
-            if registered_path == other_path_obj:
-                return True
-            try:
-                if other_path_obj.is_relative_to(registered_path):
-                    return True
-            except ValueError:
-                continue
-
-        return False
+        # Walk up the parents instead of testing every registered path
+        return other_path_obj in self._lookup or any(
+            parent in self._lookup for parent in other_path_obj.parents
+        )
 
 def _load_package_json() -> dict:
     """
@@ -101,34 +99,102 @@ def _expand_placeholders(text: str, replacements: Dict[str, str]) -> str:
 def _get_files_to_replicate(
     source: pathlib.Path,
     destination: pathlib.Path,
-    exclude: List[str]
+    exclude: List[str],
+    exclude_patterns: List[str] = None
 ) -> List[Tuple[pathlib.Path, pathlib.Path]]:
     """
     Generates a list of files to be copied, respecting exclusions.
+
+    Excluded directories are pruned during the walk, so their contents are
+    never listed.
     """
-    files_to_copy = []
-    # Ensure exclusions are absolute paths for accurate comparison
-    exclude_paths = [pathlib.Path(p) for p in exclude]
+    matcher = ExcludeMatcher(exclude_patterns or [])
+    exclude_paths = _PathCollection(exclude) if exclude else None
 
     if source.is_file():
-        if source not in exclude_paths:
-            files_to_copy.append((source, destination / source.name))
-    elif source.is_dir():
-        for item in source.rglob('*'):
-            if item.is_file():
-                relative_path = item.relative_to(source)
-                dest_path = destination / relative_path
-                if item not in exclude_paths:
-                    files_to_copy.append((item, dest_path))
+        if not matcher.matches(source.name) and not (exclude_paths and source in exclude_paths):
+            return [(source, destination / source.name)]
+        return []
+
+    files_to_copy = []
+    if source.is_dir():
+        skip = exclude_paths.paths if exclude_paths else ()
+        for item, relative_path in walk_files(str(source), matcher, skip):
+            files_to_copy.append((pathlib.Path(item), destination.joinpath(*relative_path.split('/'))))
     return files_to_copy
 
 
+class CopyTask(NamedTuple):
+    source: pathlib.Path
+    destination: pathlib.Path
+    # Whether ${...} placeholders are expanded while copying
+    filtered: bool
+
+
+def _plan_replication(
+    source: pathlib.Path,
+    destination: pathlib.Path,
+    files_to_filter: List[str],
+    exclude: List[str],
+    exclude_patterns: List[str] = None
+) -> List[CopyTask]:
+    """
+    Lists the copy tasks of replicate_and_filter without touching the destination.
+    """
+    relative_files_to_filter = {pathlib.Path(p) for p in files_to_filter}
+    base = source if source.is_dir() else source.parent
+    return [
+        CopyTask(src, dest, src.relative_to(base) in relative_files_to_filter or dest.suffix.lower() == '.py')
+        for src, dest in _get_files_to_replicate(source, destination, exclude, exclude_patterns)
+    ]
+
+
+def _run_copy_task(task: CopyTask, replacements: Dict[str, str], content_store: str = None) -> None:
+    if task.filtered:
+        with open(task.source, 'r') as f_in:
+            content = f_in.read()
+        with open(task.destination, 'w') as f_out:
+            f_out.write(_expand_placeholders(content, replacements))
+    elif content_store:
+        link_from_store(str(task.source), str(task.destination), content_store)
+    else:
+        shutil.copy2(task.source, task.destination)
+
+
+def run_copy_tasks(tasks: List[CopyTask], replacements: Dict[str, str], max_workers: int = 1,
+                   content_store: str = None) -> None:
+    """
+    Runs copy tasks, on a thread pool when max_workers > 1. Copying many
+    small files is I/O bound, so threads overlap the system calls well.
+
+    Args:
+        tasks (list[CopyTask]): The tasks to run. Destinations must be unique.
+        replacements (dict): Values for the placeholders of filtered files.
+        max_workers (int): Maximum number of copying threads.
+        content_store (str, optional): A content-addressed store that unfiltered
+                                       files are hardlinked from (see link_from_store).
+    """
+    # Create the directories first so the workers never race on them
+    for parent in sorted({task.destination.parent for task in tasks}):
+        parent.mkdir(parents=True, exist_ok=True)
+
+    if max_workers <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            _run_copy_task(task, replacements, content_store)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for future in [pool.submit(_run_copy_task, task, replacements, content_store) for task in tasks]:
+            future.result()
+
+
 def replicate_and_filter(
     source_path: Union[str, pathlib.Path],
     destination_path: Union[str, pathlib.Path],
     replacements: Dict[str, str] = None,
     files_to_filter: List[str] = None,  # Ahora espera rutas relativas
-    exclude: List[str] = None
+    exclude: List[str] = None,
+    exclude_patterns: List[str] = None
 ) -> None:
     """
     Copies files and directories from a source to a destination, applying filters.
@@ -137,42 +203,13 @@ def replicate_and_filter(
     :param replacements: A dictionary for substituting placeholders.
     :param files_to_filter: A list of files in which text replacement will be applied (relative paths).
     :param exclude: A list of files or directories to exclude from the copy.
+    :param exclude_patterns: Gitignore-style patterns, relative to the source, to exclude from the copy.
     """
     source = pathlib.Path(source_path).resolve()
     destination = pathlib.Path(destination_path).resolve()
 
-    if replacements is None:
-        replacements = {}
-    if files_to_filter is None:
-        files_to_filter = []
-    if exclude is None:
-        exclude = []
-
-    files = _get_files_to_replicate(source, destination, exclude)
-
-    # --- CAMBIO AQUÍ: Usar rutas relativas para la comparación ---
-    relative_files_to_filter = [pathlib.Path(p) for p in files_to_filter]
-
-    for src, dest in files:
-        dest.parent.mkdir(parents=True, exist_ok=True)
-
-        relative_src_path = src.relative_to(source)
-
-        if relative_src_path in relative_files_to_filter:
-            with open(src, 'r') as f_in:
-                content = f_in.read()
-            filtered_content = _expand_placeholders(content, replacements)
-            with open(dest, 'w') as f_out:
-                f_out.write(filtered_content)
-        else:
-            shutil.copy2(src, dest)
-
-        if dest.suffix.lower() in ['.py']:
-            with open(dest, 'r') as f_in:
-                content = f_in.read()
-            filtered_content = _expand_placeholders(content, replacements)
-            with open(dest, 'w') as f_out:
-                f_out.write(filtered_content)
+    tasks = _plan_replication(source, destination, files_to_filter or [], exclude or [], exclude_patterns)
+    run_copy_tasks(tasks, replacements or {})
 
 def resolve_path(relative_path: str, replacements: Dict[str, str] = None) -> pathlib.Path:
     """
@@ -250,6 +287,27 @@ def check_existing_project():
         )
     return True
 
+def plan_copy_and_filter(callback: Callable[[str], Path], src: str, dst: str) -> List[CopyTask]:
+    """
+    Plans the copy tasks of _copy_and_filter without running them.
+
+    Returns:
+        list[CopyTask]: The tasks, empty if the source does not exist.
+    """
+    source_path = callback(src)
+    if not exists(source_path):
+        return []
+
+    settings = QYRO_INTERNAL_STATE.get_config('settings')
+    return _plan_replication(
+        pathlib.Path(source_path).resolve(),
+        Path(dst).resolve(),
+        files_to_filter=[callback(f) for f in settings.get('files_to_filter', [])],
+        exclude=[],
+        exclude_patterns=settings.get('exclude', [])
+    )
+
+
 def _copy_and_filter(callback: Callable[[str], Path], src: str, dst: str) -> bool:
     source_path = callback(src)
     destination_path = Path(dst).resolve()
@@ -262,7 +320,8 @@ def _copy_and_filter(callback: Callable[[str], Path], src: str, dst: str) -> boo
             source_path=source_path,
             destination_path=destination_path,
             replacements=settings,
-            files_to_filter=files_to_filter
+            files_to_filter=files_to_filter,
+            exclude_patterns=settings.get('exclude', [])
         )
         return True
     return False
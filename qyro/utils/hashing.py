@@ -0,0 +1,71 @@
+import os
+import hashlib
+from pathlib import Path
+from typing import Iterable, Union
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+def file_digest(file_path: Union[str, Path], algorithm: str = 'sha256') -> str:
+    """
+    Computes the hex digest of a file, reading it in fixed-size chunks.
+
+    Args:
+        file_path (str | Path): The file to hash.
+        algorithm (str): Any algorithm supported by hashlib.
+
+    Returns:
+        str: The hexadecimal digest of the file contents.
+    """
+    digest = hashlib.new(algorithm)
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def iter_tree_files(root: Union[str, Path]) -> Iterable[str]:
+    """
+    Yields the relative paths (with '/' separators) of every file under
+    root, in sorted order so the result is stable across platforms.
+    """
+    root = str(root)
+    if os.path.isfile(root):
+        yield os.path.basename(root)
+        return
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        rel_dir = os.path.relpath(dirpath, root)
+        for filename in sorted(filenames):
+            rel_path = filename if rel_dir == '.' else os.path.join(rel_dir, filename)
+            yield rel_path.replace(os.sep, '/')
+
+
+def tree_digest(roots: Union[str, Path, Iterable[Union[str, Path]]], algorithm: str = 'sha256') -> str:
+    """
+    Computes a single digest over the contents and relative layout of one or
+    more directory trees. Missing roots are skipped, so the digest can be
+    used for optional source folders.
+
+    Args:
+        roots (str | Path | Iterable): A directory (or file), or a list of them.
+        algorithm (str): Any algorithm supported by hashlib.
+
+    Returns:
+        str: The hexadecimal digest of the trees.
+    """
+    if isinstance(roots, (str, Path)):
+        roots = [roots]
+
+    digest = hashlib.new(algorithm)
+    for root in roots:
+        root = Path(root)
+        if not root.exists():
+            continue
+        digest.update(root.name.encode('utf-8') + b'\0')
+        base = root.parent if root.is_file() else root
+        for rel_path in iter_tree_files(root):
+            digest.update(rel_path.encode('utf-8') + b'\0')
+            digest.update(file_digest(base / rel_path, algorithm).encode('ascii'))
+    return digest.hexdigest()
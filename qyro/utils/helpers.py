@@ -19,3 +19,45 @@ def valid_version(version_str):
         return ".".join(parts)
 
     return None
+
+
+def format_size(num_bytes: int) -> str:
+    """
+    Formats a byte count as a short human-readable string (e.g. '12.3 MB').
+
+    Args:
+        num_bytes (int): The number of bytes.
+
+    Returns:
+        str: The formatted size.
+    """
+    size = float(num_bytes)
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if abs(size) < 1024 or unit == 'GB':
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+_SIZE_UNITS = {'': 1, 'b': 1, 'k': 1024, 'm': 1024 ** 2, 'g': 1024 ** 3, 't': 1024 ** 4}
+
+
+def parse_size(size_str) -> int:
+    """
+    Parses a human-readable size such as '500MB', '2G', '1.5 GiB' or '1024'.
+    Units are binary (1 KB = 1024 bytes).
+
+    Args:
+        size_str (str or int): The size to parse.
+
+    Returns:
+        int: The size in bytes.
+
+    Raises:
+        ValueError: If the size cannot be parsed.
+    """
+    if isinstance(size_str, (int, float)):
+        return int(size_str)
+    match = re.match(r'^\s*(\d+(?:\.\d+)?)\s*([kmgt]?)(?:i?b)?\s*$', str(size_str), re.IGNORECASE)
+    if not match:
+        raise ValueError(f"Invalid size: '{size_str}'")
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2).lower()])
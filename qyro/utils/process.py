@@ -0,0 +1,145 @@
+import re
+import asyncio
+import subprocess
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+from rich.console import Console
+from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
+
+_READ_SIZE = 64 * 1024
+# Chunks waiting to be written to the log; the reader pauses when it is full
+_LOG_QUEUE_SIZE = 32
+# Longest partial line kept while waiting for its newline
+_MAX_LINE = 64 * 1024
+
+# PyInstaller log markers, in the order the build goes through them
+PYINSTALLER_PHASES: Tuple[Tuple[str, re.Pattern], ...] = (
+    ('Analyzing the application', re.compile(r'INFO: (Building Analysis|Initializing module dependency graph|Analyzing )')),
+    ('Running module hooks', re.compile(r'INFO: (Processing (standard )?module hook|Processing pre-)')),
+    ('Collecting binaries', re.compile(r'INFO: Looking for dynamic libraries')),
+    ('Building the Python archive', re.compile(r'INFO: Building PYZ')),
+    ('Building the package', re.compile(r'INFO: Building PKG')),
+    ('Building the executable', re.compile(r'INFO: Building EXE')),
+    ('Collecting the output', re.compile(r'INFO: Building (COLLECT|BUNDLE)')),
+    ('Done', re.compile(r'INFO: Build complete')),
+)
+
+# Nuitka progress messages, in the same format
+NUITKA_PHASES: Tuple[Tuple[str, re.Pattern], ...] = (
+    ('Compiling Python', re.compile(r'Nuitka: Starting Python compilation')),
+    ('Generating C code', re.compile(r'Nuitka: (Completed Python level compilation|Generating source code)')),
+    ('Compiling C code', re.compile(r'Nuitka: Running C compilation')),
+    ('Packing the executable', re.compile(r'Nuitka-Onefile: |Creating single file')),
+    ('Done', re.compile(r'Nuitka: Successfully created')),
+)
+
+
+class _PhaseTracker:
+    """
+    Maps output lines to the furthest phase reached so far.
+    """
+
+    def __init__(self, phases: Sequence[Tuple[str, re.Pattern]]):
+        self.phases = phases
+        self.current = -1
+
+    def feed(self, line: str) -> bool:
+        for index in range(len(self.phases) - 1, self.current, -1):
+            if self.phases[index][1].search(line):
+                self.current = index
+                return True
+        return False
+
+
+async def _read_output(stream: asyncio.StreamReader, log_queue: asyncio.Queue, on_line) -> None:
+    partial = b''
+    while True:
+        chunk = await stream.read(_READ_SIZE)
+        if not chunk:
+            break
+        await log_queue.put(chunk)
+
+        lines = (partial + chunk).split(b'\n')
+        partial = lines.pop()[-_MAX_LINE:]
+        for line in lines:
+            on_line(line.decode('utf-8', errors='replace').rstrip('\r'))
+    if partial:
+        on_line(partial.decode('utf-8', errors='replace').rstrip('\r'))
+    await log_queue.put(None)
+
+
+async def _write_log(log_file, log_queue: asyncio.Queue) -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        chunk = await log_queue.get()
+        if chunk is None:
+            break
+        await loop.run_in_executor(None, log_file.write, chunk)
+
+
+async def _run(arguments: List[str], log_file, on_line, env) -> int:
+    process = await asyncio.create_subprocess_exec(
+        *arguments, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT, env=env
+    )
+    log_queue = asyncio.Queue(maxsize=_LOG_QUEUE_SIZE)
+    await asyncio.gather(
+        _read_output(process.stdout, log_queue, on_line),
+        _write_log(log_file, log_queue)
+    )
+    return await process.wait()
+
+
+def run_streamed(
+    arguments: List[str],
+    log_path: Union[str, Path],
+    echo: bool = False,
+    phases: Optional[Sequence[Tuple[str, re.Pattern]]] = None,
+    description: str = 'Working',
+    tail_lines: int = 200,
+    env: Optional[Dict[str, str]] = None
+) -> None:
+    """
+    Runs a command, streaming its combined output to a log file.
+
+    Output is read asynchronously in fixed-size chunks and handed to the log
+    writer through a bounded queue, so memory use stays constant however
+    long the log gets. When phases are given, a live progress bar follows
+    the markers found in the output.
+
+    Args:
+        arguments (list[str]): The command to run.
+        log_path (str | Path): The log file to write.
+        echo (bool): Prints every output line as well.
+        phases (Sequence, optional): (label, regex) pairs, in order, e.g. PYINSTALLER_PHASES.
+        description (str): Progress label until the first phase is reached.
+        tail_lines (int): Lines kept for the error raised on failure.
+        env (dict, optional): Environment of the command. Defaults to the current one.
+
+    Raises:
+        subprocess.CalledProcessError: If the command fails. Its output holds
+                                       the last lines of the log.
+    """
+    console = Console()
+    tail = deque(maxlen=tail_lines)
+    tracker = _PhaseTracker(phases or ())
+
+    progress = Progress(
+        SpinnerColumn(), TextColumn('{task.description}'), BarColumn(), TimeElapsedColumn(),
+        console=console, transient=True, disable=not phases
+    )
+    task = progress.add_task(description, total=len(tracker.phases) or None)
+
+    def on_line(line: str) -> None:
+        tail.append(line)
+        if echo:
+            progress.console.print(line, markup=False, highlight=False)
+        if tracker.feed(line):
+            label = tracker.phases[tracker.current][0]
+            progress.update(task, description=label, completed=tracker.current + 1)
+
+    with open(log_path, 'wb') as log_file, progress:
+        returncode = asyncio.run(_run(arguments, log_file, on_line, env))
+
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, arguments, output='\n'.join(tail))
@@ -0,0 +1,146 @@
+import os
+import time
+import shutil
+import subprocess
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Dict, List
+from qyro._store import QYRO_INTERNAL_STATE
+
+# 1980-01-01, the earliest timestamp zip archives can store
+_FALLBACK_EPOCH = 315532800
+
+
+def reproducible_enabled() -> bool:
+    settings = QYRO_INTERNAL_STATE.get_config('settings') or {}
+    return bool(settings.get('reproducible', False))
+
+
+def source_date_epoch() -> int:
+    """
+    Returns the timestamp that reproducible builds stamp on their output:
+    SOURCE_DATE_EPOCH if it is set, otherwise the time of the last git
+    commit of the project, otherwise 1980-01-01.
+    """
+    value = os.environ.get('SOURCE_DATE_EPOCH')
+    if value:
+        return int(value)
+    return _last_commit_time((QYRO_INTERNAL_STATE.get_config('settings') or {}).get('project_dir'))
+
+
+@lru_cache(maxsize=None)
+def _last_commit_time(project_dir: str) -> int:
+    # Cached, since archive writers ask for the timestamp once per member
+    try:
+        result = subprocess.run(
+            ['git', 'log', '-1', '--format=%ct'], capture_output=True, text=True, timeout=10, cwd=project_dir
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            return int(result.stdout.strip())
+    except (OSError, ValueError, subprocess.SubprocessError):
+        pass
+    return _FALLBACK_EPOCH
+
+
+def build_timestamp() -> int:
+    """
+    Returns the mtime for files generated by the build: the source date epoch
+    in reproducible mode, otherwise the current time.
+    """
+    return source_date_epoch() if reproducible_enabled() else int(time.time())
+
+
+def reproducible_env() -> Dict[str, str]:
+    """
+    Returns the environment for freezer subprocesses. In reproducible mode it
+    pins SOURCE_DATE_EPOCH and the hash seed, which PyInstaller needs to
+    write identical archives.
+    """
+    env = dict(os.environ)
+    if reproducible_enabled():
+        env['SOURCE_DATE_EPOCH'] = str(source_date_epoch())
+        env['PYTHONHASHSEED'] = '0'
+    return env
+
+
+def _unshare(paths: List[str]) -> None:
+    """
+    Gives a set of hardlinked paths their own inode, still shared among
+    them, so changing its metadata does not affect links outside the tree.
+    """
+    first = paths[0]
+    staging = f'{first}.qyro-unshare'
+    shutil.copy2(first, staging)
+    os.replace(staging, first)
+    for other in paths[1:]:
+        try:
+            os.link(first, staging)
+        except OSError:
+            shutil.copy2(first, staging)
+        os.replace(staging, other)
+
+
+def normalize_tree(root: str, epoch: int) -> None:
+    """
+    Sets the mtime of every file and directory under root to epoch.
+    Directories are visited after their contents, so their own mtimes stay
+    normalized.
+
+    Files hardlinked from outside root, e.g. by the content store, get their
+    own copy first unless they already carry epoch: changing the shared
+    inode would also change the store object and every other project
+    linked to it. Hardlinks within root, e.g. from deduplication, are kept.
+    """
+    inodes = defaultdict(list)
+    for dirpath, dirnames, filenames in os.walk(root):
+        for name in filenames:
+            file_path = os.path.join(dirpath, name)
+            st = os.lstat(file_path)
+            if st.st_nlink > 1 and not os.path.islink(file_path):
+                inodes[(st.st_dev, st.st_ino)].append((file_path, st))
+    for links in inodes.values():
+        file_path, st = links[0]
+        if len(links) < st.st_nlink and int(st.st_mtime) != epoch:
+            _unshare([link for link, _ in links])
+
+    for dirpath, dirnames, filenames in os.walk(root, topdown=False):
+        for name in sorted(filenames) + sorted(dirnames):
+            os.utime(os.path.join(dirpath, name), (epoch, epoch), follow_symlinks=False)
+    os.utime(root, (epoch, epoch))
+
+
+def sorted_repr(value: Any) -> str:
+    """
+    Like repr(), but with dictionary keys and sets in sorted order, so the
+    same data always produces the same source text.
+    """
+    if isinstance(value, dict):
+        items = ', '.join(f'{sorted_repr(k)}: {sorted_repr(v)}' for k, v in sorted(value.items(), key=lambda i: str(i[0])))
+        return '{' + items + '}'
+    if isinstance(value, (list, tuple)):
+        items = ', '.join(sorted_repr(v) for v in value)
+        return f'[{items}]' if isinstance(value, list) else f"({items}{',' if len(value) == 1 else ''})"
+    if isinstance(value, (set, frozenset)):
+        return '{' + ', '.join(sorted_repr(v) for v in sorted(value, key=repr)) + '}' if value else 'set()'
+    return repr(value)
+
+
+def diff_manifests(first: Dict[str, Any], second: Dict[str, Any]) -> List[str]:
+    """
+    Compares two manifests from qyro_engine.updater.manifest.build_manifest.
+
+    Returns:
+        list[str]: One line per difference, empty if the trees are identical.
+    """
+    differences = []
+    a, b = first['files'], second['files']
+    for rel_path in sorted(set(a) | set(b)):
+        if rel_path not in b:
+            differences.append(f'only in the first build: {rel_path}')
+        elif rel_path not in a:
+            differences.append(f'only in the second build: {rel_path}')
+        elif a[rel_path]['sha256'] != b[rel_path]['sha256']:
+            differences.append(f'content differs: {rel_path}')
+        elif a[rel_path]['mode'] != b[rel_path]['mode']:
+            differences.append(f'mode differs: {rel_path}')
+    return differences
@@ -1,10 +1,14 @@
 import os
 import sys
 from typing import Dict, Any, List
+import json
 from qyro_engine.utils.platform import mac_based
+from qyro_engine.utils.frozen import app_is_frozen
 
 # Dictionary injected at runtime by a packaging script or PyInstaller hook
 BUILD_SETTINGS: Dict[str, Any] = {}
+# Freezers without runtime hooks (Nuitka) ship the settings in this file instead
+BUILD_SETTINGS_FILE = 'qyro_build_settings.json'
 
 def get_frozen_resource_dirs() -> List[str]:
     """
@@ -18,9 +22,9 @@ def get_frozen_resource_dirs() -> List[str]:
         List[str]: A list of absolute paths to resource directories.
     """
     application = os.path.dirname(sys.executable)
-    if getattr(sys, 'frozen', False) and mac_based():
+    if app_is_frozen() and mac_based():
         return [os.path.join(application, os.pardir, 'Resources')]
-    elif getattr(sys, 'frozen', False):
+    elif app_is_frozen():
         return [application]
     else:
         return [os.path.dirname(os.path.abspath(__file__))]
@@ -35,4 +39,9 @@ def load_frozen_build_settings() -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: The global BUILD_SETTINGS dictionary.
     """
+    if not BUILD_SETTINGS:
+        settings_file = os.path.join(os.path.dirname(sys.executable), BUILD_SETTINGS_FILE)
+        if os.path.exists(settings_file):
+            with open(settings_file, encoding='utf-8') as f:
+                BUILD_SETTINGS.update(json.load(f))
     return BUILD_SETTINGS
@@ -14,12 +14,26 @@ def find_project_root_directory():
         "Could not determine the project base directory. Expected 'src/main/python'.")
 
 
+def _generated_icons_dir(project_base_dir):
+    cache_dir = Path(project_base_dir) / 'target' / '.cache' / 'icons'
+    try:
+        name = (cache_dir / 'CURRENT').read_text(encoding='utf-8').strip()
+    except OSError:
+        return None
+    generated = cache_dir / name
+    return str(generated) if name and generated.is_dir() else None
+
+
 def get_project_resource_locations(project_base_dir):
 
     icons_dir = Path(project_base_dir) / 'src' / 'main' / 'icons'
     resources_base = Path(project_base_dir) / 'src' / 'main' / 'resources'
 
     resource_dirs = [str(icons_dir)]
+    # Icons generated from the 'icon_source' setting by the last build
+    generated = _generated_icons_dir(project_base_dir)
+    if generated:
+        resource_dirs.insert(0, generated)
     profiles = generate_core_profiles()
 
     for profile in reversed(profiles):
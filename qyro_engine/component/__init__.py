@@ -101,6 +101,9 @@ class Component:
     def get_resource(self, *rel_path):
         return self.get_resource_locator.find(*rel_path)
 
+    def get_resource_data(self, *rel_path):
+        return self.get_resource_locator.read(*rel_path)
+
     def _clear_widgets(self):
         """
             Clear all child widgets except for the main widget.
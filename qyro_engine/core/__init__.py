@@ -1,3 +1,4 @@
+import os
 import importlib
 from functools import lru_cache, wraps
 from typing import Callable, TypeVar, Any
@@ -18,6 +19,8 @@ logger = logging.getLogger(__name__)
 _T = TypeVar('_T')
 QtBinding = namedtuple('QtBinding', ['QApplication', 'QIcon', 'QAbstractSocket'])
 available_bindings = {}
+# Set by 'qyro bench': the app quits as soon as its event loop starts
+BENCH_EXIT_ENV = 'QYRO_BENCH_EXIT'
 
 def lazy_property(func: Callable[[Any], _T]) -> _T:
     @wraps(func)
@@ -84,6 +87,10 @@ class _AppEngine:
         self.install_exception_hook()
         self.setup_signal_handler()
 
+        if os.environ.get(BENCH_EXIT_ENV):
+            core = importlib.import_module(f'{self._qt_binding}.QtCore')
+            core.QTimer.singleShot(0, self.app.quit)
+
     @staticmethod
     def _validate_qt_binding(binding_name: str, binding: QtBinding):
         if not isinstance(binding, QtBinding):
@@ -117,6 +124,9 @@ class _AppEngine:
     def _resource(self, path):
         return self.get_resource_locator.find(path)
 
+    def _resource_data(self, path):
+        return self.get_resource_locator.read(path)
+
     @lazy_property
     def set_app_icon(self):
         if mac_based():
@@ -1,2 +1,3 @@
 from .ppg_store import PPGStore
-from .pydux import Pydux
\ No newline at end of file
+from .pydux import Pydux
+from .hamt import HamtMap, PVector
\ No newline at end of file
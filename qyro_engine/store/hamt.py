@@ -0,0 +1,363 @@
+"""
+Persistent (immutable) collections with structural sharing.
+
+HamtMap is a hash array mapped trie: every update returns a new map that
+shares all untouched nodes with the old one, so an update costs O(log n)
+and keeping old versions around costs only what changed. PVector is the
+sequence counterpart, a 32-way trie indexed by position.
+"""
+from collections.abc import Mapping, Sequence
+from typing import Any, Iterable, Iterator, Tuple
+
+_BITS = 5
+_WIDTH = 1 << _BITS
+_MASK = _WIDTH - 1
+# Python hashes are 64 bits wide; below this depth only collisions remain
+_MAX_SHIFT = 64
+_HASH_MASK = (1 << 64) - 1
+_NOT_FOUND = object()
+
+
+def _hash(key: Any) -> int:
+    return hash(key) & _HASH_MASK
+
+
+def _bit_index(bitmap: int, bit: int) -> int:
+    return bin(bitmap & (bit - 1)).count('1')
+
+
+class _BitmapNode:
+    """
+    A trie node with up to 32 slots, of which only the used ones are
+    stored. A slot holds either a (key, value) pair or a child node.
+    """
+    __slots__ = ('bitmap', 'array')
+
+    def __init__(self, bitmap: int, array: list):
+        self.bitmap = bitmap
+        self.array = array
+
+    def get(self, shift: int, h: int, key: Any, default: Any) -> Any:
+        bit = 1 << ((h >> shift) & _MASK)
+        if not self.bitmap & bit:
+            return default
+        item = self.array[_bit_index(self.bitmap, bit)]
+        if isinstance(item, tuple):
+            return item[1] if item[0] is key or item[0] == key else default
+        return item.get(shift + _BITS, h, key, default)
+
+    def assoc(self, shift: int, h: int, key: Any, value: Any) -> Tuple['_BitmapNode', bool]:
+        """
+        Returns the node with key set to value, and whether a key was added.
+        Returns the node itself if nothing changed.
+        """
+        bit = 1 << ((h >> shift) & _MASK)
+        index = _bit_index(self.bitmap, bit)
+        if not self.bitmap & bit:
+            array = self.array[:]
+            array.insert(index, (key, value))
+            return _BitmapNode(self.bitmap | bit, array), True
+
+        item = self.array[index]
+        if isinstance(item, tuple):
+            if item[0] is key or item[0] == key:
+                if item[1] is value:
+                    return self, False
+                replacement, added = (key, value), False
+            else:
+                replacement, added = _merge(shift + _BITS, _hash(item[0]), item, h, (key, value)), True
+        else:
+            replacement, added = item.assoc(shift + _BITS, h, key, value)
+            if replacement is item:
+                return self, False
+
+        array = self.array[:]
+        array[index] = replacement
+        return _BitmapNode(self.bitmap, array), added
+
+    def dissoc(self, shift: int, h: int, key: Any) -> Any:
+        """
+        Returns the node without key, None if it became empty, or the node
+        itself if key was not there.
+        """
+        bit = 1 << ((h >> shift) & _MASK)
+        if not self.bitmap & bit:
+            return self
+        index = _bit_index(self.bitmap, bit)
+        item = self.array[index]
+        if isinstance(item, tuple):
+            if not (item[0] is key or item[0] == key):
+                return self
+            replacement = None
+        else:
+            replacement = item.dissoc(shift + _BITS, h, key)
+            if replacement is item:
+                return self
+
+        array = self.array[:]
+        if replacement is None:
+            del array[index]
+            return _BitmapNode(self.bitmap & ~bit, array) if array else None
+        array[index] = replacement
+        return _BitmapNode(self.bitmap, array)
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        for item in self.array:
+            if isinstance(item, tuple):
+                yield item
+            else:
+                yield from item.items()
+
+
+class _CollisionNode:
+    """
+    Holds the entries whose keys have the same full hash.
+    """
+    __slots__ = ('hash', 'entries')
+
+    def __init__(self, h: int, entries: list):
+        self.hash = h
+        self.entries = entries
+
+    def _find(self, key: Any) -> int:
+        for index, (k, _) in enumerate(self.entries):
+            if k is key or k == key:
+                return index
+        return -1
+
+    def get(self, shift, h, key, default):
+        index = self._find(key) if h == self.hash else -1
+        return self.entries[index][1] if index >= 0 else default
+
+    def assoc(self, shift, h, key, value):
+        if h != self.hash:
+            node = _BitmapNode(1 << ((self.hash >> shift) & _MASK), [self])
+            return node.assoc(shift, h, key, value)
+        index = self._find(key)
+        entries = self.entries[:]
+        if index < 0:
+            entries.append((key, value))
+            return _CollisionNode(h, entries), True
+        if entries[index][1] is value:
+            return self, False
+        entries[index] = (key, value)
+        return _CollisionNode(h, entries), False
+
+    def dissoc(self, shift, h, key):
+        index = self._find(key) if h == self.hash else -1
+        if index < 0:
+            return self
+        entries = self.entries[:index] + self.entries[index + 1:]
+        if len(entries) == 1:
+            return entries[0]
+        return _CollisionNode(h, entries)
+
+    def items(self):
+        return iter(self.entries)
+
+
+def _merge(shift: int, h1: int, item1: tuple, h2: int, item2: tuple) -> Any:
+    """
+    Builds the smallest subtree that holds two entries whose hashes agree
+    on the bits above shift.
+    """
+    if h1 == h2 or shift >= _MAX_SHIFT:
+        return _CollisionNode(h1, [item1, item2])
+    bit1 = 1 << ((h1 >> shift) & _MASK)
+    bit2 = 1 << ((h2 >> shift) & _MASK)
+    if bit1 == bit2:
+        return _BitmapNode(bit1, [_merge(shift + _BITS, h1, item1, h2, item2)])
+    return _BitmapNode(bit1 | bit2, [item1, item2] if bit1 < bit2 else [item2, item1])
+
+
+class HamtMap(Mapping):
+    """
+    An immutable mapping. set, delete and update return a new map that
+    shares every untouched node with this one.
+
+    Example:
+        a = HamtMap({'x': 1})
+        b = a.set('y', 2)    # a is unchanged
+    """
+    __slots__ = ('_root', '_count')
+
+    def __init__(self, items: Any = None):
+        self._root = _BitmapNode(0, [])
+        self._count = 0
+        if items:
+            updated = self.update(items)
+            self._root, self._count = updated._root, updated._count
+
+    @classmethod
+    def _make(cls, root: _BitmapNode, count: int) -> 'HamtMap':
+        instance = cls.__new__(cls)
+        instance._root = root
+        instance._count = count
+        return instance
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self._root.get(0, _hash(key), key, _NOT_FOUND)
+        if value is _NOT_FOUND:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self._root.get(0, _hash(key), key, default)
+
+    def __contains__(self, key: Any) -> bool:
+        return self._root.get(0, _hash(key), key, _NOT_FOUND) is not _NOT_FOUND
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Any]:
+        for key, _ in self._root.items():
+            yield key
+
+    def set(self, key: Any, value: Any) -> 'HamtMap':
+        root, added = self._root.assoc(0, _hash(key), key, value)
+        if root is self._root:
+            return self
+        return HamtMap._make(root, self._count + added)
+
+    def delete(self, key: Any) -> 'HamtMap':
+        """
+        Raises:
+            KeyError: If key is not in the map.
+        """
+        root = self._root.dissoc(0, _hash(key), key)
+        if root is self._root:
+            raise KeyError(key)
+        return HamtMap._make(root if root is not None else _BitmapNode(0, []), self._count - 1)
+
+    def update(self, items: Any) -> 'HamtMap':
+        pairs = items.items() if isinstance(items, Mapping) else items
+        result = self
+        for key, value in pairs:
+            result = result.set(key, value)
+        return result
+
+    def __repr__(self) -> str:
+        return f"HamtMap({dict(self._root.items())!r})"
+
+
+class PVector(Sequence):
+    """
+    An immutable sequence. append and set return a new vector that shares
+    every untouched node with this one.
+    """
+    __slots__ = ('_root', '_shift', '_count')
+
+    def __init__(self, items: Iterable[Any] = ()):
+        self._root = []
+        self._shift = 0
+        self._count = 0
+        if items:
+            extended = self.extend(items)
+            self._root, self._shift, self._count = extended._root, extended._shift, extended._count
+
+    @classmethod
+    def _make(cls, root: list, shift: int, count: int) -> 'PVector':
+        instance = cls.__new__(cls)
+        instance._root = root
+        instance._shift = shift
+        instance._count = count
+        return instance
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return PVector(self[i] for i in range(*index.indices(self._count)))
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('PVector index out of range')
+        node = self._root
+        for level in range(self._shift, 0, -_BITS):
+            node = node[(index >> level) & _MASK]
+        return node[index & _MASK]
+
+    def __iter__(self) -> Iterator[Any]:
+        def walk(node, level):
+            if level == 0:
+                yield from node
+            else:
+                for child in node:
+                    yield from walk(child, level - _BITS)
+        return walk(self._root, self._shift)
+
+    def append(self, value: Any) -> 'PVector':
+        root, shift = self._root, self._shift
+        if self._count == 1 << (shift + _BITS):
+            root, shift = [root], shift + _BITS
+        return PVector._make(_append(root, shift, self._count, value), shift, self._count + 1)
+
+    def extend(self, items: Iterable[Any]) -> 'PVector':
+        result = self
+        for item in items:
+            result = result.append(item)
+        return result
+
+    def set(self, index: int, value: Any) -> 'PVector':
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('PVector index out of range')
+        return PVector._make(_assign(self._root, self._shift, index, value), self._shift, self._count)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(a is b or a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"PVector({list(self)!r})"
+
+
+def _append(node: list, level: int, index: int, value: Any) -> list:
+    node = node[:]
+    if level == 0:
+        node.append(value)
+        return node
+    slot = (index >> level) & _MASK
+    if slot < len(node):
+        node[slot] = _append(node[slot], level - _BITS, index, value)
+    else:
+        node.append(_append([], level - _BITS, index, value))
+    return node
+
+
+def _assign(node: list, level: int, index: int, value: Any) -> list:
+    node = node[:]
+    slot = (index >> level) & _MASK
+    node[slot] = value if level == 0 else _assign(node[slot], level - _BITS, index, value)
+    return node
+
+
+def persistent(value: Any) -> Any:
+    """
+    Converts plain data to persistent collections: dictionaries become
+    HamtMaps and lists or tuples become PVectors, recursively.
+    """
+    if isinstance(value, (HamtMap, PVector)):
+        return value
+    if isinstance(value, dict):
+        return HamtMap((key, persistent(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return PVector(persistent(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """
+    Converts persistent collections back to dictionaries and lists.
+    """
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, PVector):
+        return [thaw(item) for item in value]
+    return value
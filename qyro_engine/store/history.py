@@ -0,0 +1,132 @@
+import sys
+import time
+from collections import deque
+from collections.abc import Mapping
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel
+from .hamt import PVector
+
+
+def approximate_size(value: Any) -> int:
+    """
+    Estimates the memory held by a value and everything it contains,
+    counting shared objects once.
+    """
+    seen = set()
+    stack = [value]
+    total = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, Mapping):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset, PVector)):
+            stack.extend(item)
+        elif isinstance(item, BaseModel):
+            stack.append(item.__dict__)
+    return total
+
+
+class _Entry:
+    __slots__ = ('keys', 'forward', 'inverse', 'size', 'timestamp')
+
+    def __init__(self, forward: Dict[str, Any], inverse: Dict[str, Any], timestamp: float):
+        self.keys = frozenset(forward)
+        self.forward = forward
+        self.inverse = inverse
+        self.size = approximate_size(forward) + approximate_size(inverse)
+        self.timestamp = timestamp
+
+
+class PatchHistory:
+    """
+    A bounded undo/redo history of store updates.
+
+    Each entry keeps only the top-level values an update changed: the new
+    ones (forward) and the old ones (inverse). The oldest entries are
+    dropped when there are more than 'limit' of them or their estimated
+    size exceeds 'memory_budget'. Consecutive updates of the same keys
+    within 'merge_window' seconds are merged into one entry, so typing in
+    a field undoes as one step.
+    """
+
+    def __init__(self, limit: int = 100, memory_budget: int = 16 * 1024 * 1024, merge_window: float = 0.0):
+        self.limit = max(1, limit)
+        self.memory_budget = memory_budget
+        self.merge_window = merge_window
+        self._entries = deque()
+        # Number of entries currently applied; the rest can be redone
+        self._position = 0
+        self._bytes = 0
+
+    def record(self, forward: Dict[str, Any], inverse: Dict[str, Any]) -> None:
+        # A new update discards the redo branch
+        while len(self._entries) > self._position:
+            self._bytes -= self._entries.pop().size
+
+        now = time.monotonic()
+        last = self._entries[-1] if self._entries else None
+        if (last is not None and self.merge_window > 0 and last.keys == frozenset(forward)
+                and now - last.timestamp <= self.merge_window):
+            self._bytes -= last.size
+            merged = _Entry(forward, last.inverse, now)
+            self._entries[-1] = merged
+            self._bytes += merged.size
+        else:
+            entry = _Entry(forward, inverse, now)
+            self._entries.append(entry)
+            self._bytes += entry.size
+            self._position += 1
+
+        while len(self._entries) > self.limit or (self._bytes > self.memory_budget and len(self._entries) > 1):
+            self._bytes -= self._entries.popleft().size
+            self._position -= 1
+
+    def undo(self) -> Optional[Dict[str, Any]]:
+        """
+        Returns the values that revert the last applied entry, or None.
+        """
+        if self._position == 0:
+            return None
+        self._position -= 1
+        return self._entries[self._position].inverse
+
+    def redo(self) -> Optional[Dict[str, Any]]:
+        """
+        Returns the values that reapply the next undone entry, or None.
+        """
+        if self._position == len(self._entries):
+            return None
+        self._position += 1
+        return self._entries[self._position - 1].forward
+
+    def recent(self, n: int) -> List[Dict[str, Any]]:
+        """
+        Describes the last n applied entries, newest first.
+        """
+        start = max(0, self._position - n)
+        return [
+            {'keys': sorted(entry.keys), 'timestamp': entry.timestamp, 'size': entry.size}
+            for entry in reversed(list(self._entries)[start:self._position])
+        ]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._position = 0
+        self._bytes = 0
+
+    @property
+    def can_undo(self) -> bool:
+        return self._position > 0
+
+    @property
+    def can_redo(self) -> bool:
+        return self._position < len(self._entries)
+
+    @property
+    def size(self) -> int:
+        return self._bytes
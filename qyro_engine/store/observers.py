@@ -0,0 +1,114 @@
+import weakref
+from typing import Any, Callable, Dict, Iterator, List
+
+
+class ObserverRef:
+    """
+    A weak reference to an observer that also dies when Qt destroys the
+    observer's widget, even if Python still holds the wrapper object.
+    Objects that do not support weak references are held strongly.
+    """
+    __slots__ = ('_ref', 'alive')
+
+    def __init__(self, observer: Any, on_dead: Callable[[], None]):
+        self.alive = True
+
+        def dead(*_):
+            if self.alive:
+                self.alive = False
+                on_dead()
+
+        try:
+            self._ref = weakref.ref(observer, dead)
+        except TypeError:
+            self._ref = lambda: observer
+
+        destroyed = getattr(observer, 'destroyed', None)
+        if destroyed is not None and hasattr(destroyed, 'connect'):
+            try:
+                destroyed.connect(dead)
+            except (TypeError, RuntimeError):
+                pass
+
+    def __call__(self) -> Any:
+        return self._ref() if self.alive else None
+
+
+class ObserverRegistry:
+    """
+    An ordered set of observers held by weak references. Observers that
+    are garbage collected or destroyed by Qt are removed automatically.
+    """
+
+    def __init__(self):
+        self._refs: Dict[int, ObserverRef] = {}
+        # Observers removed because they died rather than unsubscribed
+        self.dead = 0
+
+    def _purge(self, key: int, ref: ObserverRef) -> None:
+        if self._refs.get(key) is ref:
+            del self._refs[key]
+            self.dead += 1
+
+    def add(self, observer: Any) -> bool:
+        """
+        Returns:
+            bool: False if the observer was already registered.
+        """
+        key = id(observer)
+        current = self._refs.get(key)
+        if current is not None and current() is observer:
+            return False
+        ref = None
+
+        def on_dead():
+            self._purge(key, ref)
+
+        ref = ObserverRef(observer, on_dead)
+        self._refs[key] = ref
+        return True
+
+    def remove(self, observer: Any) -> bool:
+        """
+        Returns:
+            bool: False if the observer was not registered.
+        """
+        key = id(observer)
+        ref = self._refs.get(key)
+        if ref is None or ref() is not observer:
+            return False
+        del self._refs[key]
+        return True
+
+    def __contains__(self, observer: Any) -> bool:
+        ref = self._refs.get(id(observer))
+        return ref is not None and ref() is observer
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.live())
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+    def __bool__(self) -> bool:
+        return bool(self._refs)
+
+    def live(self) -> List[Any]:
+        """
+        Returns the registered observers that are still alive, in
+        registration order.
+        """
+        observers = []
+        for ref in list(self._refs.values()):
+            observer = ref()
+            if observer is not None:
+                observers.append(observer)
+        return observers
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns:
+            dict: {'live': registered observers, 'dead': observers purged
+                   since the registry was created}
+        """
+        return {'live': len(self._refs), 'dead': self.dead}
@@ -0,0 +1,192 @@
+import json
+import time
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict
+
+# Memory-map up to this much of the database for reads
+_MMAP_SIZE = 256 * 1024 * 1024
+_CLOSE = object()
+
+
+def apply_record(state: Dict[str, Any], record: Dict[str, Any]) -> None:
+    """
+    Applies one log record, {"set": {...}, "del": [...]}, to a state dict.
+    """
+    state.update(record.get('set', {}))
+    for key in record.get('del', ()):
+        state.pop(key, None)
+
+
+class StorePersistence:
+    """
+    Keeps a store's state in a SQLite database: a snapshot table with one
+    row per top-level key, and a write-ahead log with one row per committed
+    update.
+
+    All database work happens on a background thread that owns the
+    connection. It first restores the state, the snapshot plus the log
+    replayed on top of it, and exposes it through the 'restored' future.
+    It then appends the records passed to append(), and folds the log into
+    the snapshot whenever it grows past compact_threshold records.
+    Callers therefore never wait for the disk.
+
+    If the database fails after the restore, the thread stops and the error
+    is raised, as a RuntimeError, by the next append() or flush().
+    """
+
+    def __init__(self, path: str, compact_threshold: int = 1000):
+        """
+        Args:
+            path (str): The database file.
+            compact_threshold (int): Log records that trigger a compaction.
+        """
+        self.path = path
+        self.compact_threshold = max(1, compact_threshold)
+        self.restored = Future()
+        self._queue = queue.SimpleQueue()
+        self._pending = 0
+        self._closed = False
+        # The exception that stopped the background thread, if any
+        self.error = None
+        self._thread = threading.Thread(target=self._run, name='pydux-persistence', daemon=True)
+        self._thread.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        connection.execute(f'PRAGMA mmap_size={_MMAP_SIZE}')
+        connection.execute('CREATE TABLE IF NOT EXISTS snapshot (key TEXT PRIMARY KEY, value TEXT NOT NULL)')
+        connection.execute('CREATE TABLE IF NOT EXISTS log (seq INTEGER PRIMARY KEY AUTOINCREMENT, record TEXT NOT NULL)')
+        connection.commit()
+        return connection
+
+    def _load(self, connection: sqlite3.Connection) -> Dict[str, Any]:
+        state = {key: json.loads(value) for key, value in connection.execute('SELECT key, value FROM snapshot')}
+        for (record,) in connection.execute('SELECT record FROM log ORDER BY seq'):
+            apply_record(state, json.loads(record))
+            self._pending += 1
+        return state
+
+    def _compact(self, connection: sqlite3.Connection) -> None:
+        with connection:
+            rows = connection.execute('SELECT seq, record FROM log ORDER BY seq').fetchall()
+            if not rows:
+                return
+            # Fold the log first, so each key is written once
+            values, deleted = {}, set()
+            for _, record in rows:
+                record = json.loads(record)
+                for key, value in record.get('set', {}).items():
+                    values[key] = value
+                    deleted.discard(key)
+                for key in record.get('del', ()):
+                    values.pop(key, None)
+                    deleted.add(key)
+            connection.executemany(
+                'INSERT INTO snapshot (key, value) VALUES (?, ?) '
+                'ON CONFLICT(key) DO UPDATE SET value = excluded.value',
+                [(key, json.dumps(value, separators=(',', ':'))) for key, value in values.items()]
+            )
+            connection.executemany('DELETE FROM snapshot WHERE key = ?', [(key,) for key in deleted])
+            connection.execute('DELETE FROM log WHERE seq <= ?', (rows[-1][0],))
+        self._pending = 0
+
+    def _run(self) -> None:
+        try:
+            connection = self._connect()
+            state = self._load(connection)
+        except Exception as e:
+            self.error = e
+            self.restored.set_exception(e)
+            return
+        self.restored.set_result(state)
+        try:
+            self._write(connection)
+        except Exception as e:
+            self.error = e
+            connection.close()
+            # Release everybody waiting in flush()
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if isinstance(item, threading.Event):
+                    item.set()
+
+    def _write(self, connection: sqlite3.Connection) -> None:
+        while True:
+            items = [self._queue.get()]
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            records = [(item,) for item in items if isinstance(item, str)]
+            if records:
+                with connection:
+                    connection.executemany('INSERT INTO log (record) VALUES (?)', records)
+                self._pending += len(records)
+            closing = any(item is _CLOSE for item in items)
+            if self._pending >= self.compact_threshold or (closing and self._pending):
+                self._compact(connection)
+
+            for item in items:
+                if isinstance(item, threading.Event):
+                    item.set()
+            if closing:
+                connection.close()
+                return
+
+    def _check(self) -> None:
+        if self.error is not None:
+            raise RuntimeError(f"Store persistence to {self.path} failed: {self.error}") from self.error
+
+    def append(self, record: str) -> None:
+        """
+        Queues a JSON log record, {"set": {...}, "del": [...]}.
+
+        Raises:
+            RuntimeError: If the background thread stopped on an error.
+        """
+        self._check()
+        if not self._closed:
+            self._queue.put(record)
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Waits until every queued record is written.
+
+        Returns:
+            bool: False if the timeout expired first.
+
+        Raises:
+            RuntimeError: If the background thread stopped on an error.
+        """
+        self._check()
+        if self._closed or not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        # Polls, so a thread that dies after the check above cannot leave us waiting
+        while not done.wait(0.05):
+            if not self._thread.is_alive() or (deadline is not None and time.monotonic() >= deadline):
+                break
+        self._check()
+        return done.is_set()
+
+    def close(self) -> None:
+        """
+        Writes the queued records, compacts the log and closes the database.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_CLOSE)
+        self._thread.join()
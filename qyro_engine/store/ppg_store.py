@@ -1,10 +1,12 @@
 from qyro._exceptions import EngineError
+from .observers import ObserverRegistry
 
 
 class PPGStore:
     _instance = None
     _store = {}
-    _observers = []
+    # Observers held by weak references, purged when they die
+    _observers = ObserverRegistry()
 
     def __new__(cls, *args, **kwargs):
         EngineError(
@@ -37,7 +39,7 @@ class PPGStore:
 
     def subscribe_to_store(self, observer):
         if hasattr(observer, 'update_store') and callable(observer.update_store):
-            self._observers.append(observer)
+            self._observers.add(observer)
         else:
             raise ValueError("Observer must have an 'update_store' method")
 
@@ -46,20 +48,23 @@ class PPGStore:
         Unsubscribe an observer from the store.
         Raises ValueError if the observer is not found.
         """
-        if observer in self._observers:
-            self._observers.remove(observer)
-        else:
+        if not self._observers.remove(observer):
             raise ValueError("Observer not found in store")
 
     def update_store(self, store):
         pass
 
     def remove_observer(self, observer):
-        if observer in self._observers:
-            self._observers.remove(observer)
-        else:
+        if not self._observers.remove(observer):
             raise ValueError("Observer not found")
 
+    def observer_stats(self):
+        """
+        Counts live observers and those purged because they were garbage
+        collected or destroyed by Qt.
+        """
+        return self._observers.stats()
+
     @property
     def store(self):
         return self._store
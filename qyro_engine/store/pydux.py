@@ -1,20 +1,33 @@
-from pydantic import BaseModel, create_model, ValidationError, Field
-from typing import Dict, Type, Any, Optional, Union, get_origin, get_args
+import json
+import atexit
+import inspect
+import threading
+from collections import deque
+from concurrent.futures import Future
+from functools import lru_cache
+from types import MappingProxyType
+from contextlib import contextmanager
+from pydantic import BaseModel, create_model, ValidationError, Field, TypeAdapter
+from typing import Callable, Dict, FrozenSet, Iterable, List, Mapping, Tuple, Type, Any, Optional, Union, get_origin, get_args
 from rich.console import Console
+from .hamt import HamtMap, PVector, persistent, thaw
+from .history import PatchHistory
+from .persistence import StorePersistence
+from .observers import ObserverRef, ObserverRegistry
 try:
-    from PySide6.QtCore import QTimer
+    from PySide6.QtCore import QTimer, QObject, QThread, QCoreApplication, Signal
 
 
 except ImportError:
     try:
-        from PySide2.QtCore import QTimer
+        from PySide2.QtCore import QTimer, QObject, QThread, QCoreApplication, Signal
     except ImportError:
         try:
-            from PyQt6.QtCore import QTimer
+            from PyQt6.QtCore import QTimer, QObject, QThread, QCoreApplication, pyqtSignal as Signal
         except ImportError:
             try:
 
-                from PyQt5.QtCore import QTimer
+                from PyQt5.QtCore import QTimer, QObject, QThread, QCoreApplication, pyqtSignal as Signal
             except ImportError:
                 raise ImportError(
                     "No se encontró PySide6, PySide2, PyQt6 ni PyQt5 instalado."
@@ -24,11 +37,260 @@ except ImportError:
 
 console = Console()
 
+_MISSING = object()
+# Values that cannot change in place, so being the same object means unchanged
+_IMMUTABLE_TYPES = (type(None), bool, int, float, complex, str, bytes, tuple, frozenset, HamtMap, PVector)
+# How often the GUI thread checks whether the persisted state has been read, in ms
+_RESTORE_POLL_INTERVAL = 5
+# Whether each on_store_change implementation takes the change set, by function
+_accepts_changes_cache = {}
+
+
+def _changed_keys(before: Mapping[str, Any], after: Mapping[str, Any], keys: Iterable[str]) -> FrozenSet[str]:
+    """
+    Returns the keys whose value differs between two mappings, comparing
+    by identity first and by equality only for replaced values. A mutable
+    value set again as the same object counts as changed, since it may have
+    been modified in place.
+    """
+    changed = set()
+    for key in keys:
+        old, new = before.get(key, _MISSING), after.get(key, _MISSING)
+        if old is new:
+            if not isinstance(new, _IMMUTABLE_TYPES):
+                changed.add(key)
+        elif old is _MISSING or new is _MISSING or old != new:
+            changed.add(key)
+    return frozenset(changed)
+
+
+def _accepts_changes(callback) -> bool:
+    """
+    Tells whether an on_store_change implementation takes the change set
+    as a second argument.
+    """
+    func = getattr(callback, '__func__', callback)
+    accepts = _accepts_changes_cache.get(func)
+    if accepts is None:
+        try:
+            parameters = list(inspect.signature(callback).parameters.values())
+        except (TypeError, ValueError):
+            parameters = []
+        positional = [p for p in parameters if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)]
+        accepts = len(positional) >= 2 or any(p.kind == p.VAR_POSITIONAL for p in parameters)
+        _accepts_changes_cache[func] = accepts
+    return accepts
+
+
+def _safe_equals(a: Any, b: Any) -> bool:
+    try:
+        return bool(a == b)
+    except Exception:
+        return False
+
+
+@lru_cache(maxsize=1024)
+def _compile_path(path: str) -> Tuple[str, ...]:
+    return tuple(path.split('.'))
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Returns a read-only version of serialized store data: dictionaries
+    become mapping proxies, lists become tuples and sets frozensets.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+def _resolve(root: Any, keys: Tuple[str, ...]) -> Any:
+    """
+    Follows keys through mappings and model attributes. Returns
+    _MISSING if the path does not exist.
+    """
+    current = root
+    for key in keys:
+        if isinstance(current, Mapping):
+            current = current.get(key, _MISSING)
+        else:
+            current = getattr(current, key, _MISSING)
+        if current is _MISSING:
+            return _MISSING
+    return current
+
+
+class _Subscription:
+    """
+    An observer subscribed to the value picked by a selector, with the last
+    value it was notified about. The observer is weakly referenced, and the
+    subscription removes itself when the observer dies.
+    """
+    __slots__ = ('ref', 'selector', 'keys', 'value')
+
+    def __init__(self, observer: Any, selector: Union[str, Callable[[Any], Any]]):
+        self.ref = ObserverRef(observer, lambda: Pydux._drop_subscription(self))
+        self.selector = selector
+        self.keys = _compile_path(selector) if isinstance(selector, str) else None
+        self.value = self.select()
+
+    @property
+    def observer(self) -> Any:
+        return self.ref()
+
+    def select(self) -> Any:
+        if self.keys is not None:
+            return _resolve(Pydux._store, self.keys)
+        try:
+            return self.selector(Pydux._store)
+        except (KeyError, AttributeError, IndexError, TypeError):
+            return _MISSING
+
+
+def _on_gui_thread() -> bool:
+    """
+    Tells whether the caller runs on the thread of the Qt application.
+    Without an application there is no GUI thread to protect.
+    """
+    app = QCoreApplication.instance()
+    return app is None or QThread.currentThread() == app.thread()
+
+
+class _Dispatcher(QObject):
+    """
+    Lives on the GUI thread and drains the queue of store updates made
+    from other threads. Emitting 'wake' from another thread queues a call
+    to drain in the GUI event loop.
+    """
+    wake = Signal()
+
+    def __init__(self):
+        super().__init__()
+        # deque appends and pops are atomic, so producers never wait on
+        # each other or on the GUI thread
+        self.queue = deque()
+        # Whether a drain is already scheduled; the lock only guards this flag
+        self.pending = False
+        self.lock = threading.Lock()
+        self.wake.connect(self.drain)
+
+    def post(self, item: tuple) -> None:
+        self.queue.append(item)
+        if self.pending:
+            return
+        with self.lock:
+            if self.pending:
+                return
+            self.pending = True
+        if _on_gui_thread():
+            QTimer.singleShot(0, self.drain)
+        else:
+            self.wake.emit()
+
+    def drain(self) -> None:
+        """
+        Commits the updates queued so far, in queue order. Updates queued
+        meanwhile are left for the next event loop iteration.
+        """
+        with self.lock:
+            self.pending = False
+        store = Pydux()
+        for _ in range(len(self.queue)):
+            method, args, future = self.queue.popleft()
+            try:
+                getattr(store, method)(*args)
+            except Exception as e:
+                console.print(f"⚠️ [bold yellow]WARNING[/bold yellow]: Queued store update failed: {e}", highlight=False)
+                future.set_exception(e)
+            else:
+                future.set_result(None)
+        if self.queue and not self.pending:
+            self.pending = True
+            QTimer.singleShot(0, self.drain)
+
+
+_dispatcher = None
+_dispatcher_lock = threading.Lock()
+
+
+def _get_dispatcher() -> _Dispatcher:
+    global _dispatcher
+    if _dispatcher is None:
+        with _dispatcher_lock:
+            if _dispatcher is None:
+                dispatcher = _Dispatcher()
+                dispatcher.moveToThread(QCoreApplication.instance().thread())
+                _dispatcher = dispatcher
+    return _dispatcher
+
+
+class _Transaction:
+    """
+    Changes to apply to the store at once: top-level values to set, keys
+    to delete (without a schema) and whether to reset the store first.
+    """
+    __slots__ = ('patch', 'removed', 'clear', 'nested', 'restored')
+
+    def __init__(self):
+        self.patch = {}
+        self.removed = set()
+        self.clear = False
+        # Keys changed inside nested models, by model key
+        self.nested = {}
+        # Values read back from persistence, which are not logged again
+        self.restored = False
+
+    def set(self, obj: Dict[str, Any]) -> None:
+        self.patch.update(obj)
+        self.removed.difference_update(obj)
+
+    def remove(self, key: str) -> None:
+        self.patch.pop(key, None)
+        self.removed.add(key)
+
+    def reset(self) -> None:
+        self.patch.clear()
+        self.removed.clear()
+        self.nested.clear()
+        self.clear = True
+
+
 class Pydux:
     _instance = None
     _store = None
-    _observers = []
+    # Observers of every update, weakly referenced
+    _observers = ObserverRegistry()
     _schema = None
+    # Validator of each schema field, so updates only validate what they change
+    _field_validators = {}
+    # Selector subscriptions with a dot path, by the first key of the path
+    _path_index = {}
+    # Selector subscriptions with a callable, checked on every update
+    _callable_subscriptions = []
+    # Selector subscriptions removed because their observer died
+    _dead_subscriptions = 0
+    # The transaction of the open batch, if any
+    _transaction = None
+    # Read-only snapshot returned by 'view', the store object it was built
+    # from, and the (value, frozen dump) of each field for incremental rebuilds
+    _snapshot = None
+    _snapshot_source = None
+    _snapshot_parts = {}
+    # Undo/redo history, when enabled
+    _history = None
+    # Write-ahead log persistence, when enabled, and its pending restore
+    _persistence = None
+    _restore_pending = False
+    _restore_timer = None
+    # Keys persisted while the restore was pending, which it must not overwrite
+    _written_keys = set()
+    # Observers waiting for the next coalesced re-render, by id
+    _pending_renders = {}
+    _render_scheduled = False
 
     def __new__(cls, *args, **kwargs):
         """
@@ -98,28 +360,458 @@ class Pydux:
                 fields[key] = (Optional[typ], default)
 
         Pydux._schema = create_model('DynamicStoreModel', **fields)
+        Pydux._field_validators = {
+            name: TypeAdapter(field.annotation) for name, field in Pydux._schema.model_fields.items()
+        }
         Pydux._store = Pydux._schema()
+        if Pydux._history is not None:
+            Pydux._history.clear()
 
-    def update_store(self, obj: Dict[str, Any]) -> None:
+    def _validate_fields(self, obj: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validates the given top-level fields against the schema. Keys that
+        are not in the schema are ignored, like the model itself does.
+
+        Raises:
+            TypeError: If a value does not match its field type.
+        """
+        validated = {}
+        for key, value in obj.items():
+            validator = Pydux._field_validators.get(key)
+            if validator is None:
+                continue
+            try:
+                validated[key] = validator.validate_python(value)
+            except ValidationError as e:
+                raise TypeError(f"Validation error for '{key}': {e}")
+        return validated
+
+    def _apply(self, transaction: '_Transaction') -> FrozenSet[str]:
+        """
+        Applies a transaction to the store without notifying anyone. With a
+        schema, the patch is validated before anything changes, so a
+        validation error leaves the store as it was. Untouched fields are
+        shared with the previous model, not copied.
+
+        Returns:
+            frozenset: Dot paths of the values that changed.
+        """
         if Pydux._schema is None:
+            if isinstance(Pydux._store, HamtMap):
+                return self._apply_persistent(transaction)
             # Sin esquema, actualizar dict simple
-            if Pydux._store is None:
-                Pydux._store = {}
-            if isinstance(Pydux._store, dict):
-                Pydux._store.update(obj)
-            else:
+            if not isinstance(Pydux._store, dict):
                 # Fallback si había un modelo antes
-                Pydux._store = obj
+                Pydux._store = {}
+            before = Pydux._store
+            if transaction.clear:
+                Pydux._store = dict(transaction.patch)
+                return _changed_keys(before, Pydux._store, set(before) | set(Pydux._store))
+            removed = transaction.removed & set(before)
+            changes = _changed_keys(before, transaction.patch, transaction.patch) | removed
+            for key in removed:
+                del before[key]
+            before.update(transaction.patch)
+            return changes
+
+        validated = self._validate_fields(transaction.patch)
+        current = Pydux._store if Pydux._store is not None else Pydux._schema()
+        base = Pydux._schema() if transaction.clear else current
+        keys = Pydux._schema.model_fields if transaction.clear else validated
+        updated = base.model_copy(update=validated)
+        changes = _changed_keys(current.__dict__, updated.__dict__, keys)
+        if not changes:
+            return changes
+        Pydux._store = updated
+        # A model modified in place is validated back as the same object
+        for key in changes:
+            Pydux._snapshot_parts.pop(key, None)
+
+        # Report the nested fields that update_nested_model changed, too
+        nested = set()
+        for model_key, sub_keys in transaction.nested.items():
+            if model_key in changes:
+                old, new = current.__dict__[model_key], updated.__dict__[model_key]
+                old = {} if old is None else (old if isinstance(old, dict) else old.__dict__)
+                new = {} if new is None else (new if isinstance(new, dict) else new.__dict__)
+                nested.update(f'{model_key}.{key}' for key in _changed_keys(old, new, sub_keys))
+        return changes | nested
+
+    def _apply_persistent(self, transaction: '_Transaction') -> FrozenSet[str]:
+        before = Pydux._store
+        after = HamtMap() if transaction.clear else before
+        for key in transaction.removed:
+            if key in after:
+                after = after.delete(key)
+        after = after.update((key, persistent(value)) for key, value in transaction.patch.items())
+        if transaction.clear:
+            keys = set(before) | set(after)
         else:
-            try:
-                current_data = Pydux._store.model_dump() if Pydux._store else {}
-                combined = {**current_data, **obj}
-                validated = Pydux._schema(**combined)
-                Pydux._store = validated
-            except ValidationError as e:
-                raise TypeError(f"Validation error: {e}")
+            keys = set(transaction.patch) | transaction.removed
+        Pydux._store = after
+        return _changed_keys(before, after, keys)
+
+    def use_persistent_state(self) -> None:
+        """
+        Keeps a store without a schema in persistent collections: a HamtMap
+        whose dictionaries and lists are HamtMaps and PVectors. Updates
+        share every untouched subtree with the previous state, so
+        snapshot() is O(1), old states cost only what changed since, and
+        selectors see unchanged values as the very same objects.
+
+        The current contents are converted.
+        """
+        if Pydux._schema is not None:
+            raise ValueError("Persistent state is only available for stores without a schema")
+        Pydux._store = persistent(Pydux._store if isinstance(Pydux._store, Mapping) else {})
+
+    def snapshot(self) -> Any:
+        """
+        Returns the current state as an object that later updates will not
+        change: the model with a schema, or the HamtMap with persistent
+        state, both in O(1). A plain dict store is copied.
+        """
+        if isinstance(Pydux._store, dict):
+            return dict(Pydux._store)
+        return Pydux._store
+
+    def _commit(self, transaction: '_Transaction') -> None:
+        """
+        Applies a transaction and notifies observers once, unless a batch is
+        open, in which case the transaction is already part of it.
+        """
+        if transaction is Pydux._transaction:
+            return
+        history = None if transaction.restored else Pydux._history
+        persistence = None if transaction.restored else Pydux._persistence
+        if history is None and persistence is None:
+            self._notify_observers(self._apply(transaction))
+            return
+
+        previous = {key: self._top_level_value(key) for key in self._touched_keys(transaction)} if history else None
+        changes = self._apply(transaction)
+        keys = [change for change in changes if '.' not in change]
+        if keys:
+            current = {key: self._top_level_value(key) for key in keys}
+            if history is not None:
+                history.record(current, {key: previous[key] for key in keys})
+            if persistence is not None:
+                self._persist(current)
+        self._notify_observers(changes)
+
+    @staticmethod
+    def _touched_keys(transaction: '_Transaction') -> set:
+        keys = set(transaction.patch) | transaction.removed
+        if transaction.clear:
+            if Pydux._schema is not None:
+                keys.update(Pydux._schema.model_fields)
+            elif isinstance(Pydux._store, Mapping):
+                keys.update(Pydux._store)
+        return keys
+
+    @staticmethod
+    def _top_level_value(key: str) -> Any:
+        store = Pydux._store
+        if isinstance(store, Mapping):
+            return store.get(key, _MISSING)
+        return store.__dict__.get(key, _MISSING) if store is not None else _MISSING
+
+    def _restore(self, values: Dict[str, Any]) -> FrozenSet[str]:
+        """
+        Writes top-level values recorded in the history back to the store,
+        without validating them again. _MISSING deletes a key.
+        """
+        store = Pydux._store
+        if Pydux._schema is not None:
+            Pydux._store = store.model_copy(update=values)
+            return _changed_keys(store.__dict__, Pydux._store.__dict__, values)
+        if isinstance(store, HamtMap):
+            restored = store
+            for key, value in values.items():
+                if value is not _MISSING:
+                    restored = restored.set(key, value)
+                elif key in restored:
+                    restored = restored.delete(key)
+            Pydux._store = restored
+            return _changed_keys(store, restored, values)
+        before = {key: store.get(key, _MISSING) for key in values}
+        for key, value in values.items():
+            if value is not _MISSING:
+                store[key] = value
+            else:
+                store.pop(key, None)
+        return _changed_keys(before, store, values)
+
+    def _persist(self, values: Dict[str, Any]) -> None:
+        """
+        Appends the new top-level values of a committed update to the
+        write-ahead log. _MISSING marks a deleted key.
+        """
+        record = {'set': {}, 'del': []}
+        for key, value in values.items():
+            if value is _MISSING:
+                record['del'].append(key)
+            elif Pydux._schema is not None:
+                record['set'][key] = Pydux._field_validators[key].dump_python(value, mode='json')
+            else:
+                record['set'][key] = thaw(value)
+        try:
+            encoded = json.dumps(record, separators=(',', ':'))
+        except (TypeError, ValueError) as e:
+            console.print(f"⚠️ [bold yellow]WARNING[/bold yellow]: Store update not persisted: {e}", highlight=False)
+            return
+        if Pydux._restore_pending:
+            Pydux._written_keys.update(values)
+        try:
+            Pydux._persistence.append(encoded)
+        except RuntimeError as e:
+            console.print(f"⚠️ [bold yellow]WARNING[/bold yellow]: {e}. Persistence stopped.", highlight=False)
+            self.close_persistence()
+
+    def persist_to(self, path: str, compact_threshold: int = 1000, wait: bool = False) -> None:
+        """
+        Persists the store to a SQLite database and restores its last state.
+        Call it after set_schema, since restored values are validated.
+
+        Every committed update is appended to a write-ahead log on a
+        background thread, which also folds the log into a snapshot once it
+        has compact_threshold records. The last state is read on that
+        thread too: by default the store stays usable meanwhile and the
+        restored values are applied on the GUI thread as one update when
+        they are ready, without overwriting keys updated in the meantime.
+        Keys of the current store that the database does not have yet, all
+        of them the first time, are then written as the initial state.
+
+        If the database fails later on, a warning is shown and persistence
+        stops; flush_persistence() raises the error.
+
+        Args:
+            path (str): The database file.
+            compact_threshold (int): Log records that trigger a compaction.
+            wait (bool): Restores before returning instead.
+        """
+        self.close_persistence()
+        persistence = StorePersistence(path, compact_threshold)
+        Pydux._persistence = persistence
+        Pydux._restore_pending = True
+        Pydux._written_keys = set()
+        atexit.register(persistence.close)
+
+        if wait:
+            self.wait_until_restored()
+            return
+        timer = QTimer()
+        timer.setInterval(_RESTORE_POLL_INTERVAL)
+
+        def check():
+            if persistence.restored.done():
+                timer.stop()
+                Pydux._restore_timer = None
+                if Pydux._persistence is persistence:
+                    self.wait_until_restored()
+
+        timer.timeout.connect(check)
+        timer.start()
+        Pydux._restore_timer = timer
+
+    def wait_until_restored(self, timeout: float = None) -> None:
+        """
+        Blocks until the persisted state is read, and applies it if that
+        has not happened yet.
 
-        self._notify_observers()
+        Raises:
+            concurrent.futures.TimeoutError: If the state is not read in time.
+        """
+        if Pydux._persistence is None or not Pydux._restore_pending:
+            return
+        state = Pydux._persistence.restored.result(timeout)
+        Pydux._restore_pending = False
+
+        transaction = _Transaction()
+        transaction.restored = True
+        for key, value in state.items():
+            if key in Pydux._written_keys:
+                continue
+            if Pydux._schema is not None:
+                try:
+                    self._validate_fields({key: value})
+                except TypeError as e:
+                    console.print(f"⚠️ [bold yellow]WARNING[/bold yellow]: Persisted value skipped: {e}", highlight=False)
+                    continue
+            transaction.set({key: value})
+        Pydux._written_keys = set()
+        self._commit(transaction)
+
+        # Keys the database has never seen would otherwise be lost on restart
+        store = Pydux._store
+        keys = store.keys() if isinstance(store, Mapping) else (store.__dict__ if store is not None else ())
+        missing = {key: self._top_level_value(key) for key in keys if key not in state}
+        if missing and Pydux._persistence is not None:
+            self._persist(missing)
+
+    def flush_persistence(self, timeout: float = None) -> bool:
+        """
+        Waits until every committed update is written to disk.
+
+        Raises:
+            RuntimeError: If writing to the database failed.
+        """
+        return Pydux._persistence.flush(timeout) if Pydux._persistence is not None else True
+
+    def close_persistence(self) -> None:
+        """Writes pending updates, compacts the log and stops persisting."""
+        if Pydux._restore_timer is not None:
+            Pydux._restore_timer.stop()
+            Pydux._restore_timer = None
+        if Pydux._persistence is not None:
+            Pydux._persistence.close()
+            Pydux._persistence = None
+        Pydux._restore_pending = False
+
+    def enable_history(self, limit: int = 100, memory_budget: int = 16 * 1024 * 1024,
+                       merge_window: float = 0.0) -> None:
+        """
+        Starts recording updates for undo() and redo(). Each update keeps
+        only the top-level values it changed, before and after.
+
+        Args:
+            limit (int): Maximum number of updates to remember.
+            memory_budget (int): Approximate maximum size of the history, in bytes.
+            merge_window (float): Consecutive updates of the same keys within
+                                  this many seconds undo as one step.
+        """
+        Pydux._history = PatchHistory(limit, memory_budget, merge_window)
+
+    def disable_history(self) -> None:
+        """Stops recording updates and forgets the history."""
+        Pydux._history = None
+
+    def _history_or_raise(self) -> PatchHistory:
+        if Pydux._history is None:
+            raise ValueError("History must be enabled with enable_history() first")
+        if Pydux._transaction is not None:
+            raise ValueError("Cannot undo or redo inside a batch")
+        return Pydux._history
+
+    def undo(self) -> bool:
+        """
+        Reverts the last update.
+
+        Returns:
+            bool: False if there was nothing to undo.
+        """
+        values = self._history_or_raise().undo()
+        if values is None:
+            return False
+        changes = self._restore(values)
+        if Pydux._persistence is not None and changes:
+            self._persist({key: self._top_level_value(key) for key in changes})
+        self._notify_observers(changes)
+        return True
+
+    def redo(self) -> bool:
+        """
+        Reapplies the last undone update.
+
+        Returns:
+            bool: False if there was nothing to redo.
+        """
+        values = self._history_or_raise().redo()
+        if values is None:
+            return False
+        changes = self._restore(values)
+        if Pydux._persistence is not None and changes:
+            self._persist({key: self._top_level_value(key) for key in changes})
+        self._notify_observers(changes)
+        return True
+
+    def history(self, n: int = 10) -> List[Dict[str, Any]]:
+        """
+        Describes the last n updates that undo() would revert, newest first:
+        [{'keys': [...], 'timestamp': ..., 'size': ...}, ...]
+        """
+        if Pydux._history is None:
+            return []
+        return Pydux._history.recent(n)
+
+    @contextmanager
+    def batch(self):
+        """
+        Groups updates into one transaction. Updates made inside the block
+        are collected and applied when it ends: the combined patch is
+        validated once and observers are notified once. If the block raises,
+        or validation fails, nothing is applied. Nested batches join the
+        outermost one.
+
+        Reads inside the block see the store as it was before the batch.
+
+        Example:
+            with store.batch():
+                store.update_store({"user": user})
+                store.update_store({"count": 10})
+        """
+        if not _on_gui_thread():
+            raise RuntimeError("Use dispatch_many() to batch updates from worker threads")
+        if Pydux._transaction is not None:
+            yield
+            return
+
+        Pydux._transaction = _Transaction()
+        try:
+            yield
+        except BaseException:
+            Pydux._transaction = None
+            raise
+        transaction, Pydux._transaction = Pydux._transaction, None
+        self._commit(transaction)
+
+    def _enqueue(self, method: str, *args: Any) -> Future:
+        """
+        Queues a call to a store method for the GUI thread. Queued calls are
+        committed in the order they were queued, from whichever thread.
+        """
+        future = Future()
+        _get_dispatcher().post((method, args, future))
+        return future
+
+    def dispatch(self, obj: Dict[str, Any]) -> Future:
+        """
+        Queues an update to be committed on the GUI thread during the next
+        event loop iteration. Safe to call from any thread.
+
+        Returns:
+            Future: Resolved once the update is committed, or with the
+                    validation error.
+        """
+        if QCoreApplication.instance() is None:
+            future = Future()
+            self.update_store(obj)
+            future.set_result(None)
+            return future
+        return self._enqueue('update_store', obj)
+
+    def dispatch_many(self, patches: Iterable[Dict[str, Any]]) -> None:
+        """
+        Applies several updates as one batch. From a worker thread, the
+        batch is queued for the GUI thread.
+
+        Args:
+            patches (Iterable[Dict[str, Any]]): Updates, applied in order.
+        """
+        if not _on_gui_thread():
+            self._enqueue('dispatch_many', list(patches))
+            return
+        with self.batch():
+            for patch in patches:
+                self.update_store(patch)
+
+    def update_store(self, obj: Dict[str, Any]) -> None:
+        if not _on_gui_thread():
+            self._enqueue('update_store', obj)
+            return
+        transaction = Pydux._transaction or _Transaction()
+        transaction.set(obj)
+        self._commit(transaction)
 
     def update_nested_model(self, model_key: str, partial_data: Dict[str, Any]) -> None:
         """
@@ -130,6 +822,9 @@ class Pydux:
             model_key (str): Model key in the store to update.
             partial_data (Dict[str, Any]): Partial data to update the model with.
         """
+        if not _on_gui_thread():
+            self._enqueue('update_nested_model', model_key, partial_data)
+            return
         if Pydux._schema is None:
             raise ValueError(
                 "Schema must be set before using update_nested_model")
@@ -137,88 +832,263 @@ class Pydux:
         if not Pydux._store:
             raise ValueError("Store is empty")
 
-        current_data = Pydux._store.model_dump()
-        if model_key not in current_data or current_data[model_key] is None:
+        transaction = Pydux._transaction or _Transaction()
+        # Inside a batch, build on the value staged so far
+        if model_key in transaction.patch:
+            current_model_data = transaction.patch[model_key]
+        elif transaction.clear:
+            current_model_data = getattr(Pydux._schema(), model_key, None)
+        else:
+            current_model_data = getattr(Pydux._store, model_key, None)
+        if current_model_data is None:
             raise KeyError(f"Model key '{model_key}' not found in store or is None")
 
-        current_model_data = current_data[model_key]
         if isinstance(current_model_data, dict):
             updated_model_data = {**current_model_data, **partial_data}
         else:
             # If it is a Pydantic model, convert it to a dict first
             updated_model_data = {**current_model_data.__dict__, **partial_data}
 
-        # Update using the main method
-        self.update_store({model_key: updated_model_data})
+        transaction.set({model_key: updated_model_data})
+        transaction.nested.setdefault(model_key, set()).update(partial_data)
+        self._commit(transaction)
+
+    def _notify_observers(self, changes: Optional[FrozenSet[str]] = None) -> None:
+        """
+        Tells every observer about an update. The state is serialized once
+        for all of them, and re-renders are coalesced: an observer renders
+        once per event loop iteration however many updates it saw.
 
-    def _notify_observers(self) -> None:
-        for observer in Pydux._observers:
+        Args:
+            changes (frozenset, optional): Dot paths of the values that changed,
+                                           e.g. {'user', 'user.name'}. None means
+                                           unknown. Nothing happens if it is empty.
+        """
+        if changes is not None and not changes:
+            return
+
+        # Observers subscribed with subscribe_to_store hear about every update;
+        # those subscribed with a selector only when their selection changed
+        notified = {id(observer): observer for observer in Pydux._observers}
+        for subscription in self._affected_subscriptions(changes):
+            value = subscription.select()
+            if value is subscription.value:
+                # A path subscription is only checked when its key changed, so
+                # the same mutable object was modified in place. Callable
+                # selectors run on every update and cannot tell.
+                if subscription.keys is None or isinstance(value, _IMMUTABLE_TYPES):
+                    continue
+            elif _safe_equals(value, subscription.value):
+                continue
+            observer = subscription.observer
+            if observer is None:
+                continue
+            subscription.value = value
+            notified.setdefault(id(observer), observer)
+        if not notified:
+            return
+
+        # Observers get a plain dict, as returned by 'store'
+        state = self.store
+        for observer in notified.values():
             if hasattr(observer, '_trigger_render') and callable(observer._trigger_render):
-                QTimer.singleShot(0, observer._trigger_render)
+                Pydux._schedule_render(observer)
 
-            if Pydux._schema is None:
-                # Without schema, pass dict directly
-                observer.on_store_change(
-                    Pydux._store if isinstance(Pydux._store, dict) else {})
+            if _accepts_changes(observer.on_store_change):
+                observer.on_store_change(state, changes)
             else:
-                # With schema, use model_dump
-                observer.on_store_change(
-                    Pydux._store.model_dump() if Pydux._store else {})
+                observer.on_store_change(state)
+
+    @staticmethod
+    def _affected_subscriptions(changes: Optional[FrozenSet[str]]) -> List['_Subscription']:
+        """
+        Returns the selector subscriptions that may be affected by the
+        changes: those indexed under a changed top-level key, and every
+        subscription with a callable selector.
+        """
+        if changes is None:
+            affected = [s for subscriptions in Pydux._path_index.values() for s in subscriptions]
+        else:
+            affected = []
+            for key in {change.split('.', 1)[0] for change in changes}:
+                affected.extend(Pydux._path_index.get(key, ()))
+        return affected + Pydux._callable_subscriptions
+
+    @staticmethod
+    def _schedule_render(observer: Any) -> None:
+        Pydux._pending_renders[id(observer)] = observer
+        if not Pydux._render_scheduled:
+            Pydux._render_scheduled = True
+            QTimer.singleShot(0, Pydux._flush_renders)
+
+    @staticmethod
+    def _flush_renders() -> None:
+        pending = list(Pydux._pending_renders.values())
+        Pydux._pending_renders.clear()
+        Pydux._render_scheduled = False
+        for observer in pending:
+            observer._trigger_render()
 
     def subscribe_to_store(self, observer: Any) -> None:
         if hasattr(observer, 'on_store_change') and callable(observer.on_store_change):
-            if observer not in Pydux._observers:  # Prevent duplicates
-                Pydux._observers.append(observer)
+            Pydux._observers.add(observer)  # Ignores duplicates
         else:
             raise ValueError("Observer must have an 'on_store_change' method")
 
-    def unsubscribe_from_store(self, observer: Any) -> None:
-        if observer in Pydux._observers:
-            Pydux._observers.remove(observer)
+    def subscribe(self, observer: Any, selector: Union[str, Callable[[Any], Any]]) -> None:
+        """
+        Subscribes an observer to part of the store. The observer is notified
+        and re-rendered only when the selected value changes.
+        Example: store.subscribe(self, "user.name")
+
+        Args:
+            observer (Any): An object with an 'on_store_change' method.
+            selector (str | Callable): A dot-notated path, or a function that
+                                       receives the store model (or dict) and
+                                       returns the selected value.
+        """
+        if not (hasattr(observer, 'on_store_change') and callable(observer.on_store_change)):
+            raise ValueError("Observer must have an 'on_store_change' method")
+
+        subscription = _Subscription(observer, selector)
+        if subscription.keys is None:
+            Pydux._callable_subscriptions.append(subscription)
         else:
+            Pydux._path_index.setdefault(subscription.keys[0], []).append(subscription)
+
+    def unsubscribe(self, observer: Any) -> None:
+        """
+        Removes every selector subscription of an observer.
+        """
+        found = False
+        for key, subscriptions in list(Pydux._path_index.items()):
+            kept = [s for s in subscriptions if s.observer is not observer]
+            found = found or len(kept) != len(subscriptions)
+            if kept:
+                Pydux._path_index[key] = kept
+            else:
+                del Pydux._path_index[key]
+        kept = [s for s in Pydux._callable_subscriptions if s.observer is not observer]
+        found = found or len(kept) != len(Pydux._callable_subscriptions)
+        Pydux._callable_subscriptions = kept
+        if not found:
+            raise ValueError("Observer not found in store")
+
+    def unsubscribe_from_store(self, observer: Any) -> None:
+        if not Pydux._observers.remove(observer):
             raise ValueError("Observer not found in store")
 
+    @staticmethod
+    def _drop_subscription(subscription: '_Subscription') -> None:
+        if subscription.keys is None:
+            subscriptions = Pydux._callable_subscriptions
+        else:
+            subscriptions = Pydux._path_index.get(subscription.keys[0], [])
+        if subscription in subscriptions:
+            subscriptions.remove(subscription)
+            if subscription.keys is not None and not subscriptions:
+                del Pydux._path_index[subscription.keys[0]]
+            Pydux._dead_subscriptions += 1
+
+    def observer_stats(self) -> Dict[str, int]:
+        """
+        Counts live observers and those purged because they were garbage
+        collected or destroyed by Qt, to diagnose leaks.
+
+        Returns:
+            dict: {'live': ..., 'dead': ..., 'live_subscriptions': ..., 'dead_subscriptions': ...}
+        """
+        stats = Pydux._observers.stats()
+        live_subscriptions = sum(len(s) for s in Pydux._path_index.values()) + len(Pydux._callable_subscriptions)
+        return {
+            'live': stats['live'],
+            'dead': stats['dead'],
+            'live_subscriptions': live_subscriptions,
+            'dead_subscriptions': Pydux._dead_subscriptions,
+        }
+
     def get_nested(self, path: str) -> Any:
         """
         Get a nested value from the store using a dot-notated path.
         Example: get_nested("user.name") returns the name of the user.
 
+        With a schema, values come from 'view': dictionaries are returned as
+        mapping proxies, lists as tuples and sets as frozensets, so they
+        cannot be changed and are not copied.
+
         Args:
             path (str): The dot-notated path to the value in the store.
         """
         if not Pydux._store:
             return None
 
-        keys = path.split('.')
-        current = Pydux._store.model_dump() if Pydux._schema else Pydux._store
-
-        try:
-            for key in keys:
-                if isinstance(current, dict):
-                    current = current[key]
-                else:
-                    current = getattr(current, key)
-            return current
-        except (KeyError, AttributeError):
-            return None
+        if Pydux._schema is None:
+            value = _resolve(Pydux._store, _compile_path(path))
+        else:
+            value = _resolve(self.view, _compile_path(path))
+        return None if value is _MISSING else value
 
     @property
     def store(self) -> Dict[str, Any]:
+        """
+        The contents of the store as a plain dict: a fresh dump of the model
+        with a schema, the live dict without one. Use 'view' for repeated
+        reads that do not need to modify the result.
+        """
         if Pydux._schema is None:
+            if isinstance(Pydux._store, HamtMap):
+                return Pydux._store
             return Pydux._store if isinstance(Pydux._store, dict) else {}
         return Pydux._store.model_dump() if Pydux._store else {}
 
+    @property
+    def view(self) -> Mapping[str, Any]:
+        """
+        A read-only snapshot of the store, shared by all readers until the
+        store changes. Dictionaries are mapping proxies, lists are tuples
+        and sets frozensets, so unlike 'store' it cannot be concatenated
+        with lists or passed to json.dumps as is. It is rebuilt when the
+        store has changed since the last read, reusing the serialized form
+        of every field that did not change.
+        """
+        self._refresh_snapshot()
+        return Pydux._snapshot
+
+    @staticmethod
+    def _refresh_snapshot() -> None:
+        source = Pydux._store
+        if Pydux._snapshot is not None and source is Pydux._snapshot_source:
+            return
+
+        if Pydux._schema is None:
+            if isinstance(source, HamtMap):
+                snapshot = source
+            else:
+                snapshot = MappingProxyType(source if isinstance(source, dict) else {})
+        else:
+            parts = {}
+            for key, value in (source.__dict__ if source is not None else {}).items():
+                cached = Pydux._snapshot_parts.get(key)
+                if cached is None or cached[0] is not value:
+                    cached = (value, _freeze(Pydux._field_validators[key].dump_python(value)))
+                parts[key] = cached
+            Pydux._snapshot_parts = parts
+            snapshot = MappingProxyType({key: frozen for key, (_, frozen) in parts.items()})
+
+        Pydux._snapshot, Pydux._snapshot_source = snapshot, source
+
     @store.setter
     def store(self, value: Dict[str, Any]) -> None:
         self.update_store(value)
 
     def clear_store(self) -> None:
         """Clear the store and reset it to an empty state."""
-        if Pydux._schema:
-            Pydux._store = Pydux._schema()
-        else:
-            Pydux._store = {}
-        self._notify_observers()
+        if not _on_gui_thread():
+            self._enqueue('clear_store')
+            return
+        transaction = Pydux._transaction or _Transaction()
+        transaction.reset()
+        self._commit(transaction)
 
     def has_key(self, key: str) -> bool:
         """Check if a key exists in the store.
@@ -226,32 +1096,38 @@ class Pydux:
         Args:
             key (str): The key to check in the store.
         """
-        store_dict = self.store
+        store_dict = self.view
         return key in store_dict and store_dict[key] is not None
 
     def remove_from_store(self, key: str) -> None:
         """Remove a key from the store, setting it to None if schema is used."""
+        if not _on_gui_thread():
+            self._enqueue('remove_from_store', key)
+            return
+        transaction = Pydux._transaction or _Transaction()
         if Pydux._schema is None:
-            if isinstance(Pydux._store, dict) and key in Pydux._store:
-                del Pydux._store[key]
-                self._notify_observers()
+            committed = (isinstance(Pydux._store, (dict, HamtMap)) and key in Pydux._store
+                         and key not in transaction.removed and not transaction.clear)
+            if key in transaction.patch or committed:
+                transaction.remove(key)
             else:
                 raise KeyError(f"Key '{key}' not found in store")
         else:
-            current_data = Pydux._store.model_dump() if Pydux._store else {}
-            if key in current_data:
-                current_data[key] = None  # Set to None instead of deleting
-                validated = Pydux._schema(**current_data)
-                Pydux._store = validated
-                self._notify_observers()
+            if key in Pydux._schema.model_fields:
+                transaction.set({key: None})  # Set to None instead of deleting
             else:
                 raise KeyError(f"Key '{key}' not found in store")
+        self._commit(transaction)
 
-    def on_store_change(self, store: Dict[str, Any]) -> None:
+    def on_store_change(self, store: Dict[str, Any], changes: Optional[FrozenSet[str]] = None) -> None:
         """This is a placeholder method to be overridden by subclasses.
         It can be used to update the store with new data.
 
+        Overrides may take only the store, or the store and the change set.
+
         Args:
             store (Dict[str, Any]): The new data to update the store with.
+            changes (frozenset, optional): Dot paths of the values that changed,
+                                           None if unknown.
         """
         pass
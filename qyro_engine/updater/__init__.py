@@ -0,0 +1,166 @@
+import os
+import json
+import shutil
+import zipfile
+import threading
+from concurrent.futures import Future
+from typing import BinaryIO, Callable, Optional
+from qyro._exceptions import EngineError
+from .manifest import (
+    build_manifest, sha256_file, PATCH_COPY, PATCH_LITERAL, COPY_RECORD, LITERAL_RECORD
+)
+
+DELTA_INDEX = 'delta.json'
+# 2: copy records carry a 64-bit length
+DELTA_FORMAT = 2
+
+
+def apply_patch(old_path: str, patch: BinaryIO, new_path: str) -> None:
+    """
+    Rebuilds a file from its previous version and a block-level patch.
+
+    Args:
+        old_path (str): The installed version of the file.
+        patch (BinaryIO): A readable stream with the patch records.
+        new_path (str): Where the new version is written.
+    """
+    with open(old_path, 'rb') as old, open(new_path, 'wb') as new:
+        while True:
+            tag = patch.read(1)
+            if not tag:
+                break
+            if tag == PATCH_COPY:
+                offset, length = COPY_RECORD.unpack(patch.read(COPY_RECORD.size))
+                old.seek(offset)
+                new.write(old.read(length))
+            elif tag == PATCH_LITERAL:
+                (length,) = LITERAL_RECORD.unpack(patch.read(LITERAL_RECORD.size))
+                new.write(patch.read(length))
+            else:
+                raise EngineError(f"Corrupt patch record while rebuilding {new_path}", verbose=False)
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def apply_update(package_path: str, install_dir: str) -> str:
+    """
+    Applies a delta package produced by 'qyro release-diff' to an installed
+    application.
+
+    The install is first checked against the Merkle root of the version the
+    package was built from. The new version is then assembled next to
+    install_dir, unchanged files are hardlinked from the current install,
+    and the result is verified against the Merkle root of the target
+    manifest before it replaces install_dir.
+
+    The replacement is two renames, not an atomic swap: install_dir is
+    moved to install_dir + '.qyro-old', then the new version is moved in.
+    If the process dies in between, the next call moves the old version
+    back before doing anything else. The installed files must not be in
+    use (e.g. run this from an updater process or before the application
+    starts).
+
+    Args:
+        package_path (str): The delta package.
+        install_dir (str): The directory of the installed application.
+
+    Returns:
+        str: The Merkle root of the installed version.
+
+    Raises:
+        EngineError: If the package does not match the install or the result
+                     fails verification. The install is left untouched.
+    """
+    install_dir = os.path.abspath(install_dir)
+    staging_dir = install_dir + '.qyro-update'
+    backup_dir = install_dir + '.qyro-old'
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    if not os.path.exists(install_dir) and os.path.isdir(backup_dir):
+        # A previous update was interrupted between its two renames
+        os.rename(backup_dir, install_dir)
+
+    with zipfile.ZipFile(package_path) as package:
+        delta = json.loads(package.read(DELTA_INDEX))
+        if delta.get('format') != DELTA_FORMAT:
+            raise EngineError(f"Unsupported delta package format: {delta.get('format')}", verbose=False)
+        if build_manifest(install_dir)['root'] != delta['base_root']:
+            raise EngineError(
+                "The installed version does not match the version this update was built from.", verbose=False
+            )
+
+        target = delta['target']
+        ops = delta['ops']
+        try:
+            for rel_path, info in target['files'].items():
+                dest = os.path.join(staging_dir, *rel_path.split('/'))
+                os.makedirs(os.path.dirname(dest), exist_ok=True)
+                op = ops.get(rel_path)
+
+                if op is None:
+                    _link_or_copy(os.path.join(install_dir, *rel_path.split('/')), dest)
+                    continue
+
+                if op['type'] == 'full':
+                    with package.open(op['entry']) as src, open(dest, 'wb') as out:
+                        shutil.copyfileobj(src, out)
+                elif op['type'] == 'copy':
+                    shutil.copyfile(os.path.join(install_dir, *op['from'].split('/')), dest)
+                elif op['type'] == 'patch':
+                    source = os.path.join(install_dir, *rel_path.split('/'))
+                    if sha256_file(source) != op['base_sha256']:
+                        raise EngineError(f"Installed file does not match the update base: {rel_path}", verbose=False)
+                    with package.open(op['entry']) as patch:
+                        apply_patch(source, patch, dest)
+                else:
+                    raise EngineError(f"Unknown delta operation '{op['type']}' for {rel_path}", verbose=False)
+                os.chmod(dest, info['mode'])
+
+            if build_manifest(staging_dir)['root'] != target['root']:
+                raise EngineError("The updated files failed Merkle verification.", verbose=False)
+        except Exception:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            raise
+
+    shutil.rmtree(backup_dir, ignore_errors=True)
+    os.rename(install_dir, backup_dir)
+    try:
+        os.rename(staging_dir, install_dir)
+    except OSError:
+        os.rename(backup_dir, install_dir)
+        raise
+    shutil.rmtree(backup_dir, ignore_errors=True)
+    return target['root']
+
+
+def apply_update_in_background(package_path: str, install_dir: str,
+                               on_done: Optional[Callable[[Future], None]] = None) -> Future:
+    """
+    Runs apply_update in a worker thread.
+
+    Args:
+        package_path (str): The delta package.
+        install_dir (str): The directory of the installed application.
+        on_done (Callable, optional): Called with the future once the update finishes.
+
+    Returns:
+        Future: Resolves to the installed Merkle root, or raises the update error.
+    """
+    future = Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(apply_update(package_path, install_dir))
+        except BaseException as e:
+            future.set_exception(e)
+
+    if on_done is not None:
+        future.add_done_callback(on_done)
+    threading.Thread(target=run, name='qyro-updater').start()
+    return future
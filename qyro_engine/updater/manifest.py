@@ -0,0 +1,68 @@
+import os
+import struct
+import hashlib
+from typing import Dict, Any, List
+
+BLOCK_SIZE = 64 * 1024
+_CHUNK_SIZE = 1024 * 1024
+
+# Patch records: copy a range of the old file, or insert literal bytes
+PATCH_COPY = b'C'
+PATCH_LITERAL = b'L'
+# old offset, length; adjacent copies are merged, so runs can exceed 4 GiB
+COPY_RECORD = struct.Struct('<QQ')
+# literal length, followed by the bytes
+LITERAL_RECORD = struct.Struct('<I')
+
+
+def sha256_file(file_path: str) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_manifest(root: str) -> Dict[str, Any]:
+    """
+    Describes every file under root by its content hash, size and mode.
+
+    Args:
+        root (str): The directory to describe.
+
+    Returns:
+        dict: {'files': {relative_path: {...}}, 'root': merkle_root}
+    """
+    files = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            file_path = os.path.join(dirpath, filename)
+            rel_path = os.path.relpath(file_path, root).replace(os.sep, '/')
+            stat = os.stat(file_path)
+            files[rel_path] = {
+                'sha256': sha256_file(file_path),
+                'size': stat.st_size,
+                'mode': stat.st_mode & 0o777,
+            }
+    return {'files': files, 'root': merkle_root(files)}
+
+
+def merkle_root(files: Dict[str, Dict[str, Any]]) -> str:
+    """
+    Computes the Merkle root of a manifest. Leaves are the hashes of
+    (path, content hash) pairs in path order; an odd node is promoted as is.
+    """
+    level: List[bytes] = [
+        hashlib.sha256(f"{rel_path}\0{files[rel_path]['sha256']}".encode('utf-8')).digest()
+        for rel_path in sorted(files)
+    ]
+    if not level:
+        return hashlib.sha256(b'').hexdigest()
+
+    while len(level) > 1:
+        paired = [hashlib.sha256(level[i] + level[i + 1]).digest() for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0].hex()
@@ -5,4 +5,7 @@ def app_is_frozen():
     """
     Check if the application is running in a frozen state (e.g., bundled with PyInstaller).
     """
-    return getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS')
+    if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
+        return True
+    # Nuitka defines __compiled__ in every module it compiles
+    return '__compiled__' in globals()
@@ -0,0 +1,317 @@
+import os
+import sys
+import json
+import mmap
+import zlib
+import struct
+import hashlib
+import tempfile
+import stat
+from pathlib import Path
+from typing import Dict, Iterable, Tuple, Union
+
+PACK_SUFFIX = '.qpak'
+PACK_MAGIC = b'QYROPAK1'
+# magic, index offset, index size
+_HEADER = struct.Struct('<8sQQ')
+_ALIGNMENT = 16
+
+COMPRESSION_NONE = 'none'
+COMPRESSION_ZLIB = 'zlib'
+
+
+def _aligned(offset: int) -> int:
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def _user_cache_dir() -> Path:
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~\\AppData\\Local')
+    elif sys.platform == 'darwin':
+        base = os.path.expanduser('~/Library/Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return Path(base) / 'qyro' / 'resources'
+
+
+def _is_private_dir(path: Path) -> bool:
+    """
+    Checks that a directory is a real directory owned by the current user
+    and closed to everybody else. Always true on Windows, where the user
+    profile is already private.
+    """
+    if not hasattr(os, 'getuid'):
+        return path.is_dir()
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISDIR(st.st_mode) and st.st_uid == os.getuid() and not st.st_mode & 0o077
+
+
+def _extraction_root() -> Path:
+    """
+    Returns a directory only the current user can write to. The per-user
+    cache directory is used when it can be made private; otherwise a fresh
+    directory is created for this process.
+    """
+    root = _user_cache_dir()
+    try:
+        root.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if hasattr(os, 'getuid') and os.lstat(root).st_uid == os.getuid():
+            os.chmod(root, 0o700)
+    except OSError:
+        pass
+    if _is_private_dir(root):
+        return root
+    return Path(tempfile.mkdtemp(prefix='qyro-resources-'))
+
+
+def write_resource_pack(source_dir: Union[str, Path], pack_path: Union[str, Path], compress: bool = False) -> int:
+    """
+    Packs every file under source_dir into a single indexed archive.
+
+    Entries are stored at aligned offsets so they can be handed out as
+    memoryviews of the mapped file. When compress is True, each entry is
+    zlib-compressed individually, but only if that actually saves space.
+    Identical files are stored once and share the same index record.
+
+    Args:
+        source_dir (str | Path): Directory whose files are packed.
+        pack_path (str | Path): Output archive.
+        compress (bool): Enables per-entry compression.
+
+    Returns:
+        int: The number of packed entries.
+    """
+    source_dir = Path(source_dir)
+    files = sorted(
+        p.relative_to(source_dir).as_posix() for p in source_dir.rglob('*') if p.is_file()
+    )
+
+    entries = {}
+    stored = {}
+    content = hashlib.sha256()
+    with open(pack_path, 'wb') as out:
+        out.write(b'\0' * _HEADER.size)
+        offset = _HEADER.size
+        for name in files:
+            data = (source_dir / name).read_bytes()
+            raw_size = len(data)
+            compression = COMPRESSION_NONE
+            if compress:
+                packed = zlib.compress(data, 9)
+                if len(packed) < raw_size * 0.9:
+                    data, compression = packed, COMPRESSION_ZLIB
+
+            digest = hashlib.sha256(data).digest()
+            content.update(name.encode('utf-8') + b'\0' + digest)
+            if digest in stored:
+                entries[name] = list(stored[digest])
+                continue
+
+            start = _aligned(offset)
+            out.write(b'\0' * (start - offset))
+            out.write(data)
+            offset = start + len(data)
+            entries[name] = stored[digest] = [start, len(data), raw_size, compression]
+
+        index = json.dumps(
+            {'entries': entries, 'digest': content.hexdigest()}, separators=(',', ':')
+        ).encode('utf-8')
+        out.write(index)
+        out.seek(0)
+        out.write(_HEADER.pack(PACK_MAGIC, offset, len(index)))
+
+    return len(entries)
+
+
+class ResourcePack:
+    """
+    Read-only access to a packed resource archive through mmap.
+
+    Lookups are dictionary hits on the index loaded at open time; entry data
+    is never copied unless it is compressed or has to be materialized on disk.
+    """
+
+    def __init__(self, pack_path: Union[str, Path]):
+        """
+        Opens and maps the archive.
+
+        Args:
+            pack_path (str | Path): The archive to open.
+
+        Raises:
+            ValueError: If the file is not a resource pack.
+        """
+        self.path = Path(pack_path)
+        with open(self.path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+
+        magic, index_offset, index_size = _HEADER.unpack_from(self._mmap, 0)
+        if magic != PACK_MAGIC:
+            raise ValueError(f"Not a resource pack: {self.path}")
+        index = json.loads(bytes(self._view[index_offset:index_offset + index_size]))
+        self._entries: Dict[str, list] = index['entries']
+        self._digest = index.get('digest')
+        self._extract_dir = None
+        # Entries already written or verified by this process
+        self._extracted: Dict[str, str] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def names(self) -> Iterable[str]:
+        return self._entries.keys()
+
+    def entry(self, name: str) -> Tuple[int, int, int, str]:
+        """Returns (offset, stored size, raw size, compression) for an entry."""
+        return tuple(self._entries[name])
+
+    def read(self, name: str) -> Union[memoryview, bytes]:
+        """
+        Returns the contents of an entry.
+
+        Uncompressed entries are returned as a zero-copy memoryview into the
+        mapped archive; compressed entries are decompressed into bytes.
+
+        Raises:
+            KeyError: If the entry does not exist.
+        """
+        offset, size, _, compression = self._entries[name]
+        data = self._view[offset:offset + size]
+        if compression == COMPRESSION_ZLIB:
+            return zlib.decompress(data)
+        return data
+
+    @property
+    def digest(self) -> str:
+        """
+        A hash of the archive content. Packs written by older versions carry
+        no digest in their index, so it is computed from the mapped file.
+        """
+        if self._digest is None:
+            self._digest = hashlib.sha256(self._view).hexdigest()
+        return self._digest
+
+    def extract(self, name: str) -> str:
+        """
+        Materializes an entry on disk for APIs that need a real file path.
+
+        Files go to a private per-user directory keyed on the archive's
+        content hash. A file left there by an earlier run is reused only if
+        its content matches the entry; otherwise it is overwritten.
+
+        Returns:
+            str: The path of the extracted file.
+
+        Raises:
+            KeyError: If the entry does not exist.
+        """
+        if name in self._extracted:
+            return self._extracted[name]
+
+        data = self.read(name)
+        if self._extract_dir is None:
+            self._extract_dir = _extraction_root() / self.digest
+        target = self._extract_dir / name
+        try:
+            matches = target.read_bytes() == data
+        except OSError:
+            matches = False
+        if not matches:
+            target.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            staging = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+            staging.write_bytes(data)
+            os.replace(staging, target)
+
+        self._extracted[name] = str(target)
+        return str(target)
+
+    def close(self):
+        """
+        Unmaps the archive. If views returned by read() are still alive the
+        mapping stays open and is released with the process.
+        """
+        if self._mmap.closed:
+            return
+        try:
+            self._view.release()
+            self._mmap.close()
+        except BufferError:
+            pass
+
+
+def find_resource_packs(directory: Union[str, Path]) -> list:
+    """
+    Returns the resource packs in a directory, highest precedence first.
+    Packs are named '<order>-<profile>.qpak' so later profiles win.
+    """
+    directory = Path(directory)
+    if not directory.is_dir():
+        return []
+    return sorted(directory.glob(f'*{PACK_SUFFIX}'), reverse=True)
+
+
+def merge_resource_packs(pack_paths: Iterable[Union[str, Path]], merged_path: Union[str, Path]) -> int:
+    """
+    Rewrites several resource packs as one whose index shares identical
+    entries across them. Only the entry that wins for each name, the one
+    from the highest precedence pack, is kept, exactly as FileLocator would
+    resolve it. Entry data is copied as stored, without recompressing.
+
+    Args:
+        pack_paths (Iterable[str | Path]): The packs, highest precedence first.
+        merged_path (str | Path): The merged archive. The source packs are
+            not removed.
+
+    Returns:
+        int: The number of bytes of entry data saved.
+    """
+    packs = [ResourcePack(p) for p in pack_paths]
+    try:
+        winners = {}
+        for pack in reversed(packs):
+            for name in pack.names():
+                winners[name] = pack
+        source_bytes = sum(
+            size for pack in packs for _, size, _, _ in {tuple(e) for e in pack._entries.values()}
+        )
+
+        entries = {}
+        stored = {}
+        content = hashlib.sha256()
+        staging = Path(f"{merged_path}.{os.getpid()}.tmp")
+        with open(staging, 'wb') as out:
+            out.write(b'\0' * _HEADER.size)
+            offset = _HEADER.size
+            for name in sorted(winners):
+                source_offset, size, raw_size, compression = winners[name]._entries[name]
+                with winners[name]._view[source_offset:source_offset + size] as data:
+                    digest = hashlib.sha256(data).digest()
+                    content.update(name.encode('utf-8') + b'\0' + digest)
+                    if digest in stored:
+                        entries[name] = list(stored[digest])
+                        continue
+                    start = _aligned(offset)
+                    out.write(b'\0' * (start - offset))
+                    out.write(data)
+                offset = start + size
+                entries[name] = stored[digest] = [start, size, raw_size, compression]
+
+            index = json.dumps(
+                {'entries': entries, 'digest': content.hexdigest()}, separators=(',', ':')
+            ).encode('utf-8')
+            out.write(index)
+            out.seek(0)
+            out.write(_HEADER.pack(PACK_MAGIC, offset, len(index)))
+    finally:
+        for pack in packs:
+            pack.close()
+
+    os.replace(staging, merged_path)
+    return source_bytes - sum(size for _, size, _, _ in stored.values())
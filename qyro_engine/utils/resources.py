@@ -1,5 +1,7 @@
+import atexit
 from pathlib import Path
 from qyro._exceptions import EngineError
+from qyro_engine.utils.resource_pack import ResourcePack, find_resource_packs
 
 class FileLocator:
     """
@@ -15,6 +17,23 @@ class FileLocator:
         """
         # Convert all to Path objects
         self.directories = [Path(d) for d in directories]
+        # Packed resources take precedence over loose files, highest profile first
+        self.packs = [ResourcePack(p) for d in self.directories for p in find_resource_packs(d)]
+        if self.packs:
+            atexit.register(self.close)
+
+    def close(self):
+        """
+        Closes the resource packs.
+        """
+        for pack in self.packs:
+            pack.close()
+
+    def _find_pack(self, name):
+        for pack in self.packs:
+            if name in pack:
+                return pack
+        return None
 
     def find(self, *relative_parts):
         """
@@ -30,9 +49,30 @@ class FileLocator:
             FileNotFoundError: If the file cannot be found in any base directory.
         """
         target_path = Path(*relative_parts)
+        pack = self._find_pack(target_path.as_posix())
+        if pack is not None:
+            return pack.extract(target_path.as_posix())
+
         for base in self.directories:
             candidate = base / target_path
             if candidate.exists():
                 return str(candidate.resolve())
 
         raise EngineError(f"Cannot find file: {target_path}")
+
+    def read(self, *relative_parts):
+        """
+        Read the contents of a resource.
+
+        Args:
+            *relative_parts: Components of the file's relative path.
+
+        Returns:
+            memoryview | bytes: A zero-copy view when the resource is stored
+            uncompressed in a resource pack, bytes otherwise.
+        """
+        target_path = Path(*relative_parts)
+        pack = self._find_pack(target_path.as_posix())
+        if pack is not None:
+            return pack.read(target_path.as_posix())
+        return Path(self.find(*relative_parts)).read_bytes()
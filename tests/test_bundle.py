@@ -0,0 +1,66 @@
+import os
+import sys
+import builtins
+import symtable
+import zipfile
+from qyro.pipelines.bundle import render_launcher
+
+
+def _render(**overrides):
+    arguments = dict(app_name='App', build_id='0123456789abcdef', executable='App', executable_size=3)
+    arguments.update(overrides)
+    return render_launcher(**arguments)
+
+
+def _unresolved_globals(source):
+    namespace = {'__name__': 'launcher'}
+    exec(compile(source, 'launcher.py', 'exec'), namespace)
+    missing = set()
+    tables = [symtable.symtable(source, 'launcher.py', 'exec')]
+    while tables:
+        table = tables.pop()
+        tables.extend(table.get_children())
+        if table.get_type() != 'function':
+            continue
+        for symbol in table.get_symbols():
+            name = symbol.get_name()
+            if symbol.is_global() and symbol.is_referenced() and name not in namespace and not hasattr(builtins, name):
+                missing.add(name)
+    return missing
+
+
+def test_launcher_compiles():
+    compile(_render(), 'launcher.py', 'exec')
+
+
+def test_launcher_resolves_every_global():
+    # A missing import only fails at run time on the platform that uses it
+    assert _unresolved_globals(_render()) == set()
+
+
+def test_unresolved_global_is_detected():
+    assert _unresolved_globals(_render().replace('import subprocess\n', '')) == {'subprocess'}
+
+
+def test_launcher_does_not_run_on_import():
+    namespace = {'__name__': 'launcher'}
+    exec(compile(_render(), 'launcher.py', 'exec'), namespace)
+    assert namespace['BUILD_ID'] == '0123456789abcdef'
+    assert namespace['KEEP_VERSIONS'] == 2
+
+
+def test_launcher_extracts_the_payload(tmp_path, monkeypatch):
+    payload = tmp_path / 'bundle.bin'
+    with zipfile.ZipFile(payload, 'w') as archive:
+        archive.writestr('App', 'abc')
+        archive.writestr('lib/data.txt', 'data')
+
+    namespace = {'__name__': 'launcher'}
+    exec(compile(_render(), 'launcher.py', 'exec'), namespace)
+    monkeypatch.setattr(sys, 'executable', str(payload))
+    target = str(tmp_path / 'cache' / 'build')
+    namespace['_extract'](target)
+
+    assert namespace['_is_valid'](target)
+    with open(os.path.join(target, 'lib', 'data.txt')) as f:
+        assert f.read() == 'data'
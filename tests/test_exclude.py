@@ -0,0 +1,90 @@
+import os
+import pytest
+from qyro.utils.exclude import ExcludeMatcher, walk_files
+
+
+@pytest.mark.parametrize('patterns, path, is_dir, excluded', [
+    # A bare name matches at any depth
+    (['*.pyc'], 'a.pyc', False, True),
+    (['*.pyc'], 'pkg/sub/a.pyc', False, True),
+    (['*.pyc'], 'a.py', False, False),
+    (['build'], 'src/build', True, True),
+    (['build'], 'src/build', False, True),
+    # A trailing slash matches directories only
+    (['build/'], 'src/build', False, False),
+    (['build/'], 'src/build', True, True),
+    # A slash elsewhere anchors the pattern to the root
+    (['docs/api'], 'docs/api', True, True),
+    (['docs/api'], 'src/docs/api', True, False),
+    (['/docs'], 'docs', True, True),
+    (['/docs'], 'src/docs', True, False),
+    # '?' and '[...]' match within one segment
+    (['file?.txt'], 'file1.txt', False, True),
+    (['file?.txt'], 'file10.txt', False, False),
+    (['[ab].txt'], 'b.txt', False, True),
+    (['[ab].txt'], 'c.txt', False, False),
+    (['*.txt'], 'dir/x/y.txt', False, True),
+    # '**' matches any number of segments, including none
+    (['a/**/b'], 'a/b', True, True),
+    (['a/**/b'], 'a/x/y/b', True, True),
+    (['a/**/b'], 'c/a/b', True, False),
+    (['logs/**'], 'logs/2024/app.log', False, True),
+    # The last matching pattern wins
+    (['*.log', '!keep.log'], 'keep.log', False, False),
+    (['*.log', '!keep.log'], 'drop.log', False, True),
+    (['!keep.log', '*.log'], 'keep.log', False, True),
+    # Files in an excluded directory cannot be re-included
+    (['cache/', '!cache/keep.txt'], 'cache/keep.txt', False, True),
+    # Comments and blank lines are ignored
+    (['# *.py', '', '   '], 'a.py', False, False),
+])
+def test_matching_rules(patterns, path, is_dir, excluded):
+    assert ExcludeMatcher(patterns).matches(path, is_dir) is excluded
+
+
+def test_parents_exclude_their_contents():
+    matcher = ExcludeMatcher(['node_modules/'])
+    assert matcher.matches('web/node_modules/pkg/index.js')
+    assert not matcher.match_parts(['web', 'node_modules', 'pkg', 'index.js'])
+
+
+def test_os_separators_are_accepted():
+    assert ExcludeMatcher(['docs/api']).matches(os.path.join('docs', 'api', 'x.md'))
+
+
+def test_empty_matcher_excludes_nothing():
+    matcher = ExcludeMatcher()
+    assert not matcher
+    assert not matcher.matches('anything')
+
+
+def _tree(root, files):
+    for rel_path in files:
+        target = root.joinpath(*rel_path.split('/'))
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(rel_path)
+
+
+def test_walk_prunes_excluded_directories(tmp_path):
+    _tree(tmp_path, ['b.txt', 'a/z.txt', 'a/y.pyc', 'build/out.txt', 'c/build/keep.txt', 'c/d.txt'])
+    walked = [rel for _, rel in walk_files(str(tmp_path), ExcludeMatcher(['*.pyc', '/build/']))]
+    # Each directory yields its files first, then its subdirectories, both sorted
+    assert walked == ['b.txt', 'a/z.txt', 'c/d.txt', 'c/build/keep.txt']
+
+
+def test_walk_leaves_out_skipped_paths(tmp_path):
+    _tree(tmp_path, ['a.txt', 'skip/b.txt', 'c.txt'])
+    walked = [rel for _, rel in walk_files(str(tmp_path), skip=[str(tmp_path / 'skip'), str(tmp_path / 'c.txt')])]
+    assert walked == ['a.txt']
+
+
+@pytest.mark.skipif(not hasattr(os, 'symlink'), reason='needs symlinks')
+def test_walk_does_not_follow_symlinked_directories(tmp_path):
+    _tree(tmp_path, ['sub/a.txt'])
+    try:
+        os.symlink(tmp_path, tmp_path / 'sub' / 'loop', target_is_directory=True)
+        os.symlink(tmp_path / 'sub' / 'a.txt', tmp_path / 'link.txt')
+    except OSError:
+        pytest.skip('symlinks are not permitted')
+    walked = [rel for _, rel in walk_files(str(tmp_path))]
+    assert walked == ['link.txt', 'sub/a.txt']
@@ -0,0 +1,36 @@
+import os
+import pytest
+from qyro.pipelines.icons import generate_icons, ICON_SIZES
+
+Image = pytest.importorskip('PIL.Image')
+
+
+@pytest.fixture
+def master(tmp_path):
+    source = tmp_path / 'master.png'
+    Image.new('RGBA', (1024, 768), (200, 30, 30, 255)).save(source)
+    return str(source)
+
+
+def test_generates_every_size(tmp_path, master):
+    output_dir = generate_icons(master, str(tmp_path / 'cache'))
+    for profile, sizes in ICON_SIZES.items():
+        for size in sizes:
+            with Image.open(os.path.join(output_dir, profile, f'{size}.png')) as png:
+                assert png.size == (size, size)
+    with Image.open(os.path.join(output_dir, 'Icon.ico')) as ico:
+        assert (256, 256) in ico.info['sizes']
+    with Image.open(os.path.join(output_dir, 'Icon.icns')) as icns:
+        assert icns.format == 'ICNS'
+        # 1024px is stored as the @2x variant of 512px
+        assert (512, 512, 2) in icns.info['sizes']
+
+
+def test_reuses_the_cached_set(tmp_path, master):
+    cache_root = str(tmp_path / 'cache')
+    first = generate_icons(master, cache_root)
+    marker = os.path.join(first, 'Icon.ico')
+    mtime = os.path.getmtime(marker)
+    assert generate_icons(master, cache_root) == first
+    assert os.path.getmtime(marker) == mtime
+    assert not os.path.exists(first + '.tmp')
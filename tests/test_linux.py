@@ -0,0 +1,54 @@
+import io
+import shutil
+import tarfile
+import collections
+from pathlib import Path
+import pytest
+from qyro._store import QYRO_INTERNAL_STATE
+from qyro.pipelines.linux import write_app_tree, _compression_for
+
+BOILERPLATE_ICONS = Path(__file__).parent.parent / 'qyro' / 'cli_commands' / 'templates' / 'boilerplate' / 'src' / 'main' / 'icons'
+
+
+@pytest.fixture
+def project(tmp_path):
+    shutil.copytree(BOILERPLATE_ICONS, tmp_path / 'src' / 'main' / 'icons')
+    (tmp_path / 'target' / 'App').mkdir(parents=True)
+    (tmp_path / 'target' / 'App' / 'App').write_text('app')
+    doc_dir = tmp_path / 'src' / 'installer' / 'linux' / 'usr' / 'share' / 'doc'
+    doc_dir.mkdir(parents=True)
+    (doc_dir / 'README').write_text('readme')
+    previous = QYRO_INTERNAL_STATE.get_config('settings')
+    QYRO_INTERNAL_STATE.set_config('settings', {
+        'project_dir': str(tmp_path), 'app_name': 'My App', 'freeze_dir': 'target/App', 'files_to_filter': []
+    })
+    yield tmp_path
+    QYRO_INTERNAL_STATE.set_config('settings', previous)
+
+
+def _members(prefix=''):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode='w') as tar:
+        write_app_tree(tar, prefix)
+    buffer.seek(0)
+    return tarfile.open(fileobj=buffer)
+
+
+def test_compression_follows_the_installer_name():
+    assert _compression_for('App.pkg.tar.zst', 'xz') == 'zstd'
+    assert _compression_for('App.pkg.tar.xz', 'zstd') == 'xz'
+    assert _compression_for('App.pkg.tar', 'zstd') == 'zstd'
+
+
+@pytest.mark.parametrize('prefix', ['', './'])
+def test_every_member_is_written_once(project, prefix):
+    names = _members(prefix).getnames()
+    assert [name for name, count in collections.Counter(names).items() if count > 1] == []
+    assert f'{prefix}usr/share/doc/README' in names
+
+
+def test_desktop_entry_uses_the_hicolor_icon(project):
+    tar = _members()
+    assert 'usr/share/icons/hicolor/256x256/apps/my-app.png' in tar.getnames()
+    entry = tar.extractfile('usr/share/applications/My App.desktop').read().decode()
+    assert 'Icon=my-app\n' in entry
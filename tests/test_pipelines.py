@@ -0,0 +1,36 @@
+import pytest
+from qyro._exceptions import EngineError
+from qyro._store import QYRO_INTERNAL_STATE
+from qyro.pipelines import check_sources_compile, _optimize_arguments
+
+
+@pytest.fixture
+def sources(tmp_path):
+    source_dir = tmp_path / 'src' / 'main' / 'python'
+    source_dir.mkdir(parents=True)
+    (source_dir / 'main.py').write_text('print("hello")\n')
+    previous = QYRO_INTERNAL_STATE.get_config('settings')
+    QYRO_INTERNAL_STATE.set_config('settings', {'project_dir': str(tmp_path)})
+    yield source_dir
+    QYRO_INTERNAL_STATE.set_config('settings', previous)
+
+
+def test_check_leaves_no_bytecode_behind(sources):
+    check_sources_compile(optimize=2, workers=1)
+    assert sorted(p.name for p in sources.parent.parent.parent.rglob('*')) == ['main', 'main.py', 'python', 'src']
+
+
+def test_check_reports_syntax_errors(sources):
+    (sources / 'broken.py').write_text('def broken(:\n')
+    with pytest.raises(EngineError):
+        check_sources_compile(workers=1)
+
+
+def test_check_rejects_unknown_optimization_levels(sources):
+    with pytest.raises(EngineError):
+        check_sources_compile(optimize=3)
+
+
+def test_optimize_arguments():
+    assert _optimize_arguments(0) == []
+    assert _optimize_arguments(2) == ['--optimize', '2']
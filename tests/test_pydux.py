@@ -0,0 +1,131 @@
+import pytest
+from pydantic import BaseModel
+from qyro_engine.store import Pydux
+from qyro_engine.store.observers import ObserverRegistry
+
+
+class Recorder:
+    def __init__(self):
+        self.calls = []
+
+    def on_store_change(self, store, changes=None):
+        self.calls.append(changes)
+
+
+class User(BaseModel):
+    name: str = ''
+    tags: list = []
+
+
+@pytest.fixture
+def store(monkeypatch):
+    for name, value in {
+        '_store': {}, '_schema': None, '_field_validators': {}, '_observers': ObserverRegistry(),
+        '_path_index': {}, '_callable_subscriptions': [], '_transaction': None, '_snapshot': None,
+        '_snapshot_source': None, '_snapshot_parts': {}, '_history': None,
+        '_persistence': None,
+    }.items():
+        monkeypatch.setattr(Pydux, name, value)
+    return Pydux()
+
+
+@pytest.fixture
+def recorder(store):
+    observer = Recorder()
+    store.subscribe_to_store(observer)
+    return observer
+
+
+def test_observers_get_the_changed_keys(store, recorder):
+    store.update_store({'count': 1, 'name': 'a'})
+    store.update_store({'count': 2, 'name': 'a'})
+    store.remove_from_store('name')
+    assert recorder.calls == [{'count', 'name'}, {'count'}, {'name'}]
+
+
+def test_equal_values_do_not_notify(store, recorder):
+    store.update_store({'count': 1, 'todos': ['a']})
+    store.update_store({'count': 1})
+    store.update_store({'todos': ['a']})
+    assert recorder.calls == [{'count', 'todos'}]
+
+
+def test_a_container_modified_in_place_notifies(store, recorder):
+    todos = []
+    store.update_store({'todos': todos})
+    todos.append('write tests')
+    store.update_store({'todos': todos})
+    assert recorder.calls == [{'todos'}, {'todos'}]
+
+
+def test_a_path_subscription_sees_in_place_changes(store):
+    todos, other = [], Recorder()
+    store.update_store({'todos': todos, 'count': 0})
+    store.subscribe(other, 'todos')
+    store.update_store({'count': 1})
+    todos.append('write tests')
+    store.update_store({'todos': todos})
+    assert other.calls == [{'todos'}]
+
+
+def test_selector_subscriptions_only_hear_about_their_value(store):
+    store.set_schema({'user': User, 'count': int})
+    names, counts = Recorder(), Recorder()
+    store.subscribe(names, 'user.name')
+    store.subscribe(counts, lambda model: model.count)
+    store.update_nested_model('user', {'name': 'Ann'})
+    store.update_store({'count': 3})
+    store.update_nested_model('user', {'name': 'Ann'})
+    assert names.calls == [{'user', 'user.name'}]
+    assert counts.calls == [{'count'}]
+
+
+def test_a_batch_notifies_once(store, recorder):
+    with store.batch():
+        store.update_store({'count': 1})
+        store.update_store({'name': 'a'})
+    assert recorder.calls == [{'count', 'name'}]
+
+
+def test_a_failed_batch_changes_nothing(store, recorder):
+    store.set_schema({'count': int})
+    with pytest.raises(TypeError):
+        with store.batch():
+            store.update_store({'count': 1})
+            store.update_store({'count': 'many'})
+    assert store.view['count'] == 0
+    assert recorder.calls == []
+
+
+def test_observers_without_a_changes_argument(store):
+    calls = []
+
+    class Legacy:
+        def on_store_change(self, state):
+            calls.append(dict(state))
+
+    observer = Legacy()
+    store.subscribe_to_store(observer)
+    store.update_store({'count': 1})
+    assert calls == [{'count': 1}]
+
+
+def test_get_nested_returns_read_only_values_from_the_view(store):
+    store.set_schema({'user': User})
+    store.update_store({'user': {'name': 'Ann', 'tags': ['x']}})
+    user = store.get_nested('user')
+    assert user['name'] == 'Ann' and store.get_nested('user.tags') == ('x',)
+    assert user is store.view['user'] and store.get_nested('user') is user
+    with pytest.raises(TypeError):
+        user['name'] = 'Bob'
+    assert store.get_nested('user.missing') is None
+
+
+def test_view_follows_a_nested_model_modified_in_place(store):
+    store.set_schema({'user': User})
+    user = User(name='Ann')
+    store.update_store({'user': user})
+    assert store.view['user']['name'] == 'Ann'
+    user.name = 'Bob'
+    store.update_store({'user': user})
+    assert store.get_nested('user.name') == 'Bob'
@@ -0,0 +1,17 @@
+import os
+from qyro.pipelines import CONTENT_STORE_ENV
+from qyro.pipelines.workspace import _member_env, schedule
+
+
+def test_members_get_their_own_pyinstaller_cache(tmp_path):
+    env = {CONTENT_STORE_ENV: str(tmp_path / 'cas')}
+    editor = _member_env(str(tmp_path / 'editor'), env)
+    viewer = _member_env(str(tmp_path / 'viewer'), env)
+    assert editor['PYINSTALLER_CONFIG_DIR'] == os.path.join(str(tmp_path / 'editor'), 'target', '.cache', 'pyinstaller')
+    assert editor['PYINSTALLER_CONFIG_DIR'] != viewer['PYINSTALLER_CONFIG_DIR']
+    assert editor[CONTENT_STORE_ENV] == viewer[CONTENT_STORE_ENV]
+    assert 'PYINSTALLER_CONFIG_DIR' not in env
+
+
+def test_schedule_runs_the_longest_build_first():
+    assert schedule(['a', 'b', 'c'], {'a': 1.0, 'b': 5.0}) == ['b', 'c', 'a']